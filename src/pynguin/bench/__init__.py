@@ -0,0 +1,16 @@
+"""Benchmarks of the pynguin package.
+
+Each module of this package measures one part of pynguin and can be run on its
+own, for example:
+
+    python -m pynguin.bench.boxlayout
+
+The benchmarks need no display: the module blit uses the dummy video driver
+of SDL, its display is a surface in memory.
+
+The package itself runs the layout benchmarks of the module layout, writes
+their results as JSON and compares them with a stored baseline:
+
+    python -m pynguin.bench --baseline
+
+"""
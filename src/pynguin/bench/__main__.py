@@ -0,0 +1,149 @@
+#! /usr/bin/python
+"""Run the layout benchmarks and compare them with a stored baseline.
+
+Created on Oct 18, 2026
+
+@author: Niriel
+
+Examples:
+
+    python -m pynguin.bench                      # Print the results as JSON.
+    python -m pynguin.bench --save-baseline      # Store them as the baseline.
+    python -m pynguin.bench --baseline           # Fail if slower than stored.
+    python -m pynguin.bench --scale 0.1 --tree grid --output grid.json
+
+The results hold the durations in seconds and the duration of a calibration
+loop of plain Python (see layout.Calibrate).  The comparison with the baseline
+divides the durations by the calibration of their own run, so that a baseline
+made on another machine, or on a busy one, stays meaningful.
+
+The exit status is 1 when at least one duration is slower than the baseline by
+more than the threshold, every time: the trees that look slower are timed
+again --retries times, and only the durations that stay slower are reported.
+No display is needed.  Importing pygame may print a greeting on stdout: use
+--output to get a clean JSON file.
+
+"""
+
+import os
+# Nothing is drawn, but pynguin imports pygame: never open a window.
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import argparse
+import json
+import sys
+from pynguin.bench import layout
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             'baseline.json')
+
+
+def _ParseArgs(argv):
+    """Return the options read from the command line."""
+    parser = argparse.ArgumentParser(prog='python -m pynguin.bench',
+                                     description=__doc__.split('\n')[0])
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help='multiply the size of the trees (default 1)')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='number of series, the best is kept (default 5)')
+    parser.add_argument('--number', type=int, default=10,
+                        help='number of runs per series (default 10)')
+    parser.add_argument('--tree', action='append', dest='trees',
+                        choices=sorted(layout.TREES),
+                        help='time only this tree, can be repeated')
+    parser.add_argument('--output', metavar='FILE',
+                        help='write the JSON results to FILE, not stdout')
+    parser.add_argument('--baseline', metavar='FILE', nargs='?',
+                        const=BASELINE_PATH,
+                        help='compare with this baseline (default: the one '
+                             'stored in the package)')
+    parser.add_argument('--save-baseline', metavar='FILE', nargs='?',
+                        const=BASELINE_PATH,
+                        help='store the results as a baseline (default: the '
+                             'one stored in the package)')
+    # Even relative to the calibration, timings vary by 10-20% from one run
+    # to the next on a busy machine.
+    parser.add_argument('--threshold', type=float, default=0.3,
+                        help='tolerated slowdown, 0.3 (default) means 30%%')
+    parser.add_argument('--retries', type=int, default=2,
+                        help='times a slower tree is timed again before it '
+                             'is reported (default 2)')
+    return parser.parse_args(argv)
+
+
+def _WriteJson(data, path):
+    """Write data as JSON in the file path, or on stdout if path is None."""
+    text = json.dumps(data, indent=2, sort_keys=True)
+    if path is None:
+        print text
+    else:
+        with open(path, 'w') as json_file:
+            json_file.write(text + '\n')
+
+
+def _Bench(options, names):
+    """Return the results of the trees names, and their calibration."""
+    # Calibrated before and after: the best of both is the least disturbed.
+    calibration = layout.Calibrate(options.repeat, options.number)
+    trees = layout.BenchAll(options.scale, options.repeat, options.number,
+                            names)
+    calibration = min(calibration,
+                      layout.Calibrate(options.repeat, options.number))
+    return {'scale': options.scale, 'calibration': calibration,
+            'trees': trees}
+
+
+def _Compare(data, baseline, options):
+    """Return the regressions of data against baseline that persist.
+
+    The trees slower than the baseline are timed again, up to
+    options.retries times.  Each duration keeps its best normalized value.
+
+    """
+    old = layout.Normalize(baseline['trees'], baseline['calibration'])
+    new = layout.Normalize(data['trees'], data['calibration'])
+    regressions = layout.FindRegressions(new, old, options.threshold)
+    for unused in xrange(options.retries):
+        if not regressions:
+            break
+        names = sorted(set(tree_name for tree_name, unused, unused, unused
+                           in regressions))
+        retry = _Bench(options, names)
+        retry = layout.Normalize(retry['trees'], retry['calibration'])
+        for tree_name in names:
+            for name in ('full', 'leaf', 'resize'):
+                new[tree_name][name] = min(new[tree_name][name],
+                                           retry[tree_name][name])
+        regressions = layout.FindRegressions(new, old, options.threshold)
+    return regressions
+
+
+def main(argv=None):
+    """Run the benchmarks and return the exit status."""
+    options = _ParseArgs(argv)
+    data = _Bench(options, options.trees)
+    _WriteJson(data, options.output)
+    if options.save_baseline:
+        _WriteJson(data, options.save_baseline)
+    if options.baseline:
+        with open(options.baseline) as json_file:
+            baseline = json.load(json_file)
+        if baseline['scale'] != options.scale:
+            sys.stderr.write("The baseline was made with --scale %s.\n" %
+                             baseline['scale'])
+            return 2
+        if 'calibration' not in baseline:
+            sys.stderr.write("The baseline has no calibration, save it "
+                             "again with --save-baseline.\n")
+            return 2
+        regressions = _Compare(data, baseline, options)
+        for tree_name, name, old, new in regressions:
+            sys.stderr.write("Regression: %s %s %.1f -> %.1f calibrations\n"
+                             % (tree_name, name, old, new))
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
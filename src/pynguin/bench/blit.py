@@ -0,0 +1,146 @@
+#! /usr/bin/python
+"""Measure the blits of a full screen of sprites, per pixel format.
+
+Created on Oct 18, 2026
+
+@author: Niriel
+
+A screen holds windows, the windows hold buttons and translucent labels.
+Redrawing the tree fills the backgrounds and blits each sprite on its window,
+then each window on the screen.  The sprites are not drawn again: only the
+blits are timed.
+
+The same tree is timed with its images in three formats:
+
+* 'display': created by sprite.displayformat, as the sprites do.
+* 'default': created by pygame.Surface with only SURFACE_FLAGS, as the
+  sprites did before.
+* 'mismatched': a format the display does not have, 24 bits per pixel or
+  ABGR for the translucent sprites.
+
+The benchmark uses the dummy video driver: the display is a surface in
+memory, of 32 bits per pixel unless another depth is given.
+
+"""
+
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import sys
+import timeit
+import pygame
+from pynguin.sprite import ButtonSprite
+from pynguin.sprite import GuiSprite
+from pynguin.sprite import ScreenSprite
+from pynguin.sprite import WindowSprite
+from pynguin.sprite.displayformat import CreateSurface
+
+__all__ = ['FORMATS', 'MakeScreen', 'BenchBlit']
+
+
+class _Translucent(GuiSprite):
+    """A sprite with per-pixel alpha, like a label."""
+    SURFACE_FLAGS = pygame.SRCALPHA
+    BG_COLOR = (0, 0, 0, 128)
+
+
+def _Default(size, flags):
+    """Return a surface created like the sprites used to."""
+    # pylint: disable-msg=E1123
+    return pygame.Surface(size, flags=flags)
+
+
+def _Mismatched(size, flags):
+    """Return a surface in a format different from the display."""
+    # pylint: disable-msg=E1121
+    if flags & pygame.SRCALPHA:
+        return pygame.Surface(size, pygame.SRCALPHA, 32,
+                              (0xff, 0xff00, 0xff0000, 0xff000000))
+    return pygame.Surface(size, 0, 24)
+
+FORMATS = {'display': CreateSurface,
+           'default': _Default,
+           'mismatched': _Mismatched}
+
+
+def MakeScreen(windows_nb=4, sprites_nb=100):
+    """Return a ScreenSprite of windows_nb windows holding sprites_nb sprites.
+
+    A third of the sprites are translucent.  The windows share the display in
+    columns, the sprites are placed in a grid inside their window.
+
+    """
+    screen = ScreenSprite()
+    screen.update()
+    width, height = screen.rect.size
+    window_width = width // windows_nb
+    columns = 10
+    rows = -(-sprites_nb // columns)
+    for window_index in xrange(windows_nb):
+        window = WindowSprite()
+        window.rect = pygame.Rect(window_index * window_width, 0,
+                                  window_width, height)
+        cell_width = window_width // columns
+        cell_height = height // rows
+        for index in xrange(sprites_nb):
+            sprite = _Translucent() if index % 3 == 0 else ButtonSprite()
+            sprite.rect = pygame.Rect((index % columns) * cell_width,
+                                      (index // columns) * cell_height,
+                                      cell_width - 2, cell_height - 2)
+            window.addSprite(sprite, 0)
+        screen.addSprite(window, 0)
+    screen.update()
+    return screen
+
+
+def _SetFormat(screen, make_surface):
+    """Give all the windows and sprites of screen images made by make_surface.
+    """
+    for window in screen._sprites_group:
+        for sprite in list(window._sprites_group) + [window]:
+            image = make_surface(sprite.rect.size, sprite.SURFACE_FLAGS)
+            sprite.image = sprite.drawable_image = image
+            sprite._draw()
+
+
+def _Redraw(screen):
+    """Redraw the windows and the screen, without drawing the sprites."""
+    for window in screen._sprites_group:
+        WindowSprite._draw(window)
+    WindowSprite._draw(screen)
+
+
+def BenchBlit(windows_nb=4, sprites_nb=100, repeat=5, number=10):
+    """Return the best duration in seconds of a redrawing, per format.
+
+    The result is a dict {format name: seconds}, see FORMATS.
+
+    """
+    screen = MakeScreen(windows_nb, sprites_nb)
+    results = {}
+    for name, make_surface in FORMATS.iteritems():
+        _SetFormat(screen, make_surface)
+        results[name] = min(timeit.repeat(lambda: _Redraw(screen),
+                                          number=number,
+                                          repeat=repeat)) / number
+    return results
+
+
+def main(argv=None):
+    """Print the durations for a display of the depth given, 32 by default.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    depth = int(argv[0]) if argv else 32
+    pygame.display.init()
+    pygame.display.set_mode((1024, 768), 0, depth)
+    print "Display 1024x768, %i bits per pixel." % depth
+    for windows_nb, sprites_nb in ((1, 30), (4, 100), (8, 300)):
+        results = BenchBlit(windows_nb, sprites_nb)
+        line = ", ".join("%s %7.2f ms" % (name, results[name] * 1000)
+                         for name in ('display', 'default', 'mismatched'))
+        print "%i windows of %3i sprites: %s" % (windows_nb, sprites_nb, line)
+    pygame.display.quit()
+
+
+if __name__ == "__main__":
+    main()
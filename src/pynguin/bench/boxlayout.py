@@ -0,0 +1,123 @@
+#! /usr/bin/python
+"""Compare the pure Python and the NumPy allocations of large boxes.
+
+Created on Oct 18, 2026
+
+@author: Niriel
+"""
+
+import sys
+import timeit
+from pynguin.layout import boxlayout
+from pynguin.layout.container import Container
+from pynguin.layout.size import Size
+from pynguin.layout.sizeable import Sizeable
+from pynguin.layout.parentable import Parentable
+
+__all__ = ['BenchBoxArithmetic', 'BenchBoxAllocation']
+
+
+class _Line(Sizeable, Parentable):
+    """A line of a log, of fixed size."""
+    def __init__(self, width, height):
+        Sizeable.__init__(self)
+        Parentable.__init__(self)
+        self.size = Size(width, height)
+    def _requestSize(self):
+        return self.size.copy()
+    def _allocateSize(self):
+        pass
+
+
+def _MakeBox(children_nb, threshold):
+    """Return a VBox of children_nb lines, requested and allocated once."""
+    box = Container()
+    box._layout = boxlayout.VBoxLayout(0, False)
+    box._layout.VECTORIZE_THRESHOLD = threshold
+    for i in xrange(children_nb):
+        line = _Line(100 + i % 50, 10 + i % 3)
+        line.can_expand_height = i % 2 == 0
+        box.addChild(line, 'end')
+    box.negotiateSize(True)
+    return box
+
+
+def BenchBoxArithmetic(children_nb=10000, repeat=5):
+    """Return the best duration in seconds of the box arithmetic alone.
+
+    Only the lengths and coords are computed, for a shrunk and an inflated
+    box.  No SizeAllocation is created and no child is allocated.
+
+    The result is a dict {'python': seconds, 'numpy': seconds}.  The 'numpy'
+    entry is None when NumPy is not installed.
+
+    """
+    lengths = [10 + i % 3 for i in xrange(children_nb)]
+    expandables = [i % 2 == 0 for i in xrange(children_nb)]
+    total = sum(lengths)
+    def Python():
+        boxlayout.ShrinkLengths(0, total // 2, lengths, 0, False)
+        boxlayout.InflateLengths(0, total * 2, lengths, expandables, 0,
+                                 False)
+    results = {'python': min(timeit.repeat(Python, number=1,
+                                           repeat=repeat)) / 2,
+               'numpy': None}
+    numpy = boxlayout.numpy
+    if numpy is not None:
+        lengths = numpy.array(lengths, numpy.int64)
+        expandables = numpy.array(expandables, numpy.bool_)
+        def Vectorized():
+            boxlayout._VectorShrinkLengths(0, total // 2, lengths, 0, False)
+            boxlayout._VectorInflateLengths(0, total * 2, lengths,
+                                            expandables, 0, False)
+        results['numpy'] = min(timeit.repeat(Vectorized, number=1,
+                                             repeat=repeat)) / 2
+    return results
+
+
+def BenchBoxAllocation(children_nb=10000, repeat=5):
+    """Return the best duration in seconds of an allocation of a big VBox.
+
+    The box is shrunk and inflated alternately so that every allocation
+    really recomputes all the children.  This includes the allocation of the
+    children themselves, which is the same for both paths.
+
+    The result is a dict {'python': seconds, 'numpy': seconds}.  The 'numpy'
+    entry is None when NumPy is not installed.
+
+    """
+    results = {'numpy': None}
+    paths = [('python', sys.maxint)]
+    if boxlayout.numpy is not None:
+        paths.append(('numpy', 0))
+    for name, threshold in paths:
+        box = _MakeBox(children_nb, threshold)
+        width, height = box.requested_size.asTuple()
+        sizes = [(width, height // 2), (width, height * 2)]
+        def Allocate():
+            for size in sizes:
+                box.resize(*size)
+        results[name] = min(timeit.repeat(Allocate, number=1,
+                                          repeat=repeat)) / len(sizes)
+    return results
+
+
+def _FormatResults(results):
+    """Return a line of text with the durations in milliseconds."""
+    line = "python %8.2f ms" % (results['python'] * 1000)
+    if results['numpy'] is not None:
+        line += ", numpy %8.2f ms" % (results['numpy'] * 1000)
+    return line
+
+
+def main():
+    """Print the durations for several numbers of children."""
+    for children_nb in (100, 1000, 10000):
+        print "%6i children, arithmetic: %s" % \
+              (children_nb, _FormatResults(BenchBoxArithmetic(children_nb)))
+        print "%6i children, allocation: %s" % \
+              (children_nb, _FormatResults(BenchBoxAllocation(children_nb)))
+
+
+if __name__ == "__main__":
+    main()
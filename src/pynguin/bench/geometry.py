@@ -0,0 +1,143 @@
+#! /usr/bin/python
+"""Compare the mutable and the frozen geometry types.
+
+Created on Oct 18, 2026
+
+@author: Niriel
+
+Run with:
+
+    python -m pynguin.bench.geometry
+
+"""
+
+import sys
+import timeit
+from pynguin.layout import size
+from pynguin.layout.boxlayout import HBoxLayout
+from pynguin.layout.boxlayout import VBoxLayout
+from pynguin.layout.container import Container
+from pynguin.layout.size import Size
+from pynguin.layout.sizeable import Sizeable
+from pynguin.layout.parentable import Parentable
+
+__all__ = ['MeasureObjects', 'BenchNegotiation', 'BenchAllocationObjects']
+
+
+class _Leaf(Sizeable, Parentable):
+    """A leaf of fixed size."""
+    def __init__(self, width, height):
+        Sizeable.__init__(self)
+        Parentable.__init__(self)
+        self.size = Size(width, height)
+    def _requestSize(self):
+        return self.size.copy()
+    def _allocateSize(self):
+        pass
+
+
+def _MakeTree(rows_nb, columns_nb):
+    """Return a VBox of rows_nb HBoxes of columns_nb leaves, and all nodes."""
+    root = Container()
+    root._layout = VBoxLayout(2, False)
+    nodes = [root]
+    for row in xrange(rows_nb):
+        hbox = Container()
+        hbox._layout = HBoxLayout(2, False)
+        root.addChild(hbox, 'end')
+        nodes.append(hbox)
+        for column in xrange(columns_nb):
+            leaf = _Leaf(10 + (row + column) % 7, 10 + row % 3)
+            hbox.addChild(leaf, 'end')
+            nodes.append(leaf)
+    return root, nodes
+
+
+def MeasureObjects(obj):
+    """Return the number of objects and bytes used by a geometry object.
+
+    The integers are not counted: they are shared by both representations.
+
+    """
+    objects_nb = 1
+    bytes_nb = sys.getsizeof(obj)
+    dict_ = getattr(obj, '__dict__', None)
+    if dict_ is not None:
+        objects_nb += 1
+        bytes_nb += sys.getsizeof(dict_)
+        for value in dict_.itervalues():
+            if isinstance(value, (size.Vector, size.FrozenVector)):
+                value_objects_nb, value_bytes_nb = MeasureObjects(value)
+                objects_nb += value_objects_nb
+                bytes_nb += value_bytes_nb
+    return objects_nb, bytes_nb
+
+
+def BenchNegotiation(rows_nb=100, columns_nb=100, repeat=3):
+    """Negotiate the size of a tree and measure the allocated sizes.
+
+    Return a dict:
+    * 'widgets': number of nodes in the tree,
+    * 'seconds': best duration of a full negotiation,
+    * 'frozen': (objects, bytes) per widget for the allocations stored now,
+    * 'mutable': (objects, bytes) per widget for the same allocations as
+      SizeAllocation objects, which is what was stored before.
+
+    """
+    root, nodes = _MakeTree(rows_nb, columns_nb)
+    def Negotiate():
+        root.requestSize(True)
+        for node in nodes:
+            node.invalidateAllocation()
+        root.negotiateSize(False)
+    seconds = min(timeit.repeat(Negotiate, number=1, repeat=repeat))
+    children = nodes[1:]
+    result = {'widgets': len(nodes), 'seconds': seconds}
+    for name, convert in (('frozen', lambda alloc: alloc.freeze()),
+                          ('mutable', lambda alloc: alloc.thaw())):
+        objects_nb = bytes_nb = 0
+        for node in children:
+            measure = MeasureObjects(convert(node.allocated_size))
+            objects_nb += measure[0]
+            bytes_nb += measure[1]
+        result[name] = (float(objects_nb) / len(children),
+                        float(bytes_nb) / len(children))
+    return result
+
+
+def BenchAllocationObjects(number=100000):
+    """Return the duration in seconds of what allocateSize does per child.
+
+    Before, each child received a new SizeAllocation and copied it.  Now it
+    receives a FrozenSizeAllocation and keeps it.  The result is a dict with
+    the keys 'mutable' and 'frozen'.
+
+    """
+    SizeAllocation = size.SizeAllocation
+    FrozenSizeAllocation = size.FrozenSizeAllocation
+    def Mutable():
+        SizeAllocation((1, 2), (3, 4)).copy()
+    def Frozen():
+        FrozenSizeAllocation((1, 2), (3, 4)).copy()
+    return {'mutable': min(timeit.repeat(Mutable, number=number, repeat=3)),
+            'frozen': min(timeit.repeat(Frozen, number=number, repeat=3))}
+
+
+def main():
+    """Print the results of the benchmarks."""
+    result = BenchNegotiation()
+    print "Full negotiation of %i widgets: %.1f ms" % \
+          (result['widgets'], result['seconds'] * 1000)
+    for name in ('mutable', 'frozen'):
+        objects_nb, bytes_nb = result[name]
+        print "  %-8s allocation: %.1f objects, %.0f bytes per widget" % \
+              (name, objects_nb, bytes_nb)
+    number = 100000
+    result = BenchAllocationObjects(number)
+    for name in ('mutable', 'frozen'):
+        print "Create and copy one %s allocation: %.2f us" % \
+              (name, result[name] / number * 1e6)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,317 @@
+#! /usr/bin/python
+"""Time the size negotiation of synthetic trees of widgets.
+
+Created on Oct 18, 2026
+
+@author: Niriel
+
+The trees are made of the real containers and layouts of pynguin.layout, and
+of leaves of fixed size.  Each tree is timed in three situations:
+
+* 'full': the whole tree requests its size and allocates it, from scratch,
+* 'leaf': one leaf changes its size and the tree negotiates again, which only
+  visits what the caches of the tree say is invalid,
+* 'resize': the root alone receives a new size.
+
+The durations depend on the machine and on its load.  Calibrate times a
+fixed loop of plain Python that does not use pynguin: dividing the durations
+by it with Normalize gives numbers that can be compared from one machine, or
+one run, to the next.
+
+Run all the benchmarks with:
+
+    python -m pynguin.bench
+
+"""
+
+import timeit
+from pynguin.layout.boxlayout import HBoxLayout
+from pynguin.layout.boxlayout import VBoxLayout
+from pynguin.layout.borderlayout import BorderLayout
+from pynguin.layout.windowlayout import WindowLayout
+from pynguin.layout.scrolllayout import ScrollLayout
+from pynguin.layout.gridlayout import GridLayout
+from pynguin.layout.container import Container
+from pynguin.layout.size import Size
+from pynguin.layout.size import SizeAllocation
+from pynguin.layout.sizeable import Sizeable
+from pynguin.layout.parentable import Parentable
+
+__all__ = ['Leaf', 'MakeChain', 'MakeWideBox', 'MakeGrid', 'MakeTable',
+           'MakeNested',
+           'TREES', 'BenchTree', 'BenchAll', 'Calibrate', 'Normalize',
+           'FindRegressions']
+
+
+class Leaf(Sizeable, Parentable):
+    """A widget of fixed size, without any content."""
+    def __init__(self, width, height):
+        Sizeable.__init__(self)
+        Parentable.__init__(self)
+        self.size = Size(width, height)
+
+    def setSize(self, width, height):
+        """Change the size of the leaf and invalidate its requested size."""
+        self.size = Size(width, height)
+        self.invalidateRequestedSize()
+
+    def _requestSize(self):
+        return self.size.copy()
+
+    def _allocateSize(self):
+        pass
+
+
+def _MakeContainer(layout, children):
+    """Return a new Container using layout and containing children."""
+    container = Container()
+    container._layout = layout
+    for child in children:
+        container.addChild(child, 'end')
+    return container
+
+
+def MakeChain(depth):
+    """Return a chain of depth VBoxes, each holding a leaf and the next box.
+
+    The leaf at the bottom of the chain is the one changed by the 'leaf'
+    benchmark: renegotiating means walking up the whole chain.
+
+    """
+    node = Leaf(20, 10)
+    for level in xrange(depth):
+        node = _MakeContainer(VBoxLayout(1, False),
+                              [Leaf(10 + level % 7, 10), node])
+    return node
+
+
+def MakeWideBox(children_nb, layout_class=HBoxLayout):
+    """Return one box of children_nb leaves of various sizes."""
+    return _MakeContainer(layout_class(2, False),
+                          [Leaf(10 + i % 13, 10 + i % 5)
+                           for i in xrange(children_nb)])
+
+
+def MakeGrid(rows_nb, columns_nb):
+    """Return a homogeneous VBox of rows_nb homogeneous HBoxes of leaves."""
+    return _MakeContainer(VBoxLayout(2, True),
+                          [_MakeContainer(HBoxLayout(2, True),
+                                          [Leaf(10 + (row + column) % 7,
+                                                10 + row % 3)
+                                           for column in xrange(columns_nb)])
+                           for row in xrange(rows_nb)])
+
+
+def MakeTable(rows_nb, columns_nb):
+    """Return a GridLayout of rows_nb rows and columns_nb columns of leaves."""
+    table = Container()
+    table._layout = GridLayout(2)
+    for row in xrange(rows_nb):
+        for column in xrange(columns_nb):
+            leaf = Leaf(10 + (row * column) % 23, 10 + row % 3)
+            table._layout.attach(leaf, row, column)
+            table.addChild(leaf, 'end')
+    return table
+
+
+def MakeNested(depth):
+    """Return depth levels of Border, Window and Scroll layouts.
+
+    Each level is a border containing a window containing a scroll containing
+    an HBox.  The HBox holds a few leaves and the next level.
+
+    """
+    node = Leaf(20, 10)
+    for level in xrange(depth):
+        hbox = _MakeContainer(HBoxLayout(1, False),
+                              [Leaf(10, 10 + level % 5), node, Leaf(5, 5)])
+        scroll = _MakeContainer(ScrollLayout(), [hbox])
+        window = _MakeContainer(WindowLayout(), [scroll])
+        node = _MakeContainer(BorderLayout((1, 2, 3, 4)), [window])
+    return node
+
+
+# Name: (function, arguments).  The integer arguments are multiplied by the
+# scale given to BenchAll.  The negotiation recurses through the tree: chains
+# much deeper than 150 containers exceed the default recursion limit of Python.
+TREES = {
+    'chain': (MakeChain, (100,)),
+    'wide_hbox': (MakeWideBox, (2000, HBoxLayout)),
+    'wide_vbox': (MakeWideBox, (2000, VBoxLayout)),
+    'grid': (MakeGrid, (40, 40)),
+    'table': (MakeTable, (200, 50)),
+    'nested': (MakeNested, (25,)),
+}
+
+
+def _IterTree(widget):
+    """Yield widget and all its descendants, depth first."""
+    yield widget
+    for child in getattr(widget, 'children', ()):
+        for descendant in _IterTree(child):
+            yield descendant
+
+
+def _DeepestLeaf(widget):
+    """Return the leaf found by always following the middle child.
+
+    The chains and the nested trees carry on through their middle child.
+
+    """
+    children = getattr(widget, 'children', ())
+    while children:
+        widget = children[len(children) // 2]
+        children = getattr(widget, 'children', ())
+    return widget
+
+
+def BenchTree(root, repeat=5, number=10):
+    """Time the negotiation of the size of the tree starting at root.
+
+    Parameters.
+    ===========
+
+    * root: a Sizeable, usually a Container.
+    * repeat, number: like in timeit.repeat.  The best of the repeat series is
+      kept, divided by number.
+
+    Return a dict with the keys 'widgets', 'full', 'leaf' and 'resize'.  The
+    durations are in seconds.
+
+    """
+    nodes = list(_IterTree(root))
+    leaf = _DeepestLeaf(root)
+    leaf_sizes = [leaf.size, leaf.size + Size(3, 2)]
+    root.requestSize(True)
+    root.allocateSize(SizeAllocation((0, 0), root.requested_size))
+    root_sizes = [root.requested_size + Size(40, 30),
+                  root.requested_size + Size(80, 60)]
+    def Full():
+        root.requestSize(True)
+        for node in nodes:
+            node.invalidateAllocation()
+        root.allocateSize(SizeAllocation((0, 0), root.requested_size))
+    def ChangeLeaf():
+        leaf_sizes.reverse()
+        leaf.setSize(*leaf_sizes[0].asTuple())
+        root.refreshRequestedSize()
+        root.allocateSize(SizeAllocation((0, 0), root.requested_size))
+    def Resize():
+        root_sizes.reverse()
+        root.resize(*root_sizes[0].asTuple())
+    result = {'widgets': len(nodes)}
+    for name, function in (('full', Full), ('leaf', ChangeLeaf),
+                           ('resize', Resize)):
+        result[name] = min(timeit.repeat(function, number=number,
+                                         repeat=repeat)) / number
+    return result
+
+
+def BenchAll(scale=1.0, repeat=5, number=10, names=None):
+    """Build and time the trees of TREES.
+
+    Parameters.
+    ===========
+
+    * scale: multiplies the sizes of the trees.  Use a small scale for a quick
+      check and a large one for stressing the layouts.
+    * repeat, number: see BenchTree.
+    * names: the names of the trees to time, all of them by default.
+
+    Return a dict {tree name: result of BenchTree}.
+
+    """
+    results = {}
+    for name in sorted(names or TREES):
+        function, args = TREES[name]
+        args = tuple(max(1, int(arg * scale)) if isinstance(arg, int) else arg
+                     for arg in args)
+        results[name] = BenchTree(function(*args), repeat, number)
+    return results
+
+
+class _Point(object):
+    """A small object, for the calibration loop."""
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    def add(self, other):
+        """Return a new _Point, the sum of self and other."""
+        return _Point(self.x + other.x, self.y + other.y)
+
+
+def _CalibrationLoop():
+    """Do what the layouts do most: create objects, call methods, iterate."""
+    points = [_Point(i, i % 7) for i in xrange(500)]
+    total = _Point(0, 0)
+    for point in points:
+        total = total.add(point)
+        if point.y > total.y % 5:
+            total.x -= 1
+    return total
+
+
+def Calibrate(repeat=5, number=10):
+    """Return the best duration in seconds of the calibration loop.
+
+    The loop uses no pynguin code: a regression in pynguin does not change
+    it, but a slower machine does.
+
+    """
+    return min(timeit.repeat(_CalibrationLoop, number=number,
+                             repeat=repeat)) / number
+
+
+def Normalize(results, calibration):
+    """Return a copy of results with the durations divided by calibration.
+
+    results is a dict returned by BenchAll, calibration a duration returned
+    by Calibrate.
+
+    >>> normalized = Normalize({'grid': {'widgets': 5, 'full': 0.5,
+    ...                                  'leaf': 0.1}}, 0.25)
+    >>> print sorted(normalized['grid'].items())
+    [('full', 2.0), ('leaf', 0.4), ('widgets', 5)]
+
+    """
+    normalized = {}
+    for tree_name, result in results.iteritems():
+        normalized[tree_name] = dict(result)
+        for name in ('full', 'leaf', 'resize'):
+            if name in result:
+                normalized[tree_name][name] = result[name] / calibration
+    return normalized
+
+
+def FindRegressions(results, baseline, threshold):
+    """Return the list of the durations that got worse than the baseline.
+
+    Parameters.
+    ===========
+
+    * results, baseline: dicts returned by BenchAll.  Normalize them first
+      when they come from different runs.
+    * threshold: a float, the relative slowdown tolerated.  0.25 means that a
+      duration may be up to 25% longer than in the baseline.
+
+    Only the trees and the durations present in both dicts are compared.  The
+    result is a sorted list of tuples (tree name, duration name, baseline
+    duration, new duration).
+
+    >>> baseline = {'grid': {'widgets': 5, 'full': 1.0, 'leaf': 0.1}}
+    >>> results = {'grid': {'widgets': 5, 'full': 1.2, 'leaf': 0.2},
+    ...            'chain': {'widgets': 9, 'full': 3.0}}
+    >>> print FindRegressions(results, baseline, 0.25)
+    [('grid', 'leaf', 0.1, 0.2)]
+
+    """
+    regressions = []
+    for tree_name in sorted(set(results) & set(baseline)):
+        new, old = results[tree_name], baseline[tree_name]
+        for name in ('full', 'leaf', 'resize'):
+            if name in new and name in old:
+                if new[name] > old[name] * (1 + threshold):
+                    regressions.append((tree_name, name, old[name],
+                                        new[name]))
+    return regressions
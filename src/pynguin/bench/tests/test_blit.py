@@ -0,0 +1,48 @@
+#! /usr/bin/python
+"""
+Created on Oct 18, 2026
+
+@author: Niriel
+"""
+
+import unittest
+import pygame
+from pynguin.bench import blit
+
+# pylint: disable-msg=R0904
+# Because unit tests have tons of public methods and that's normal.
+
+# pylint: disable-msg=W0212
+# Because I know what I'm doing when I use a protected attribute in a test.
+
+
+class TestBlit(unittest.TestCase):
+    """Test the blit benchmark."""
+    def setUp(self):
+        """Open a small display of 32 bits per pixel, like main does."""
+        pygame.display.init()
+        pygame.display.set_mode((200, 100), 0, 32)
+
+    def tearDown(self):
+        """Close the display."""
+        pygame.display.quit()
+
+    def testMakeScreen(self):
+        """MakeScreen fills the screen with windows of sprites."""
+        screen = blit.MakeScreen(2, 15)
+        windows = screen._sprites_group.sprites()
+        self.assertEquals(len(windows), 2)
+        for window in windows:
+            self.assertEquals(len(window._sprites_group), 15)
+            self.assertTrue(screen.rect.contains(window.rect))
+
+    def testBenchBlit(self):
+        """BenchBlit times every format."""
+        results = blit.BenchBlit(2, 15, 1, 1)
+        self.assertEquals(sorted(results), sorted(blit.FORMATS))
+        for duration in results.itervalues():
+            self.assertTrue(duration >= 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+#! /usr/bin/python
+"""
+Created on Oct 18, 2026
+
+@author: Niriel
+"""
+
+import unittest
+from pynguin.bench import layout
+
+# pylint: disable-msg=R0904
+# Because unit tests have tons of public methods and that's normal.
+
+# pylint: disable-msg=W0212
+# Because I know what I'm doing when I use a protected attribute in a test.
+
+
+class TestLayout(unittest.TestCase):
+    """Test the layout benchmarks."""
+
+    def testDocTest(self):
+        """Module bench.layout passes its doctests."""
+        import doctest
+        failures, unused = doctest.testmod(m=layout)
+        del unused
+        self.assertEquals(failures, 0)
+
+    def testBenchAll(self):
+        """BenchAll times every tree in every situation."""
+        results = layout.BenchAll(0.05, 1, 1)
+        self.assertEquals(sorted(results), sorted(layout.TREES))
+        for result in results.itervalues():
+            self.assertTrue(result['widgets'] > 1)
+            for name in ('full', 'leaf', 'resize'):
+                self.assertTrue(result[name] >= 0)
+
+    def testNormalizedRegressions(self):
+        """The durations compared are relative to the calibration."""
+        calibration = layout.Calibrate(1, 1)
+        self.assertTrue(calibration > 0)
+        baseline = {'chain': {'widgets': 3, 'full': 2.0, 'leaf': 1.0}}
+        # Twice slower, on a machine twice slower: no regression.
+        results = {'chain': {'widgets': 3, 'full': 4.0, 'leaf': 2.0}}
+        self.assertEquals(
+            layout.FindRegressions(layout.Normalize(results, 2.0),
+                                   layout.Normalize(baseline, 1.0), 0.3),
+            [])
+        self.assertEquals(
+            layout.FindRegressions(layout.Normalize(results, 1.0),
+                                   layout.Normalize(baseline, 1.0), 0.3),
+            [('chain', 'full', 2.0, 4.0), ('chain', 'leaf', 1.0, 2.0)])
+
+    def testLeafChangesRoot(self):
+        """The leaf changed by the benchmark does change the root's size."""
+        root = layout.MakeChain(5)
+        root.requestSize(True)
+        before = root.requested_size
+        leaf = layout._DeepestLeaf(root)
+        leaf.setSize(leaf.size.width + 100, leaf.size.height)
+        root.refreshRequestedSize()
+        self.assertEquals(root.requested_size.width, before.width + 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
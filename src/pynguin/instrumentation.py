@@ -0,0 +1,233 @@
+#! /usr/bin/python
+"""Measure where the time of the size negotiation and the drawing goes.
+
+Created on Oct 18, 2026
+
+@author: Niriel
+
+When a frame is slow, a Profiler tells which widgets are responsible.  While
+it is enabled, it replaces the methods doing the work by wrappers measuring
+them:
+
+* requestSize, refreshRequestedSize and allocateSize of the Sizeable classes,
+* update and _draw of the GuiSprite classes.
+
+The wrappers are installed on every class defining one of these methods when
+the profiler is enabled.  Disabling the profiler puts the original methods
+back: nothing remains installed, so a disabled profiler costs nothing.
+
+For each widget (or sprite) and each method, the profiler records the number
+of calls, the inclusive time (the whole call) and the exclusive time (the call
+minus the calls it makes to other measured methods).  The path of a widget is
+made of its ancestors, from the root.  The call stacks are also recorded in
+the collapsed format read by the usual flame graph tools (flamegraph.pl,
+speedscope, ...):
+
+    profiler = Profiler()
+    with profiler:
+        screen.negotiateSize(True)
+        screen._sprite.update()
+    for record in profiler.getRecords()[:10]:
+        print record
+    with open('frame.folded', 'w') as folded:
+        profiler.writeCollapsedStacks(folded)
+
+Each object is named after its class and a number, in the order in which the
+profiler met them: 'HBoxWidget#3'.
+
+"""
+
+import timeit
+import weakref
+from pynguin.layout.sizeable import Sizeable
+from pynguin.sprite.guisprite import GuiSprite
+
+__all__ = ['InstrumentationError', 'Profiler', 'MEASURED_METHODS']
+
+
+# (base class, method name): the method is measured in the base class and in
+# all its subclasses that override it.
+MEASURED_METHODS = [(Sizeable, 'requestSize'),
+                    (Sizeable, 'refreshRequestedSize'),
+                    (Sizeable, 'allocateSize'),
+                    (GuiSprite, 'update'),
+                    (GuiSprite, '_draw')]
+
+# The profiler currently enabled, if any.
+_enabled = [None]
+
+
+class InstrumentationError(RuntimeError):
+    """Base error raised by the instrumentation module."""
+
+
+def _IterClasses(cls):
+    """Yield cls and all its subclasses, once each."""
+    seen = set()
+    pending = [cls]
+    while pending:
+        cls = pending.pop()
+        if cls not in seen:
+            seen.add(cls)
+            yield cls
+            pending.extend(cls.__subclasses__())
+
+
+class Profiler(object):
+    """Record the calls to the methods of MEASURED_METHODS.
+
+    Parameter.
+    ==========
+
+    * clock: a function returning the time in seconds.  The default is the
+      most precise clock of the platform.
+
+    Only one profiler can be enabled at a time.  A profiler can be enabled and
+    disabled several times: the records accumulate until reset is called.
+
+    """
+
+    def __init__(self, clock=timeit.default_timer):
+        """Initialize a new disabled Profiler."""
+        object.__init__(self)
+        self.clock = clock
+        self._originals = []
+        self._names = weakref.WeakKeyDictionary()
+        self._counter = 0
+        self._stack = []
+        self.reset()
+
+    def reset(self):
+        """Forget everything recorded so far."""
+        # (name, operation): [path, calls, inclusive, exclusive]
+        self._records = {}
+        # Tuple of the names of the frames: exclusive time.
+        self._stacks = {}
+
+    def isEnabled(self):
+        """Return True if the wrappers of this profiler are installed."""
+        return _enabled[0] is self
+
+    def enable(self):
+        """Install the wrappers on all the classes defining the methods."""
+        if _enabled[0] is self:
+            return
+        if _enabled[0] is not None:
+            raise InstrumentationError("Another Profiler is enabled.")
+        for base, operation in MEASURED_METHODS:
+            for cls in _IterClasses(base):
+                if operation in cls.__dict__:
+                    function = cls.__dict__[operation]
+                    self._originals.append((cls, operation, function))
+                    setattr(cls, operation, self._wrap(function, operation))
+        _enabled[0] = self
+
+    def disable(self):
+        """Put the original methods back."""
+        if _enabled[0] is not self:
+            return
+        while self._originals:
+            cls, operation, function = self._originals.pop()
+            setattr(cls, operation, function)
+        _enabled[0] = None
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.disable()
+
+    def _wrap(self, function, operation):
+        """Return a function measuring the calls to function."""
+        call = self._call
+        def Wrapper(obj, *args, **kwargs):
+            return call(obj, operation, function, args, kwargs)
+        Wrapper.__name__ = function.__name__
+        Wrapper.__doc__ = function.__doc__
+        return Wrapper
+
+    def _getName(self, obj):
+        """Return the name of obj, for example 'LabelWidget#4'."""
+        try:
+            return self._names[obj]
+        except KeyError:
+            self._counter += 1
+            name = '%s#%i' % (obj.__class__.__name__, self._counter)
+            self._names[obj] = name
+            return name
+
+    def _getPath(self, obj):
+        """Return the names of obj and its ancestors, from the root."""
+        names = [self._getName(obj)]
+        parent = getattr(obj, 'parent', None)
+        while parent is not None:
+            names.append(self._getName(parent))
+            parent = getattr(parent, 'parent', None)
+        names.reverse()
+        return '/'.join(names)
+
+    def _call(self, obj, operation, function, args, kwargs):
+        """Call function and record how long it took."""
+        stack = self._stack
+        if stack and stack[-1][0] is obj and stack[-1][1] == operation:
+            # An override calling the method of its base class: this is still
+            # the same call.
+            return function(obj, *args, **kwargs)
+        name = self._getName(obj)
+        key = (name, operation)
+        label = '%s.%s' % key
+        frames = stack[-1][2] + (label,) if stack else (label,)
+        # obj, operation, frames, time spent in the measured calls made.
+        frame = [obj, operation, frames, 0.0]
+        stack.append(frame)
+        clock = self.clock
+        start = clock()
+        try:
+            return function(obj, *args, **kwargs)
+        finally:
+            inclusive = clock() - start
+            exclusive = inclusive - frame[3]
+            stack.pop()
+            if stack:
+                stack[-1][3] += inclusive
+            record = self._records.get(key)
+            if record is None:
+                record = [self._getPath(obj), 0, 0.0, 0.0]
+                self._records[key] = record
+            record[1] += 1
+            record[2] += inclusive
+            record[3] += exclusive
+            self._stacks[frames] = self._stacks.get(frames, 0.0) + exclusive
+
+    def getRecords(self):
+        """Return the records, the longest inclusive time first.
+
+        Each record is a dict with the keys 'name', 'operation', 'path',
+        'calls', 'inclusive' and 'exclusive'.  The times are in seconds.  The
+        path is the one the widget had the first time it was measured.
+
+        """
+        records = [{'name': name, 'operation': operation, 'path': path,
+                    'calls': calls, 'inclusive': inclusive,
+                    'exclusive': exclusive}
+                   for (name, operation), (path, calls, inclusive, exclusive)
+                   in self._records.iteritems()]
+        records.sort(key=lambda record: (-record['inclusive'],
+                                         record['path'], record['operation']))
+        return records
+
+    def getCollapsedStacks(self):
+        """Return the call stacks in the collapsed format, as a list of lines.
+
+        Each line is made of the frames separated by semicolons, a space and
+        the exclusive time of the last frame, in microseconds.
+
+        """
+        return ['%s %i' % (';'.join(frames), round(duration * 1e6))
+                for frames, duration in sorted(self._stacks.iteritems())]
+
+    def writeCollapsedStacks(self, output):
+        """Write the collapsed stacks in the file object output."""
+        for line in self.getCollapsedStacks():
+            output.write(line + '\n')
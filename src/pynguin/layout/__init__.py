@@ -63,6 +63,10 @@ is to raise NotImplementedError.
 The allocated size should be a size.SizeAllocation object. These contain not
 only a size but also a position.
 
+The layouts give their children size.FrozenSizeAllocation objects instead.
+They are immutable, so allocateSize stores them without copying them.  Do not
+modify the allocated size of a child in place: allocate a new one.
+
 IMPORTANT: always remember to call requestSize before calling
 allocateSize, even if you do not allocate the requested size.  This is because
 requestSize will give allocateSize a first guess to start with.
@@ -107,6 +111,27 @@ Sizeable.  But this Sizeable should always have one size: the size of the
 screen (for example 800x600).  Remember to always compute the requested size
 before allocating.
 
+5) Cached requested sizes.
+--------------------------
+
+The requested size is cached.  requestSize marks it as valid.  Whenever
+something the requested size depends on changes (a text, a font, the
+forced_requested_size, a child added or removed) the method
+invalidateRequestedSize marks it as invalid, as well as the requested size of
+all the ancestors.
+
+The method refreshRequestedSize only recomputes the invalid requested sizes.
+Called on the root of a tree, it follows the invalid path down to the modified
+elements and leaves the rest of the tree untouched.  Changing the text of one
+label in a screen of thousands of widgets therefore costs the depth of the
+tree, not its size.  requestSize(True) still recomputes everything.
+
+Likewise, allocateSize does nothing when a Sizeable object receives the same
+allocation as the previous time and neither its requested size nor that of its
+children changed.  The descent stops there: the untouched parts of the tree are
+not allocated again.  GetAllocationCounts tells how many allocations were
+performed and skipped.
+
 
 II] Container.
 ==============
@@ -250,6 +275,27 @@ can only manage one (WindowLayout, ScrollLayout).  When giving a layout to
 a container, make sure they are compatible.  For example, WindowLayout and
 ScrollLayout should only be given to Bin containers.
 
+GridLayout places its children in the cells of a table, with aligned columns
+and rows.  Each child must be given its cell with GridLayout.attach.  Prefer it
+to VBoxLayouts of HBoxLayouts: it solves the whole table in two passes over the
+children.
+
+VirtualBoxLayout is a vertical list of many items (think of a chat log), of
+which only the visible ones have a widget.  The heights of the items are kept
+in a HeightIndex, so finding the visible items costs O(log n).
+
+BoxLayout and GridLayout can remember the allocations they computed.  Give
+them a LayoutCache, shared by similar layouts like the rows of a list: when
+the children request the same sizes in the same allocated size, the stored
+rectangles are translated instead of computed again.  The cache counts its
+hits and misses.
+
+For very large trees (tens of thousands of elements), the module flatlayout
+provides FlatLayoutTree.  It stores the nodes of a tree of HBox, VBox, Border
+and Window layouts in flat arrays of integers and negotiates their size without
+creating any object.  The numbers are exactly those of the layout objects.
+Existing trees can be attached to it, and receive the results back.
+
 VII] For more information.
 ==========================
 
@@ -260,10 +306,15 @@ description of the classes.
 from size import Size
 from size import Pos
 from size import SizeAllocation
+from size import FrozenSize
+from size import FrozenPos
+from size import FrozenSizeAllocation
 from sizeable import Sizeable
 from sizeable import SizeableError
 from sizeable import SizeAllocationError
 from sizeable import ExpandError
+from sizeable import GetAllocationCounts
+from sizeable import ResetAllocationCounts
 from parentable import Parentable
 from parentable import ParentableError
 from parentable import NoParentError
@@ -279,5 +330,9 @@ from boardlayout import BoardLayout
 from borderlayout import BorderLayout
 from boxlayout import HBoxLayout
 from boxlayout import VBoxLayout
+from gridlayout import GridLayout
+from virtualboxlayout import VirtualBoxLayout
+from layoutcache import LayoutCache
 from windowlayout import WindowLayout
 from scrolllayout import ScrollLayout
+from flatlayout import FlatLayoutTree
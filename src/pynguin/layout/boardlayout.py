@@ -6,7 +6,7 @@ Created on Nov 29, 2010
 """
 
 from size import Size
-from size import SizeAllocation
+from size import FrozenSizeAllocation
 from layout import Layout
 
 __all__ = ['BoardLayout']
@@ -43,8 +43,11 @@ class BoardLayout(Layout):
         for child in children:
             if child.allocated_size:
                 # Keep the position.
-                child_size = child.allocated_size
-                child_size.size = child.requested_size.copy()
+                allocated_size = child.allocated_size
+                child_size = FrozenSizeAllocation((allocated_size.left,
+                                                   allocated_size.top),
+                                                  child.requested_size)
             else:
-                child_size = SizeAllocation((0, 0), child.requested_size)
+                child_size = FrozenSizeAllocation((0, 0),
+                                                  child.requested_size)
             child.allocateSize(child_size)
@@ -6,7 +6,7 @@ Created on Mar 17, 2011
 """
 
 from layout import Layout
-from size import SizeAllocation
+from size import FrozenSizeAllocation
 import tools
 
 __all__ = ['BorderLayout']
@@ -112,7 +112,7 @@ class BorderLayout(Layout):
         unused, lengths = tools.Homothecy([self.top, self.bottom],
                                           border_height)
         child_top = lengths[0]
-        child_size = SizeAllocation((allocated_size.left + child_left,
-                                     allocated_size.top + child_top),
-                                     (child_width, child_height))
+        child_size = FrozenSizeAllocation((allocated_size.left + child_left,
+                                           allocated_size.top + child_top),
+                                          (child_width, child_height))
         child.allocateSize(child_size)
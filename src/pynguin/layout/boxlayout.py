@@ -7,96 +7,244 @@ Created on Nov 9, 2010
 
 
 from size import Size
-from sizeable import SizeAllocation
+from size import FrozenSizeAllocation
 from sizeable import ExpandError
 from layout import Layout
+from tools import Homothecy
+from tools import VectorHomothecy
 
+try:
+    import numpy
+except ImportError:
+    # NumPy is optional: without it, large boxes use the pure Python code.
+    numpy = None
 
-__all__ = ['HBoxLayout', 'VBoxLayout']
 
+__all__ = ['HBoxLayout', 'VBoxLayout', 'RequestedLengths', 'ShrinkLengths',
+           'InflateLengths', 'IdealLengths']
 
-def Homothecy(ori_lengths, dest_length):
-    """Return a list of pos and lengths zoomed in or out to fit a length.
 
-    This is used to shrink or inflate widgets in boxes during the size
-    allocation phase.
+# The functions below do the arithmetic of the boxes on plain lists of
+# integers.  They know nothing about Sizeable objects nor about the direction
+# of the box: the "primary" dimension is the width for a HBoxLayout and the
+# height for a VBoxLayout.  Both the BoxLayout objects and the flat layout trees
+# (see flatlayout.py) rely on them, which guarantees identical results.
 
-    The word "length" is used here to mean either width or height.  It has
-    nothing to do with the number of elements in the lists.
+def RequestedLengths(primary_lengths, secondary_lengths, spacing,
+                     is_homogeneous):
+    """Return the primary and secondary lengths requested by a box.
 
-    ori_length is an array of integer: the original length of the widgets.
+    primary_lengths and secondary_lengths are the requested lengths of the
+    children.
 
-    dest_length is an integer: the length you in which you want to fit all the
-    widgets.
-
-    The result is a tuple containing two elements:
-     - a list of positions,
-     - a list of lengths.
-    You can find the positions by accumulating the lenghts.
-
-    >>> print Homothecy([50, 100, 33], 183) # No change in zoom.
-    ([0, 50, 150], [50, 100, 33])
-
-    >>> print Homothecy([50, 100, 33], 366) # Zoom in times 2.
-    ([0, 100, 300], [100, 200, 66])
-
-    >>> print Homothecy([50, 100, 33], 91) # Zoom out times 2.
-    ([0, 25, 75], [25, 50, 16])
-
-    >>> print Homothecy([50, 100, 33], 0)
-    ([0, 0, 0], [0, 0, 0])
-
-    That the sum of the resulting list of lengths is of course always equal to
-    the destination length you pass as a parameter.  That's what this function
-    is made for.
+    >>> print RequestedLengths([20, 40, 30], [10, 10, 15], 7, False)
+    (104, 15)
+    >>> print RequestedLengths([20, 40, 30], [10, 10, 15], 7, True)
+    (134, 15)
+    >>> print RequestedLengths([], [], 7, True)
+    (0, 0)
 
     """
-    ori_positions = [0]
-    for length in ori_lengths:
-        ori_positions.append(ori_positions[-1] + length)
-    ori_end = ori_positions[-1]
-    if ori_end == dest_length:
-        # No need to do any math here.
-        dest_lengths = list(ori_lengths) # Safer to return a new object.
-        dest_positions = [0]
-        for length in dest_lengths[:-1]:
-            dest_positions.append(dest_positions[-1] + length)
-        return dest_positions, dest_lengths
-    #
-    factor = float(dest_length) / ori_end # Integer divisions create problems.
-    dest_positions = [int(round(ori_position * factor)) \
-                      for ori_position in ori_positions]
-    #
-    dest_lengths = []
-    for i in xrange(len(dest_positions) - 1):
-        dest_length = dest_positions[i + 1] - dest_positions[i]
-        dest_lengths.append(dest_length)
-    #
-    return dest_positions[:-1], dest_lengths
-
-
-def GetExpandableIds(children, length_name):
-    """Return a list of indexes of the children that can expand in given dir.
+    children_nb = len(primary_lengths)
+    if not children_nb:
+        return 0, 0
+    if is_homogeneous:
+        primary_length = children_nb * max(primary_lengths)
+    else:
+        primary_length = sum(primary_lengths)
+    primary_length += (children_nb - 1) * spacing
+    return primary_length, max(secondary_lengths)
+
+
+def ShrinkLengths(coord, length, lengths, spacing, is_homogeneous):
+    """Return the coords and lengths of children shrunk into length.
+
+    coord and length are the primary coordinate and length allocated to the
+    box, lengths the primary lengths requested by the children.
+
+    >>> print ShrinkLengths(200, 74, [20, 40, 30], 7, False)
+    ([200, 220, 254], [13, 27, 20])
+    >>> print ShrinkLengths(200, 10, [20, 40, 30], 7, False)
+    ([200, 205, 210], [0, 0, 0])
+    >>> print ShrinkLengths(200, 0, [20], 7, False)
+    ([200], [0])
 
-    Parameters.
-    -----------
-
-    * children: a list of children.
-    * length_name: a string "width" or "height".
-
-    Return.
-    -------
+    """
+    # What is the length we can give to the children ? It's the total
+    # allocated length minus the spacing.
+    total_cell_length = length - spacing * (len(lengths) - 1)
+
+    if total_cell_length > 0:
+        # Apply the homothecy on the children. For the heterogeneous case,
+        # the original lengths are the requested lengths.  For the
+        # homogeneous case, the original lengths are all equals to the
+        # biggest requested length. The destination length is the length
+        # calculated above. We obtain the position and length of every
+        # widget.
+        if is_homogeneous:
+            lengths = [max(lengths)] * len(lengths)
+        coords, lengths = Homothecy(lengths, total_cell_length)
+        # The position needs to take the spacing into account.  Plus the
+        # position of the BoxLayout itself.
+        for i in xrange(len(coords)):
+            coords[i] += coord + i * spacing
+    elif len(lengths) == 1:
+        # No room for the only child, and no spacing to shrink.
+        coords, lengths = [coord], [0]
+    else:
+        # We shrink so much that there is no room for the cells at all
+        # anymore.  Not even enough room for the spacing.
+        #
+        # But because we want to do things well, we are going to apply an
+        # homothecy on the spacing itself in order to shrink it properly.
+        # The coordinates resulting from the homothecy will give us the
+        # coordinates of our cells.
+        spacings = [spacing] * (len(lengths) - 1)
+        coords, spacings = Homothecy(spacings, length)
+        # The last child starts after the last spacing.
+        coords += [coords[-1] + spacings[-1]]
+        for i in xrange(len(coords)):
+            coords[i] += coord
+        # No room for children at all.
+        lengths = [0] * len(lengths)
+    return coords, lengths
+
+
+def InflateLengths(coord, length, lengths, expandables, spacing,
+                   is_homogeneous):
+    """Return the coords and lengths of children inflated into length.
+
+    coord and length are the primary coordinate and length allocated to the
+    box, lengths the primary lengths requested by the children and expandables
+    a list of booleans telling which children can expand.
+
+    >>> print InflateLengths(200, 156, [20, 40, 30], [True, False, True], 7,
+    ...                      False)
+    ([200, 248, 295], [41, 40, 61])
 
-    A list of integers.  Each integer is an index for a child in children that
-    can expand in the direction given by length_name.
+    """
+    # What is the length we can give to the children ?  It's the allocated
+    # length minus the spacing.
+    total_cell_length = length - spacing * (len(lengths) - 1)
+
+    # Compute an list of lengths, one length per cell.
+    if is_homogeneous:
+        # The homogeneous case is easy: pretend that all the children have
+        # requested the same length: the length of the longest cell. Then
+        # apply an homothecy to make it fit the allocated size.
+        unused, lengths = Homothecy([max(lengths)] * len(lengths),
+                                    total_cell_length)
+    else:
+        # Heterogeneous case.  Some cells can expand, some cannot.  The
+        # extra space is only for the cells that can expand.  We will apply
+        # an homothecy on the expandable cells.  For that, we need to
+        # identify them.  We also need to compute the available space for
+        # the expandable cells by removing the space claimed by the fixed
+        # cells.
+        fixed_lengths = [0] * len(lengths)
+        exp_ids = []
+        exp_lengths = []
+        for cell_id, cell_length in enumerate(lengths):
+            if expandables[cell_id]:
+                # Take note of expandable children for homothecy.
+                exp_ids.append(cell_id)
+                exp_lengths.append(cell_length)
+            else:
+                # Non-expandable cells need no homothecy.
+                fixed_lengths[cell_id] = cell_length
+        # Compute allocated length available for expandable cells.
+        total_exp_length = total_cell_length - sum(fixed_lengths)
+        # Perform the homothecy on the expandable children.
+        unused, exp_lengths = Homothecy(exp_lengths, total_exp_length)
+        # Inject the result of the homothecy into the `lengths` list.
+        lengths = fixed_lengths
+        for cell_id, cell_length in zip(exp_ids, exp_lengths):
+            lengths[cell_id] = cell_length
+
+    # Compute the positions from the lengths.
+    coords = [coord]
+    for cell_length in lengths[:-1]:
+        coords.append(coords[-1] + cell_length + spacing)
+    return coords, lengths
+
+
+def IdealLengths(coord, lengths, spacing, is_homogeneous):
+    """Return the coords and lengths of children getting what they request.
+
+    Homogeneous box: every child gets the max primary.
+    Heterogeneous box: every child gets the primary it asked for.
+
+    >>> print IdealLengths(200, [20, 40, 30], 7, False)
+    ([200, 227, 274], [20, 40, 30])
+    >>> print IdealLengths(200, [20, 40, 30], 7, True)
+    ([200, 247, 294], [40, 40, 40])
 
     """
-    # I could write a list comprehension here.  Would it make the code clearer?
-    result = []
-    for child_id, child in enumerate(children):
-        if child.canExpand(length_name):
-            result.append(child_id)
-    return result
+    if is_homogeneous:
+        lengths = [max(lengths)] * len(lengths)
+    coords = [coord]
+    for cell_length in lengths[:-1]:
+        coords.append(coords[-1] + cell_length + spacing)
+    return coords, list(lengths)
+
+
+# The functions below are the NumPy counterparts of the functions above.  They
+# take and return arrays of integers instead of lists and give exactly the same
+# results.  BoxLayout uses them for boxes having many children, when NumPy is
+# available.
+
+def _VectorCoords(coord, lengths, spacing):
+    """Return the coords of cells of given lengths, starting at coord."""
+    coords = numpy.empty(len(lengths), numpy.int64)
+    coords[0] = coord
+    numpy.cumsum(lengths[:-1] + spacing, out=coords[1:])
+    coords[1:] += coord
+    return coords
+
+
+def _VectorShrinkLengths(coord, length, lengths, spacing, is_homogeneous):
+    """NumPy version of ShrinkLengths."""
+    children_nb = len(lengths)
+    total_cell_length = length - spacing * (children_nb - 1)
+    if total_cell_length > 0:
+        if is_homogeneous:
+            lengths = numpy.repeat(lengths.max(), children_nb)
+        coords, lengths = VectorHomothecy(lengths, total_cell_length)
+        coords = coords + coord + numpy.arange(children_nb) * spacing
+    elif children_nb == 1:
+        coords = numpy.array([coord], numpy.int64)
+        lengths = numpy.zeros(1, numpy.int64)
+    else:
+        spacings = numpy.repeat(numpy.int64(spacing), children_nb - 1)
+        coords, spacings = VectorHomothecy(spacings, length)
+        coords = numpy.append(coords, coords[-1] + spacings[-1]) + coord
+        lengths = numpy.zeros(children_nb, numpy.int64)
+    return coords, lengths
+
+
+def _VectorInflateLengths(coord, length, lengths, expandables, spacing,
+                          is_homogeneous):
+    """NumPy version of InflateLengths, expandables is an array of bool."""
+    children_nb = len(lengths)
+    total_cell_length = length - spacing * (children_nb - 1)
+    if is_homogeneous:
+        unused, lengths = VectorHomothecy(
+            numpy.repeat(lengths.max(), children_nb), total_cell_length)
+    else:
+        fixed_lengths = numpy.where(expandables, 0, lengths)
+        total_exp_length = total_cell_length - int(fixed_lengths.sum())
+        unused, exp_lengths = VectorHomothecy(lengths[expandables],
+                                               total_exp_length)
+        lengths = fixed_lengths
+        lengths[expandables] = exp_lengths
+    return _VectorCoords(coord, lengths, spacing), lengths
+
+
+def _VectorIdealLengths(coord, lengths, spacing, is_homogeneous):
+    """NumPy version of IdealLengths."""
+    if is_homogeneous:
+        lengths = numpy.repeat(lengths.max(), len(lengths))
+    return _VectorCoords(coord, lengths, spacing), lengths
 
 
 class BoxLayout(Layout):
@@ -113,13 +261,13 @@ class BoxLayout(Layout):
     whether or not your BoxLayout is homogeneous by setting the appropriate
     parameter to True or False in the constructor.
 
+    Boxes having at least VECTORIZE_THRESHOLD children compute the allocation
+    of their children with NumPy, if it is installed.  The results are the
+    same, only faster.
+
     """
 
-    # To overload in the subclasses.
-    PRIMARY_LENGTH = 'undefined'
-    SECONDARY_LENGTH = 'undefined'
-    PRIMARY_COORD = 'undefined'
-    SECONDARY_COORD = 'undefined'
+    VECTORIZE_THRESHOLD = 200
 
     def __init__(self, spacing, is_homogeneous):
         """Initialize a new BoxLayout object.
@@ -151,64 +299,48 @@ class BoxLayout(Layout):
         self.spacing = spacing
         self.is_homogeneous = is_homogeneous
 
-    def _requestSizeHomogeneous(self, children):
-        """Compute the size needed by a homogeneous BoxLayout.
+    def _cacheParameters(self, children):
+        """Return the spacing and the homogeneity."""
+        return self.spacing, self.is_homogeneous
 
-        In a homogeneous box, the size allocated to the children is the same
-        for all.
+    # Accessors.  They are the only methods knowing which dimension is the
+    # primary one, and the algorithms only use them.  HBoxLayout and
+    # VBoxLayout define them with direct attribute access:
+    #
+    # _splitSize(size), _splitPos(allocated_size): (primary, secondary).
+    # _makeSize(primary_length, secondary_length): a Size.
+    # _makeAllocation(primary_coord, secondary_coord, primary_length,
+    #                 secondary_length): a FrozenSizeAllocation.
+    # _primaryLengths(children), _secondaryLengths(children): the requested
+    #     lengths of the children.
+    # _primaryExpandables(children), _secondaryExpandables(children): their
+    #     can_expand_* attributes.
 
-        The algorithm looks at all the children and finds the size of the
-        biggest one.  This size is used for all the children.
+    # Algorithms.
 
-        This method is generic in the sense that it doesn't know whether the
-        BoxLayout is horizontal (HBoxLayout) or vertical (VBoxLayout).  See the
-        classes HBoxLayout and VBoxLayout.  The only difference between those
-        two is that in one case, the primary dimension will be the width and
-        the secondary will be the height, and in the other case it will be
-        reversed.
+    def _allocateCells(self, allocated_size, children, coords, lengths):
+        """Allocate to each child its primary coord and length.
 
-        So for a horizontal box, have the following attribute values:
-            PRIMARY_LENGTH = 'width'
-            SECONDARY_LENGTH = 'height'
-        and for a vertical box, have these
-            PRIMARY_LENGTH = 'height'
-            SECONDARY_LENGTH = 'width'
+        In the secondary (transverse) dimension, every child gets the whole
+        space allocated to the box.
 
         """
-        primary_length_name = self.PRIMARY_LENGTH
-        secondary_length_name = self.SECONDARY_LENGTH
-        max_size = Size(0, 0)
-        try:
-            for child in children:
-                max_size |= child.requested_size
-        except AttributeError as ex:
-            # I want to modify the text that's in the first arg.  But strings
-            # as well as tuples are immutable.  So I just make a list for
-            # a little while.
-            args = list(ex.args)
-            args[0] += ", did you forget to request the size of the child?"
-            ex.args = tuple(args)
-            raise
-        children_nb = len(children)
-        primary_length = children_nb * getattr(max_size, primary_length_name)
-        secondary_length = getattr(max_size, secondary_length_name)
-
-        primary_length += (children_nb - 1) * self.spacing
-
-        result = Size(0, 0)
-        setattr(result, primary_length_name, primary_length)
-        setattr(result, secondary_length_name, secondary_length)
-        return result
-
-    def _requestSizeHeterogeneous(self, children):
-        """Compute the size needed by a heterogeneous BoxLayout.
+        unused, secondary_coord = self._splitPos(allocated_size)
+        unused, secondary_length = self._splitSize(allocated_size)
+        make_allocation = self._makeAllocation
+        for child, primary_coord, primary_length in zip(children, coords,
+                                                        lengths):
+            child.allocateSize(make_allocation(primary_coord, secondary_coord,
+                                               primary_length,
+                                               secondary_length))
 
-        In a heterogeneous box, the size requested is just enough to hold
-        the children with their requested size.
+    def requestSize(self, children):
+        """Compute the requested size of the BoxLayout.
 
-        The algorithm looks through all the children, summing their width or
-        height (depends on the direction of the box), and taking the max of
-        their height or width in the other direction.
+        In a homogeneous box, the size allocated to the children is the same
+        for all: the size of the biggest one.  In a heterogeneous box, the size
+        requested is just enough to hold the children with their requested
+        size.
 
         This method is generic in the sense that it doesn't know whether the
         BoxLayout is horizontal (HBoxLayout) or vertical (VBoxLayout).  See the
@@ -229,185 +361,77 @@ class BoxLayout(Layout):
             SECONDARY_COORD = 'left'
 
         """
-        primary_length_name = self.PRIMARY_LENGTH
-        secondary_length_name = self.SECONDARY_LENGTH
-        primary_length = secondary_length = 0
-        for child in children:
-            child_size = child.requested_size
-            primary_length += getattr(child_size, primary_length_name)
-            cell_secondary_length = getattr(child_size, secondary_length_name)
-            if cell_secondary_length > secondary_length:
-                secondary_length = cell_secondary_length
-
-        children_nb = len(children)
-        primary_length += (children_nb - 1) * self.spacing
-
-        result = Size(0, 0)
-        setattr(result, primary_length_name, primary_length)
-        setattr(result, secondary_length_name, secondary_length)
-        return result
-
-    def requestSize(self, children):
-        """Compute the requested size of the BoxLayout."""
-        if not children:
-            return Size(0, 0)
-        if self.is_homogeneous:
-            return self._requestSizeHomogeneous(children)
-        else:
-            return self._requestSizeHeterogeneous(children)
+        try:
+            primary_lengths = self._primaryLengths(children)
+            secondary_lengths = self._secondaryLengths(children)
+        except AttributeError as ex:
+            # I want to modify the text that's in the first arg.  But strings
+            # as well as tuples are immutable.  So I just make a list for
+            # a little while.
+            args = list(ex.args)
+            args[0] += ", did you forget to request the size of the child?"
+            ex.args = tuple(args)
+            raise
+        return self._makeSize(*RequestedLengths(primary_lengths,
+                                                secondary_lengths,
+                                                self.spacing,
+                                                self.is_homogeneous))
 
     def _allocatedSizeShrink(self, allocated_size, children):
         """Performs the size allocation."""
-        # What is the length we can give to the children ? It's the total
-        # allocated length minus the spacing.
-        alloc_primary_len = getattr(allocated_size, self.PRIMARY_LENGTH)
-        total_cell_length = (alloc_primary_len -
-                             self.spacing * (len(children) - 1))
-
-        if total_cell_length > 0:
-            # Apply the homothecy on the children. For the heterogeneous case,
-            # the original lengths are the requested lengths.  For the
-            # homogeneous case, the original lengths are all equals to the
-            # biggest requested length. The destination length is the length
-            # calculated above. We obtain the position and length of every
-            # widget.
-            primary_lengths = [getattr(child.requested_size,
-                                       self.PRIMARY_LENGTH)
-                               for child in children]
-            if self.is_homogeneous:
-                primary_lengths = [max(primary_lengths)] * len(children)
-            primary_coords, primary_lengths = Homothecy(primary_lengths,
-                                                        total_cell_length)
-            # The position needs to take the spacing into account.  Plus the
-            # position of the BoxLayout itself.
-            box_primary_coord = getattr(allocated_size, self.PRIMARY_COORD)
-            for i in xrange(len(primary_coords)):
-                primary_coords[i] += box_primary_coord + i * self.spacing
-        else:
-            # We shrink so much that there is no room for the cells at all
-            # anymore.  Not even enough room for the spacing.
-            #
-            # But because we want to do things well, we are going to apply an
-            # homothecy on the spacing itself in order to shrink it properly.
-            # The coordinates resulting from the homothecy will give us the
-            # coordinates of our cells.
-            primary_lengths = [self.spacing] * (len(children) - 1)
-            primary_coords, primary_lengths = Homothecy(primary_lengths,
-                                                        alloc_primary_len)
-            # The last child starts after the last spacing.
-            primary_coords += [primary_coords[-1] + primary_lengths[-1]]
-            box_primary_coord = getattr(allocated_size, self.PRIMARY_COORD)
-            for i in xrange(len(primary_coords)):
-                primary_coords[i] += box_primary_coord
-            # No room for children at all.
-            primary_lengths = [0] * len(children)
-
-        secondary_coord = getattr(allocated_size, self.SECONDARY_COORD)
-        secondary_length = getattr(allocated_size, self.SECONDARY_LENGTH)
-
-        for cell_id in xrange(len(children)):
-            cell_size = SizeAllocation((0, 0), (0, 0))
-            setattr(cell_size, self.PRIMARY_COORD, primary_coords[cell_id])
-            setattr(cell_size, self.SECONDARY_COORD, secondary_coord)
-            setattr(cell_size, self.PRIMARY_LENGTH, primary_lengths[cell_id])
-            setattr(cell_size, self.SECONDARY_LENGTH, secondary_length)
-            children[cell_id].allocateSize(cell_size)
+        coords, lengths = ShrinkLengths(
+            self._splitPos(allocated_size)[0],
+            self._splitSize(allocated_size)[0],
+            self._primaryLengths(children),
+            self.spacing, self.is_homogeneous)
+        self._allocateCells(allocated_size, children, coords, lengths)
 
     def _allocateSizeInflate(self, allocated_size, children):
         """Performs the size allocation."""
-        # What is the length we can give to the children ?  It's the allocated
-        # length minus the spacing.
-        total_cell_length = getattr(allocated_size, self.PRIMARY_LENGTH)
-        total_cell_length -= self.spacing * (len(children) - 1)
-
-        # Compute an list of lengths, one length per cell: `lengths`.
-        if self.is_homogeneous:
-            # The homogeneous case is easy: pretend that all the children have
-            # requested the same length: the length of the longest cell. Then
-            # apply an homothecy to make it fit the allocated size.
-            max_length = 0
-            for cell in children:
-                length = getattr(cell.requested_size, self.PRIMARY_LENGTH)
-                if length > max_length:
-                    max_length = length
-                lengths = [max_length] * len(children)
-            unused, lengths = Homothecy(lengths, total_cell_length)
-            del unused, max_length
-        else:
-            # Heterogeneous case.  Some cells can expand, some cannot.  The
-            # extra space is only for the cells that can expand.  We will apply
-            # an homothecy on the expandable cells.  For that, we need to
-            # identify them.  We also need to compute the available space for
-            # the expandable cells by removing the space claimed by the fixed
-            # cells.
-            lengths = [0] * len(children)
-            exp_ids = []
-            exp_lengths = []
-            for cell_id, cell in enumerate(children):
-                length = getattr(cell.requested_size, self.PRIMARY_LENGTH)
-                if cell.canExpand(self.PRIMARY_LENGTH):
-                    # Take note of expandable children for homothecy.
-                    exp_ids.append(cell_id)
-                    exp_lengths.append(length)
-                else:
-                    # Non-expandable cells need no homothecy.
-                    lengths[cell_id] = length
-            # Compute allocated length available for expandable cells.
-            total_exp_length = total_cell_length - sum(lengths)
-            # Perform the homothecy on the expandable children.
-            unused, exp_lengths = Homothecy(exp_lengths, total_exp_length)
-            # Inject the result of the homothecy into the `lengths` list.
-            for cell_id, length in zip(exp_ids, exp_lengths):
-                lengths[cell_id] = length
-            # Make sure we don't reuse this stuff later.
-            del exp_ids, exp_lengths, total_exp_length, unused, cell_id
-
-        # Compute the positions from the lengths.
-        coords = [getattr(allocated_size, self.PRIMARY_COORD)]
-        for length in lengths:
-            coords.append(coords[-1] + length + self.spacing)
-
-        # For the secondary (transverse) dimension, easy:
-        secondary_coord = getattr(allocated_size, self.SECONDARY_COORD)
-        secondary_length = getattr(allocated_size, self.SECONDARY_LENGTH)
-
-        # Finally, allocate the size of each cell.
-        for cell, primary_coord, primary_length in zip(children, coords, lengths):
-            cell_size = SizeAllocation((0, 0), (0, 0))
-            setattr(cell_size, self.PRIMARY_COORD, primary_coord)
-            setattr(cell_size, self.SECONDARY_COORD, secondary_coord)
-            setattr(cell_size, self.PRIMARY_LENGTH, primary_length)
-            setattr(cell_size, self.SECONDARY_LENGTH, secondary_length)
-            cell.allocateSize(cell_size)
+        coords, lengths = InflateLengths(
+            self._splitPos(allocated_size)[0],
+            self._splitSize(allocated_size)[0],
+            self._primaryLengths(children),
+            self._primaryExpandables(children),
+            self.spacing, self.is_homogeneous)
+        self._allocateCells(allocated_size, children, coords, lengths)
 
     def _allocateSizeIdeal(self, allocated_size, children):
         """Performs the size allocation."""
-        # Secondary dimension is the same for everybody.
-        secondary_length = getattr(allocated_size, self.SECONDARY_LENGTH)
-        secondary_coord = getattr(allocated_size, self.SECONDARY_COORD)
-
-        # Homogeneous box: every child gets the max primary.
-        # Heterogeneous box: every child gets the primary it asked for.
-        if self.is_homogeneous:
-            primary_length = 0
-            for child in children:
-                cell_prim = getattr(child.requested_size,
-                                    self.PRIMARY_LENGTH)
-                if cell_prim > primary_length:
-                    primary_length = cell_prim
-        heterogeneous = not self.is_homogeneous
-        primary_coord = getattr(allocated_size, self.PRIMARY_COORD)
-        for child in children:
-            if heterogeneous:
-                primary_length = getattr(child.requested_size,
-                                         self.PRIMARY_LENGTH)
-            size_a = SizeAllocation((0, 0), (0, 0))
-            setattr(size_a, self.PRIMARY_LENGTH, primary_length)
-            setattr(size_a, self.SECONDARY_LENGTH, secondary_length)
-            setattr(size_a, self.PRIMARY_COORD, primary_coord)
-            setattr(size_a, self.SECONDARY_COORD, secondary_coord)
-            child.allocateSize(size_a)
-            primary_coord += primary_length + self.spacing
+        coords, lengths = IdealLengths(
+            self._splitPos(allocated_size)[0],
+            self._primaryLengths(children),
+            self.spacing, self.is_homogeneous)
+        self._allocateCells(allocated_size, children, coords, lengths)
+
+    def _allocateSizeVectorized(self, allocated_size, requested_size,
+                                children):
+        """Performs the size allocation with NumPy.
+
+        Same results as _allocateSizeInflate, _allocatedSizeShrink and
+        _allocateSizeIdeal, but the lengths and coords of all the children are
+        computed at once with array operations.
+
+        """
+        allocated_primary = self._splitSize(allocated_size)[0]
+        requested_primary = self._splitSize(requested_size)[0]
+        primary_coord = self._splitPos(allocated_size)[0]
+        lengths = numpy.array(self._primaryLengths(children), numpy.int64)
+        if allocated_primary > requested_primary:
+            expandables = numpy.array(self._primaryExpandables(children),
+                                      numpy.bool_)
+            coords, lengths = _VectorInflateLengths(
+                primary_coord, allocated_primary, lengths, expandables,
+                self.spacing, self.is_homogeneous)
+        elif allocated_primary < requested_primary:
+            coords, lengths = _VectorShrinkLengths(
+                primary_coord, allocated_primary, lengths, self.spacing,
+                self.is_homogeneous)
+        else:
+            coords, lengths = _VectorIdealLengths(
+                primary_coord, lengths, self.spacing, self.is_homogeneous)
+        self._allocateCells(allocated_size, children, coords.tolist(),
+                            lengths.tolist())
 
     def allocateSize(self, allocated_size, requested_size, children):
         """Allocate the size of the box.
@@ -425,53 +449,126 @@ class BoxLayout(Layout):
         allocate more size than what the BoxLayout requests is forbidden. Doing
         so raises a size.SizeAllocationError.
 
+        When the box has a cache, the allocations computed are stored in it
+        and reused for the same children sizes and the same allocated size.
+
         """
         if not children:
             return
-        allocated_primary = getattr(allocated_size, self.PRIMARY_LENGTH)
-        allocated_secondary = getattr(allocated_size, self.SECONDARY_LENGTH)
-        requested_primary = getattr(requested_size, self.PRIMARY_LENGTH)
-        requested_secondary = getattr(requested_size, self.SECONDARY_LENGTH)
+        key = None
+        if self.cache is not None:
+            key = self._cacheKey(allocated_size, requested_size, children)
+            if self._allocateFromCache(allocated_size, key, children):
+                return
+        allocated_primary, allocated_secondary = \
+            self._splitSize(allocated_size)
+        requested_primary, requested_secondary = \
+            self._splitSize(requested_size)
         #
         # Not allowed to inflate if no widget can expand.
         #
         if allocated_primary > requested_primary:
-            can_expand_primary = False
-            for cell in children:
-                if cell.canExpand(self.PRIMARY_LENGTH):
-                    can_expand_primary = True
-                    break
-            if not can_expand_primary:
+            if not any(self._primaryExpandables(children)):
                 msg = "Cannot inflate a BoxLayout if no widget can expand."
                 raise ExpandError(msg)
 
         if allocated_secondary > requested_secondary:
-            can_expand_secondary = False
-            for cell in children:
-                if cell.canExpand(self.SECONDARY_LENGTH):
-                    can_expand_secondary = True
-                    break
-            if not can_expand_secondary:
+            if not any(self._secondaryExpandables(children)):
                 msg = "Cannot inflate a BoxLayout if no widget can expand."
                 raise ExpandError(msg)
 
-        if allocated_primary > requested_primary:
+        if numpy is not None and len(children) >= self.VECTORIZE_THRESHOLD:
+            self._allocateSizeVectorized(allocated_size, requested_size,
+                                         children)
+        elif allocated_primary > requested_primary:
             self._allocateSizeInflate(allocated_size, children)
         elif allocated_primary < requested_primary:
             self._allocatedSizeShrink(allocated_size, children)
         else:
             self._allocateSizeIdeal(allocated_size, children)
+        if key is not None:
+            self._storeInCache(allocated_size, key, children)
+
 
 class HBoxLayout(BoxLayout):
-    """HBoxLayout layout places its children in a row."""
-    PRIMARY_LENGTH = 'width'
-    SECONDARY_LENGTH = 'height'
-    PRIMARY_COORD = 'left'
-    SECONDARY_COORD = 'top'
+    """HBoxLayout layout places its children in a row.
+
+    The accessors of BoxLayout are written out with direct attribute access:
+    width is the primary length, left the primary coord.
+
+    """
+    def _splitSize(self, size):
+        """Return the width and the height of a size."""
+        return size.width, size.height
+
+    def _splitPos(self, allocated_size):
+        """Return the left and the top of an allocation."""
+        return allocated_size.left, allocated_size.top
+
+    def _makeSize(self, primary_length, secondary_length):
+        """Return Size(primary_length, secondary_length)."""
+        return Size(primary_length, secondary_length)
+
+    def _makeAllocation(self, primary_coord, secondary_coord, primary_length,
+                        secondary_length):
+        """Return an allocation with the primary values in x and width."""
+        return FrozenSizeAllocation((primary_coord, secondary_coord),
+                                    (primary_length, secondary_length))
+
+    def _primaryLengths(self, children):
+        """Return the list of the requested widths of the children."""
+        return [child.requested_size.width for child in children]
+
+    def _secondaryLengths(self, children):
+        """Return the list of the requested heights of the children."""
+        return [child.requested_size.height for child in children]
+
+    def _primaryExpandables(self, children):
+        """Return the list of the can_expand_width of the children."""
+        return [child.can_expand_width for child in children]
+
+    def _secondaryExpandables(self, children):
+        """Return the list of the can_expand_height of the children."""
+        return [child.can_expand_height for child in children]
+
 
 class VBoxLayout(BoxLayout):
-    """VBoxLayout layout places its children in a column."""
-    PRIMARY_LENGTH = 'height'
-    SECONDARY_LENGTH = 'width'
-    PRIMARY_COORD = 'top'
-    SECONDARY_COORD = 'left'
+    """VBoxLayout layout places its children in a column.
+
+    The accessors of BoxLayout are written out with direct attribute access:
+    height is the primary length, top the primary coord.
+
+    """
+    def _splitSize(self, size):
+        """Return the height and the width of a size."""
+        return size.height, size.width
+
+    def _splitPos(self, allocated_size):
+        """Return the top and the left of an allocation."""
+        return allocated_size.top, allocated_size.left
+
+    def _makeSize(self, primary_length, secondary_length):
+        """Return Size(secondary_length, primary_length)."""
+        return Size(secondary_length, primary_length)
+
+    def _makeAllocation(self, primary_coord, secondary_coord, primary_length,
+                        secondary_length):
+        """Return an allocation with the primary values in y and height."""
+        return FrozenSizeAllocation((secondary_coord, primary_coord),
+                                    (secondary_length, primary_length))
+
+    def _primaryLengths(self, children):
+        """Return the list of the requested heights of the children."""
+        return [child.requested_size.height for child in children]
+
+    def _secondaryLengths(self, children):
+        """Return the list of the requested widths of the children."""
+        return [child.requested_size.width for child in children]
+
+    def _primaryExpandables(self, children):
+        """Return the list of the can_expand_height of the children."""
+        return [child.can_expand_height for child in children]
+
+    def _secondaryExpandables(self, children):
+        """Return the list of the can_expand_width of the children."""
+        return [child.can_expand_width for child in children]
@@ -68,12 +68,45 @@ class Container(sizeable.Sizeable, parentable.Parentable):
             >>> print container.children
             []
 
+        The children are stored in a doubly linked list: a dictionary maps the
+        id of each child to its previous and next siblings.  Membership,
+        insertion before or after a child and removal are done in constant
+        time.  The list `children` is rebuilt only when it is read after a
+        modification.
+
         """
         sizeable.Sizeable.__init__(self)
         parentable.Parentable.__init__(self)
         self._layout = None
-        self.children = []
+        self._links = {} # id(child): [previous child, next child, child].
+        self._first = None
+        self._last = None
+        self._children = []
         self.max_children = max_children
+        self._invalid_children = set()
+
+    def _getChildren(self):
+        """Return the list of the children, in order.
+
+        Do not modify this list: use addChild and removeChild.
+
+        """
+        children = self._children
+        if children is None:
+            children = []
+            links = self._links
+            child = self._first
+            while child is not None:
+                children.append(child)
+                child = links[id(child)][1]
+            self._children = children
+        return children
+
+    children = property(_getChildren, None, None, "List of the children.")
+
+    def __iter__(self):
+        """Iterate over the children, in order."""
+        return iter(self.children)
 
     def __contains__(self, element):
         """Return True if element is a child of the container, False otherwise.
@@ -129,7 +162,7 @@ class Container(sizeable.Sizeable, parentable.Parentable):
 
         """
         is_parent_ok = element.parent is self
-        is_child_ok = element in self.children
+        is_child_ok = id(element) in self._links
         if is_parent_ok:
             if is_child_ok:
                 return True
@@ -170,11 +203,34 @@ class Container(sizeable.Sizeable, parentable.Parentable):
           requested size first.  True is a safer value, but using False can
           be useful for optimizing.
 
+        With False, the requested size stays invalid as long as some children
+        are: the next refreshRequestedSize refreshes them.  Otherwise a child
+        invalidated again would stop its walk up the tree at its invalid
+        parent, and never reach this container.
+
         """
         if forward_request:
             for child in self.children:
                 child.requestSize(forward_request)
+            self._invalid_children.clear()
         sizeable.Sizeable.requestSize(self, forward_request)
+        if self._invalid_children:
+            self.is_requested_size_valid = False
+
+    def refreshRequestedSize(self):
+        """Compute the requested size again, but only where it is invalid.
+
+        Only the children that have been invalidated since the last refresh
+        are refreshed, recursively.  Then the container computes its own
+        requested size from the cached requested sizes of its children.
+
+        """
+        if self.is_requested_size_valid:
+            return
+        invalid_children = self._invalid_children
+        while invalid_children:
+            invalid_children.pop().refreshRequestedSize()
+        sizeable.Sizeable.requestSize(self, False)
 
     def _allocateSize(self):
         """Defers the size allocation to the layout."""
@@ -182,6 +238,43 @@ class Container(sizeable.Sizeable, parentable.Parentable):
                                   self.requested_size,
                                   self.children)
 
+    def _forgetChild(self, child):
+        """Tell the layout, if any, that child was removed."""
+        if self._layout is not None:
+            self._layout.forgetChild(child)
+
+    def _link(self, child, previous, next_):
+        """Insert child between previous and next_, which can be None."""
+        links = self._links
+        links[id(child)] = [previous, next_, child]
+        if previous is None:
+            self._first = child
+        else:
+            links[id(previous)][1] = child
+        if next_ is None:
+            self._last = child
+        else:
+            links[id(next_)][0] = child
+        self._children = None
+
+    def _unlink(self, child):
+        """Remove child from the linked list.  Return False if not there."""
+        links = self._links
+        try:
+            previous, next_, unused = links.pop(id(child))
+        except KeyError:
+            return False
+        if previous is None:
+            self._first = next_
+        else:
+            links[id(previous)][1] = next_
+        if next_ is None:
+            self._last = previous
+        else:
+            links[id(next_)][0] = previous
+        self._children = None
+        return True
+
     def _insertChildIndex(self, child, index):
         """Insert child into children at the position index.
 
@@ -190,8 +283,9 @@ class Container(sizeable.Sizeable, parentable.Parentable):
         If index is out of the list of children, IndexError is raised.
 
         """
-        if 0 <= index < len(self.children):
-            self.children.insert(index, child)
+        if 0 <= index < len(self._links):
+            ref_child = self.children[index]
+            self._link(child, self._links[id(ref_child)][0], ref_child)
         else:
             raise IndexError('list index out of range')
 
@@ -207,12 +301,15 @@ class Container(sizeable.Sizeable, parentable.Parentable):
 
         """
         try:
-            index = self.children.index(ref_child)
-        except ValueError:
+            previous, next_, unused = self._links[id(ref_child)]
+        except KeyError:
             msg = "Reference element is not a child of that container."
             raise NotAChildError(msg)
-        self.children.insert(index + offset, child)
-            
+        if offset:
+            self._link(child, ref_child, next_)
+        else:
+            self._link(child, previous, ref_child)
+
 
     def _insertChild(self, child, where):
         """Insert a child in children at the position described by where.
@@ -334,10 +431,10 @@ class Container(sizeable.Sizeable, parentable.Parentable):
 
         """
         if where == 'end':
-            self.children.append(child)
+            self._link(child, self._last, None)
             return
         elif where == 'beginning':
-            self.children.insert(0, child)
+            self._link(child, None, self._first)
             return
 
         if not isinstance(where, tuple):
@@ -428,9 +525,22 @@ class Container(sizeable.Sizeable, parentable.Parentable):
             ...
             AlreadyParentError: Child already has a parent and cannot be added to this container.
 
+        """
+        self._adoptChild(child, where)
+        self._invalid_children.add(child)
+        self.invalidateRequestedSize()
+        self.invalidateAllocation()
+
+    def _adoptChild(self, child, where):
+        """Insert child like addChild does, but invalidate nothing.
+
+        Only for the containers that know that the new child does not change
+        their requested size, like a list replacing the rows it shows.  The
+        requested size of child must be valid already.
+
         """
         if self.max_children > -1:
-            if len(self.children) >= self.max_children:
+            if len(self._links) >= self.max_children:
                 msg = "Container capacity exceeded."
                 raise ContainerError(msg)
         if not hasattr(child, 'parent'):
@@ -445,6 +555,144 @@ class Container(sizeable.Sizeable, parentable.Parentable):
         self._insertChild(child, where)
         child.parent = self # Keep that for the end in case of failure above.
 
+    def _checkNewChildren(self, children, children_nb, reusable=()):
+        """Raise if one of children cannot be added to the container.
+
+        children_nb is the number of children the container will have.  The
+        children of the container whose ids are in reusable are accepted.
+
+        """
+        ids = set()
+        for child in children:
+            if not hasattr(child, 'parent'):
+                msg = "%r has no 'parent' attribute.  " \
+                      "Make sure it inherits from Parentable." % child
+                raise parentable.NoParentError(msg)
+            if child.parent is not None and id(child) not in reusable:
+                msg = "Child already has a parent and cannot be added to " \
+                      "this container."
+                raise parentable.AlreadyParentError(msg)
+            if id(child) in ids:
+                msg = "Child given twice."
+                raise ContainerError(msg)
+            ids.add(id(child))
+        if -1 < self.max_children < children_nb:
+            msg = "Container capacity exceeded."
+            raise ContainerError(msg)
+
+    def addChildren(self, children, where):
+        """Add several children to the container at once.
+
+        Parameters.
+        ===========
+
+        - children: an iterable of children to add.
+        - where: the position of the first child, see addChild.  The other
+          children follow it, in order.
+
+        Everything is checked before the container is modified: if one child
+        cannot be added, none is.  The requested size is invalidated once.
+
+            >>> from parentable import Parentable
+            >>> container = Container()
+            >>> first, last = Parentable(), Parentable()
+            >>> container.addChildren([first, last], 'end')
+            >>> children = [Parentable() for i in range(3)]
+            >>> container.addChildren(children, ('after', first))
+            >>> print container.children == [first] + children + [last]
+            True
+            >>> container.addChildren([last], 'end')
+            Traceback (most recent call last):
+            ...
+            AlreadyParentError: Child already has a parent and cannot be added to this container.
+
+        """
+        children = list(children)
+        if not children:
+            return
+        self._checkNewChildren(children, len(self._links) + len(children))
+        self._insertChild(children[0], where)
+        previous = children[0]
+        for child in children[1:]:
+            self._link(child, previous, self._links[id(previous)][1])
+            previous = child
+        for child in children:
+            child.parent = self
+        self._invalid_children.update(children)
+        self.invalidateRequestedSize()
+        self.invalidateAllocation()
+
+    def removeChildren(self, children):
+        """Remove several children from the container at once.
+
+        If one of them is not a child of the container, ContainerError is
+        raised and none is removed.  The requested size is invalidated once.
+
+            >>> from parentable import Parentable
+            >>> container = Container()
+            >>> children = [Parentable() for i in range(4)]
+            >>> container.addChildren(children, 'end')
+            >>> container.removeChildren(children[1:3])
+            >>> print container.children == [children[0], children[3]]
+            True
+
+        """
+        children = list(children)
+        links = self._links
+        if len(set(id(child) for child in children)) != len(children) or \
+           not all(id(child) in links for child in children):
+            msg = "Element is not a child of that container and cannot be " \
+                  "removed."
+            raise ContainerError(msg)
+        if not children:
+            return
+        for child in children:
+            self._unlink(child)
+            child.parent = None
+            self._forgetChild(child)
+        self._invalid_children.difference_update(children)
+        self.invalidateRequestedSize()
+        self.invalidateAllocation()
+
+    def replaceChildren(self, children):
+        """Replace all the children of the container with children, in order.
+
+        The current children that are in the new list stay in the container.
+        The others are removed.  Everything is checked before the container is
+        modified.  Return the list of the removed children.
+
+            >>> from parentable import Parentable
+            >>> container = Container()
+            >>> old = [Parentable() for i in range(3)]
+            >>> container.addChildren(old, 'end')
+            >>> new = [Parentable(), old[2]]
+            >>> removed = container.replaceChildren(new)
+            >>> print container.children == new, removed == old[:2]
+            True True
+
+        """
+        children = list(children)
+        links = self._links
+        self._checkNewChildren(children, len(children), links)
+        kept = set(id(child) for child in children)
+        removed = [child for child in self.children if id(child) not in kept]
+        added = [child for child in children if id(child) not in links]
+        self._links = {}
+        self._first = self._last = None
+        self._children = None
+        for child in children:
+            self._link(child, self._last, None)
+        for child in removed:
+            child.parent = None
+            self._forgetChild(child)
+        for child in added:
+            child.parent = self
+        self._invalid_children.difference_update(removed)
+        self._invalid_children.update(added)
+        self.invalidateRequestedSize()
+        self.invalidateAllocation()
+        return removed
+
     def removeChild(self, child):
         """Remove child from the container.
 
@@ -481,11 +729,20 @@ class Container(sizeable.Sizeable, parentable.Parentable):
             None
 
         """
-        try:
-            self.children.remove(child)
-        except ValueError:
+        self._disownChild(child)
+        self.invalidateRequestedSize()
+        self.invalidateAllocation()
+
+    def _disownChild(self, child):
+        """Remove child like removeChild does, but invalidate nothing.
+
+        The counterpart of _adoptChild.
+
+        """
+        if not self._unlink(child):
             msg = "Element is not a child of that container and cannot be " \
                   "removed."
             raise ContainerError(msg)
-        else:
-            child.parent = None
+        child.parent = None
+        self._forgetChild(child)
+        self._invalid_children.discard(child)
@@ -0,0 +1,465 @@
+#! /usr/bin/python
+"""Size negotiation of large trees stored in flat arrays.
+
+Created on Oct 18, 2026
+
+@author: Niriel
+
+A tree of Container and Sizeable objects costs a lot of memory and a lot of
+attribute lookups: each element has its own Size, SizeAllocation and Vector
+objects, a weak reference to its parent, a list of children...  That is fine
+for a dialog box, not for a list of 100000 items.
+
+A FlatLayoutTree stores the same information as a struct of arrays.  Each
+element of the tree is a node, identified by an integer index.  For each node,
+the tree stores in arrays of integers its kind, the index of its parent, its
+first child and its next sibling, its requested size and its allocated size.
+The size negotiation walks these indices and never creates any object.
+
+The nodes can be leaves, HBox, VBox, Border or Window nodes.  The arithmetic is
+the same as that of HBoxLayout, VBoxLayout, BorderLayout and WindowLayout; the
+box nodes even share the functions of the boxlayout module.  The numbers
+computed are therefore exactly those of the object-based engine.
+
+A parent is always added before its children.  Consequently the children of a
+node always have a higher index than the node itself: the requisition walks the
+indices backward (children first) and the allocation walks them forward
+(parents first).
+
+Existing Sizeable trees can be attached with the method attach.  After the size
+negotiation, writeBack gives the computed sizes back to the attached objects.
+
+>>> tree = FlatLayoutTree()
+>>> box = tree.addNode(HBOX, spacing=5)
+>>> tree.addNode(LEAF, box, width=10, height=20)
+1
+>>> tree.addNode(LEAF, box, width=30, height=10)
+2
+>>> tree.requestSizes()
+>>> print tree.getRequestedSize(box)
+(45, 20)
+>>> tree.allocateSize(box, 0, 0, 90, 20)
+>>> print tree.getAllocation(1)
+(0, 0, 21, 20)
+>>> print tree.getAllocation(2)
+(26, 0, 64, 20)
+
+"""
+
+from array import array
+from size import Size
+from size import FrozenSizeAllocation
+from sizeable import ExpandError
+from container import Container
+from boxlayout import HBoxLayout
+from boxlayout import VBoxLayout
+from boxlayout import RequestedLengths
+from boxlayout import ShrinkLengths
+from boxlayout import InflateLengths
+from boxlayout import IdealLengths
+from borderlayout import BorderLayout
+from windowlayout import WindowLayout
+import tools
+
+__all__ = ['FlatLayoutTree', 'LEAF', 'HBOX', 'VBOX', 'BORDER', 'WINDOW']
+
+LEAF = 0
+HBOX = 1
+VBOX = 2
+BORDER = 3
+WINDOW = 4
+
+# Exact classes only: a ScrollLayout is a WindowLayout but does not behave
+# like one.
+_KINDS = {HBoxLayout: HBOX,
+          VBoxLayout: VBOX,
+          BorderLayout: BORDER,
+          WindowLayout: WINDOW}
+
+
+class FlatLayoutTree(object):
+    """A tree of layout nodes stored as a struct of arrays."""
+
+    def __init__(self):
+        """Create an empty tree."""
+        object.__init__(self)
+        # Structure.
+        self.kind = array('b')
+        self.parent = array('l')
+        self.first_child = array('l')
+        self.last_child = array('l')
+        self.next_sibling = array('l')
+        # Parameters of the layouts.
+        self.spacing = array('l')
+        self.is_homogeneous = array('b')
+        self.margin_left = array('l')
+        self.margin_top = array('l')
+        self.margin_right = array('l')
+        self.margin_bottom = array('l')
+        self.can_expand_width = array('b')
+        self.can_expand_height = array('b')
+        # Sizes.  A forced length of -1 means no forced requested size.
+        self.forced_width = array('l')
+        self.forced_height = array('l')
+        self.requested_width = array('l')
+        self.requested_height = array('l')
+        self.allocated_left = array('l')
+        self.allocated_top = array('l')
+        self.allocated_width = array('l')
+        self.allocated_height = array('l')
+        # Sizeable objects attached to the nodes, or None.
+        self._objects = []
+
+    def __len__(self):
+        """Return the number of nodes."""
+        return len(self.kind)
+
+    def addNode(self, kind, parent=-1, width=0, height=0, spacing=0,
+                is_homogeneous=False, margins=(0, 0, 0, 0),
+                can_expand_width=True, can_expand_height=True):
+        """Add a node at the end of the children of parent, return its index.
+
+        Parameters.
+        ===========
+
+        * kind: LEAF, HBOX, VBOX, BORDER or WINDOW.
+        * parent: index of the parent node, -1 for a root.
+        * width, height: requested size of a LEAF.  Ignored for the other
+          kinds, whose requested size is computed.
+        * spacing, is_homogeneous: used by HBOX and VBOX.
+        * margins: (left, top, right, bottom), used by BORDER.
+        * can_expand_width, can_expand_height: booleans, like the attributes
+          of the Sizeable objects.
+
+        """
+        index = len(self.kind)
+        if parent >= index:
+            raise ValueError("The parent must be added before its children.")
+        self.kind.append(kind)
+        self.parent.append(parent)
+        self.first_child.append(-1)
+        self.last_child.append(-1)
+        self.next_sibling.append(-1)
+        self.spacing.append(spacing)
+        self.is_homogeneous.append(bool(is_homogeneous))
+        left, top, right, bottom = margins
+        self.margin_left.append(left)
+        self.margin_top.append(top)
+        self.margin_right.append(right)
+        self.margin_bottom.append(bottom)
+        self.can_expand_width.append(bool(can_expand_width))
+        self.can_expand_height.append(bool(can_expand_height))
+        self.forced_width.append(-1)
+        self.forced_height.append(-1)
+        self.requested_width.append(width)
+        self.requested_height.append(height)
+        self.allocated_left.append(0)
+        self.allocated_top.append(0)
+        self.allocated_width.append(0)
+        self.allocated_height.append(0)
+        self._objects.append(None)
+        if parent >= 0:
+            if self.first_child[parent] < 0:
+                self.first_child[parent] = index
+            else:
+                self.next_sibling[self.last_child[parent]] = index
+            self.last_child[parent] = index
+        return index
+
+    def getChildren(self, index):
+        """Return the list of the indices of the children of a node."""
+        children = []
+        child = self.first_child[index]
+        next_sibling = self.next_sibling
+        while child >= 0:
+            children.append(child)
+            child = next_sibling[child]
+        return children
+
+    def setLeafSize(self, index, width, height):
+        """Change the requested size of a LEAF node."""
+        self.requested_width[index] = width
+        self.requested_height[index] = height
+
+    def setForcedRequestedSize(self, index, forced_size):
+        """Force the requested size of a node, or stop forcing it with None.
+
+        forced_size is a Size object, like Sizeable.forced_requested_size.
+
+        """
+        if forced_size is None:
+            self.forced_width[index] = -1
+            self.forced_height[index] = -1
+        else:
+            self.forced_width[index] = forced_size.width
+            self.forced_height[index] = forced_size.height
+
+    def getRequestedSize(self, index):
+        """Return the requested size of a node as a (width, height) tuple."""
+        return self.requested_width[index], self.requested_height[index]
+
+    def getAllocation(self, index):
+        """Return the allocation of a node as a (left, top, width, height)."""
+        return (self.allocated_left[index], self.allocated_top[index],
+                self.allocated_width[index], self.allocated_height[index])
+
+    def attach(self, sizeable, parent=-1):
+        """Add a Sizeable object and all its descendants to the tree.
+
+        Containers must have a HBoxLayout, VBoxLayout, BorderLayout or
+        WindowLayout.  Any other Sizeable object becomes a LEAF whose requested
+        size is that of the object, refreshed if needed.
+
+        Return the index of the node of sizeable.
+
+        """
+        if isinstance(sizeable, Container):
+            layout = sizeable._layout
+            try:
+                kind = _KINDS[layout.__class__]
+            except KeyError:
+                msg = "%s not supported by FlatLayoutTree." % \
+                      layout.__class__.__name__
+                raise ValueError(msg)
+            margins = (0, 0, 0, 0)
+            spacing = is_homogeneous = 0
+            if kind == BORDER:
+                margins = (layout.left, layout.top, layout.right,
+                           layout.bottom)
+            elif kind != WINDOW:
+                spacing = layout.spacing
+                is_homogeneous = layout.is_homogeneous
+            index = self.addNode(kind, parent, spacing=spacing,
+                                 is_homogeneous=is_homogeneous,
+                                 margins=margins,
+                                 can_expand_width=sizeable.can_expand_width,
+                                 can_expand_height=sizeable.can_expand_height)
+            self.setForcedRequestedSize(index, sizeable.forced_requested_size)
+            for child in sizeable.children:
+                self.attach(child, index)
+        else:
+            sizeable.refreshRequestedSize()
+            requested_size = sizeable.requested_size
+            index = self.addNode(LEAF, parent, requested_size.width,
+                                 requested_size.height,
+                                 can_expand_width=sizeable.can_expand_width,
+                                 can_expand_height=sizeable.can_expand_height)
+        self._objects[index] = sizeable
+        return index
+
+    def getObject(self, index):
+        """Return the Sizeable object attached to a node, or None."""
+        return self._objects[index]
+
+    def requestSizes(self):
+        """Compute the requested size of all the nodes, children first."""
+        kinds = self.kind
+        requested_width = self.requested_width
+        requested_height = self.requested_height
+        for index in xrange(len(kinds) - 1, -1, -1):
+            kind = kinds[index]
+            if kind == LEAF:
+                continue
+            children = self.getChildren(index)
+            if kind == HBOX:
+                width, height = RequestedLengths(
+                    [requested_width[child] for child in children],
+                    [requested_height[child] for child in children],
+                    self.spacing[index], self.is_homogeneous[index])
+            elif kind == VBOX:
+                height, width = RequestedLengths(
+                    [requested_height[child] for child in children],
+                    [requested_width[child] for child in children],
+                    self.spacing[index], self.is_homogeneous[index])
+            elif kind == BORDER:
+                assert len(children) == 1
+                child = children[0]
+                width = requested_width[child] + self.margin_left[index] + \
+                        self.margin_right[index]
+                height = requested_height[child] + self.margin_top[index] + \
+                         self.margin_bottom[index]
+            else:
+                width = height = 0
+                for child in children:
+                    width = max(width, requested_width[child])
+                    height = max(height, requested_height[child])
+            if self.forced_width[index] >= 0:
+                width = self.forced_width[index]
+                height = self.forced_height[index]
+            requested_width[index] = width
+            requested_height[index] = height
+
+    def allocateSize(self, index, left, top, width, height):
+        """Allocate the size of a node, then of all its descendants.
+
+        The requested sizes must be up to date: call requestSizes first.
+        Raise ExpandError in the same situations as the object-based engine.
+
+        """
+        self.allocated_left[index] = left
+        self.allocated_top[index] = top
+        self.allocated_width[index] = width
+        self.allocated_height[index] = height
+        stack = [index]
+        while stack:
+            index = stack.pop()
+            self._checkExpand(index)
+            children = self.getChildren(index)
+            if not children:
+                continue
+            kind = self.kind[index]
+            if kind == HBOX or kind == VBOX:
+                self._allocateBox(index, children)
+            elif kind == BORDER:
+                self._allocateBorder(index, children)
+            else:
+                for child in children:
+                    self._setAllocation(child, 0, 0,
+                                        self.allocated_width[index],
+                                        self.allocated_height[index])
+            # Reversed, so that the first child is processed first, like the
+            # depth-first recursion of the object-based engine.
+            children.reverse()
+            stack.extend(children)
+
+    def negotiateSize(self):
+        """Request the sizes, then give each root its requested size.
+
+        The position of the roots is not modified.
+
+        """
+        self.requestSizes()
+        parents = self.parent
+        for index in xrange(len(parents)):
+            if parents[index] < 0:
+                self.allocateSize(index, self.allocated_left[index],
+                                  self.allocated_top[index],
+                                  self.requested_width[index],
+                                  self.requested_height[index])
+
+    def writeBack(self):
+        """Give the computed sizes back to the attached Sizeable objects.
+
+        The requested_size and allocated_size attributes of the objects are
+        replaced, and their caches marked as valid.  Leaves have their
+        _allocateSize called so that they can update their sprite for example.
+        Containers do not: their layout would do the allocation again.
+
+        """
+        for index, sizeable in enumerate(self._objects):
+            if sizeable is None:
+                continue
+            sizeable.requested_size = Size(self.requested_width[index],
+                                           self.requested_height[index])
+            sizeable.allocated_size = FrozenSizeAllocation(
+                (self.allocated_left[index], self.allocated_top[index]),
+                (self.allocated_width[index], self.allocated_height[index]))
+            sizeable.is_requested_size_valid = True
+            sizeable.is_allocation_valid = True
+            if self.kind[index] == LEAF:
+                sizeable._allocateSize()
+
+    def _setAllocation(self, index, left, top, width, height):
+        """Store the allocation of a node."""
+        self.allocated_left[index] = left
+        self.allocated_top[index] = top
+        self.allocated_width[index] = width
+        self.allocated_height[index] = height
+
+    def _checkExpand(self, index):
+        """Raise ExpandError if the node is expanded against its will."""
+        if not self.can_expand_width[index]:
+            if self.allocated_width[index] > self.requested_width[index]:
+                raise ExpandError()
+        if not self.can_expand_height[index]:
+            if self.allocated_height[index] > self.requested_height[index]:
+                raise ExpandError()
+
+    def _allocateBox(self, index, children):
+        """Allocate the size of the children of a HBOX or VBOX node."""
+        if self.kind[index] == HBOX:
+            primary_coords, secondary_coords = (self.allocated_left,
+                                                self.allocated_top)
+            primary_lengths, secondary_lengths = (self.allocated_width,
+                                                  self.allocated_height)
+            requested_primary, requested_secondary = (self.requested_width,
+                                                      self.requested_height)
+            primary_expand, secondary_expand = (self.can_expand_width,
+                                                self.can_expand_height)
+        else:
+            primary_coords, secondary_coords = (self.allocated_top,
+                                                self.allocated_left)
+            primary_lengths, secondary_lengths = (self.allocated_height,
+                                                  self.allocated_width)
+            requested_primary, requested_secondary = (self.requested_height,
+                                                      self.requested_width)
+            primary_expand, secondary_expand = (self.can_expand_height,
+                                                self.can_expand_width)
+        allocated_primary = primary_lengths[index]
+        allocated_secondary = secondary_lengths[index]
+        msg = "Cannot inflate a BoxLayout if no widget can expand."
+        if allocated_primary > requested_primary[index]:
+            if not [child for child in children if primary_expand[child]]:
+                raise ExpandError(msg)
+        if allocated_secondary > requested_secondary[index]:
+            if not [child for child in children if secondary_expand[child]]:
+                raise ExpandError(msg)
+        lengths = [requested_primary[child] for child in children]
+        spacing = self.spacing[index]
+        is_homogeneous = self.is_homogeneous[index]
+        primary_coord = primary_coords[index]
+        if allocated_primary > requested_primary[index]:
+            expandables = [primary_expand[child] for child in children]
+            coords, lengths = InflateLengths(primary_coord, allocated_primary,
+                                             lengths, expandables, spacing,
+                                             is_homogeneous)
+        elif allocated_primary < requested_primary[index]:
+            coords, lengths = ShrinkLengths(primary_coord, allocated_primary,
+                                            lengths, spacing, is_homogeneous)
+        else:
+            coords, lengths = IdealLengths(primary_coord, lengths, spacing,
+                                           is_homogeneous)
+        secondary_coord = secondary_coords[index]
+        for child, coord, length in zip(children, coords, lengths):
+            primary_coords[child] = coord
+            primary_lengths[child] = length
+            secondary_coords[child] = secondary_coord
+            secondary_lengths[child] = allocated_secondary
+
+    def _allocateBorder(self, index, children):
+        """Allocate the size of the child of a BORDER node.
+
+        Same arithmetic as BorderLayout.allocateSize.
+
+        """
+        assert len(children) == 1
+        child = children[0]
+        left, child_width = self._shareBorder(
+            self.allocated_width[index], self.margin_left[index],
+            self.margin_right[index], self.requested_width[child],
+            self.can_expand_width[child])
+        top, child_height = self._shareBorder(
+            self.allocated_height[index], self.margin_top[index],
+            self.margin_bottom[index], self.requested_height[child],
+            self.can_expand_height[child])
+        self._setAllocation(child, self.allocated_left[index] + left,
+                            self.allocated_top[index] + top,
+                            child_width, child_height)
+
+    @staticmethod
+    def _shareBorder(allocated, first, second, requested, can_expand):
+        """Share a length between two margins and a child.
+
+        Return (offset of the child, length of the child).
+
+        """
+        border = first + second
+        child = allocated - border
+        if child < 0:
+            child = 0
+            border = allocated
+        elif child > requested and not can_expand:
+            child = requested
+            border = allocated - child
+        unused, lengths = tools.Homothecy([first, second], border)
+        return lengths[0], child
@@ -0,0 +1,299 @@
+#! /usr/bin/python
+"""
+Created on Oct 18, 2026
+
+@author: Niriel
+"""
+
+from size import Size
+from size import FrozenSizeAllocation
+from sizeable import ExpandError
+from layout import Layout
+from boxlayout import ShrinkLengths
+from boxlayout import InflateLengths
+from boxlayout import IdealLengths
+from tools import Homothecy
+
+__all__ = ['GridLayout', 'TrackLengths']
+
+
+def _Grow(lengths, first, span, spacing, needed):
+    """Make lengths[first:first + span] and the spacings hold needed.
+
+    This is how the cells spanning several tracks (columns or rows) are
+    accommodated: if the tracks they span are too small, the missing length is
+    shared among them, proportionally to their current lengths.
+
+    """
+    available = sum(lengths[first:first + span]) + spacing * (span - 1)
+    if needed > available:
+        extended = needed - spacing * (span - 1)
+        unused, grown = Homothecy(lengths[first:first + span], extended)
+        lengths[first:first + span] = grown
+
+
+def TrackLengths(coord, length, lengths, expandables, spacing):
+    """Return the coords and lengths of tracks allocated length.
+
+    A track is a column or a row of a grid.  The tracks behave like the
+    children of a heterogeneous box: they get their requested lengths, or
+    shrink proportionally, or share the extra length among the expandable
+    tracks.
+
+    Parameters.
+    ===========
+
+    * coord, length: the coordinate and the length allocated to the grid.
+    * lengths: the lengths requested by the tracks.
+    * expandables: one boolean per track, True if the track can expand.
+    * spacing: the space between two tracks.
+
+    >>> print TrackLengths(10, 56, [20, 30], [False, True], 3)
+    ([10, 33], [20, 33])
+    >>> print TrackLengths(10, 0, [20], [True], 3)
+    ([10], [0])
+
+    """
+    requested = sum(lengths) + spacing * (len(lengths) - 1)
+    if length > requested:
+        if not any(expandables):
+            msg = "Cannot inflate a GridLayout if no widget can expand."
+            raise ExpandError(msg)
+        return InflateLengths(coord, length, lengths, expandables, spacing,
+                              False)
+    if length < requested:
+        if len(lengths) == 1:
+            # No spacing to shrink: the only track gets all there is.
+            return [coord], [length]
+        return ShrinkLengths(coord, length, lengths, spacing, False)
+    return IdealLengths(coord, lengths, spacing, False)
+
+
+class GridLayout(Layout):
+    """A GridLayout places its children in the cells of a table.
+
+    Each child occupies one cell, or a rectangle of several cells when it spans
+    several columns or rows.  All the cells of a column have the same width and
+    all the cells of a row have the same height: unlike boxes nested in boxes,
+    the columns are aligned.
+
+    The children must be placed in the grid with the method attach before the
+    size negotiation.  Then the layout works in two passes over the children:
+
+    1. the width of each column is the largest width requested by the children
+       it contains, and the height of each row the largest height,
+    2. the columns and the rows get their coordinates and their lengths, like
+       the children of a heterogeneous box, and each child receives the
+       rectangle of the cells it spans.
+
+    A column can expand when one of the children it contains has
+    can_expand_width set to True, a row when one of its children has
+    can_expand_height.  A child that cannot expand and whose cells are bigger
+    than its requested size keeps its requested size, in the top left corner of
+    its cells.
+
+    >>> from container import Container
+    >>> from sizeable import Sizeable
+    >>> from parentable import Parentable
+    >>> class Leaf(Sizeable, Parentable):
+    ...     def __init__(self, width, height):
+    ...         Sizeable.__init__(self)
+    ...         Parentable.__init__(self)
+    ...         self.size = Size(width, height)
+    ...     def _requestSize(self):
+    ...         return self.size.copy()
+    ...     def _allocateSize(self):
+    ...         pass
+    >>> grid = Container()
+    >>> grid._layout = GridLayout(2)
+    >>> title = Leaf(50, 10)
+    >>> cells = [Leaf(10, 10), Leaf(30, 20), Leaf(20, 10), Leaf(10, 15)]
+    >>> grid._layout.attach(title, 0, 0, colspan=2)
+    >>> for i, cell in enumerate(cells):
+    ...     grid._layout.attach(cell, 1 + i // 2, i % 2)
+    >>> for child in [title] + cells:
+    ...     grid.addChild(child, 'end')
+    >>> grid.negotiateSize(True)
+    >>> print grid.requested_size
+    Size(52, 49)
+    >>> for child in [title] + cells:
+    ...     print child.allocated_size
+    FrozenSizeAllocation(FrozenPos(0, 0), FrozenSize(52, 10))
+    FrozenSizeAllocation(FrozenPos(0, 12), FrozenSize(20, 20))
+    FrozenSizeAllocation(FrozenPos(22, 12), FrozenSize(30, 20))
+    FrozenSizeAllocation(FrozenPos(0, 34), FrozenSize(20, 15))
+    FrozenSizeAllocation(FrozenPos(22, 34), FrozenSize(30, 15))
+
+    """
+
+    def __init__(self, spacing=0):
+        """Initialize a new GridLayout object.
+
+        spacing is the space between two columns and between two rows.
+
+        """
+        Layout.__init__(self)
+        self.spacing = spacing
+        self._cells = {}
+
+    def _cacheParameters(self, children):
+        """Return the spacing and the cells of the children."""
+        return self.spacing, tuple([self.getCell(child) for child in children])
+
+    def attach(self, child, row, column, rowspan=1, colspan=1):
+        """Place child in the grid.
+
+        Parameters.
+        ===========
+
+        * child: a Sizeable object, added or to be added to the container of
+          this layout.
+        * row, column: integers, the top left cell of the child, from 0.
+        * rowspan, colspan: integers, the number of rows and columns spanned by
+          the child, at least 1.
+
+        Attaching a child again moves it.  When the child is already in its
+        container, the requested size and the allocation of the container are
+        invalidated: the next negotiation places the child in its new cells.
+
+        A child removed from the container is detached automatically: attach
+        it again before adding it back.
+
+        """
+        if row < 0 or column < 0:
+            raise ValueError("Row and column cannot be negative.")
+        if rowspan < 1 or colspan < 1:
+            raise ValueError("A child spans at least one row and one column.")
+        self._cells[child] = (row, column, rowspan, colspan)
+        container = getattr(child, 'parent', None)
+        if container is not None:
+            container.invalidateRequestedSize()
+            container.invalidateAllocation()
+
+    def detach(self, child):
+        """Forget the position of child in the grid."""
+        del self._cells[child]
+
+    def forgetChild(self, child):
+        """Detach child, removed from the container, if it was attached."""
+        self._cells.pop(child, None)
+
+    def getCell(self, child):
+        """Return (row, column, rowspan, colspan) for child."""
+        try:
+            return self._cells[child]
+        except KeyError:
+            raise ValueError("Child not attached to the GridLayout, call "
+                             "attach first.")
+
+    def _getCells(self, children):
+        """Return the list of the cells of the children and the grid size.
+
+        The grid size is the number of columns and the number of rows.
+
+        """
+        cells = [self.getCell(child) for child in children]
+        columns_nb = rows_nb = 0
+        for row, column, rowspan, colspan in cells:
+            if column + colspan > columns_nb:
+                columns_nb = column + colspan
+            if row + rowspan > rows_nb:
+                rows_nb = row + rowspan
+        return cells, columns_nb, rows_nb
+
+    def _requestedLengths(self, children, cells, columns_nb, rows_nb):
+        """Return the lists of the requested widths and heights of the tracks.
+
+        First pass: the children spanning one track set its length.  Then the
+        tracks spanned by the other children grow if needed.
+
+        """
+        widths = [0] * columns_nb
+        heights = [0] * rows_nb
+        spanning = []
+        for child, cell in zip(children, cells):
+            row, column, rowspan, colspan = cell
+            requested_size = child.requested_size
+            if colspan == 1:
+                if requested_size.width > widths[column]:
+                    widths[column] = requested_size.width
+            if rowspan == 1:
+                if requested_size.height > heights[row]:
+                    heights[row] = requested_size.height
+            if colspan > 1 or rowspan > 1:
+                spanning.append((requested_size, cell))
+        spacing = self.spacing
+        for requested_size, (row, column, rowspan, colspan) in spanning:
+            if colspan > 1:
+                _Grow(widths, column, colspan, spacing, requested_size.width)
+            if rowspan > 1:
+                _Grow(heights, row, rowspan, spacing, requested_size.height)
+        return widths, heights
+
+    def requestSize(self, children):
+        """Compute the requested size of the GridLayout.
+
+        The requested width is the sum of the widths of the columns plus the
+        spacing, and likewise for the height.
+
+        """
+        cells, columns_nb, rows_nb = self._getCells(children)
+        widths, heights = self._requestedLengths(children, cells, columns_nb,
+                                                 rows_nb)
+        spacing = self.spacing
+        return Size(sum(widths) + spacing * max(0, columns_nb - 1),
+                    sum(heights) + spacing * max(0, rows_nb - 1))
+
+    def allocateSize(self, allocated_size, requested_size, children):
+        """Allocate the columns and the rows, then the children.
+
+        The columns and the rows are allocated like the children of a
+        heterogeneous box.  Each child receives the rectangle of its cells, or
+        its requested size in the directions where it cannot expand.
+
+        Allocating more than the requested size raises an ExpandError when no
+        column (or row) can expand.
+
+        Like BoxLayout, a GridLayout having a cache reuses the allocations
+        stored in it.
+
+        """
+        if not children:
+            return
+        key = None
+        if self.cache is not None:
+            key = self._cacheKey(allocated_size, requested_size, children)
+            if self._allocateFromCache(allocated_size, key, children):
+                return
+        cells, columns_nb, rows_nb = self._getCells(children)
+        widths, heights = self._requestedLengths(children, cells, columns_nb,
+                                                 rows_nb)
+        expandable_columns = [False] * columns_nb
+        expandable_rows = [False] * rows_nb
+        for child, (row, column, rowspan, colspan) in zip(children, cells):
+            if child.can_expand_width:
+                expandable_columns[column:column + colspan] = [True] * colspan
+            if child.can_expand_height:
+                expandable_rows[row:row + rowspan] = [True] * rowspan
+        lefts, widths = TrackLengths(allocated_size.left,
+                                     allocated_size.width, widths,
+                                     expandable_columns, self.spacing)
+        tops, heights = TrackLengths(allocated_size.top,
+                                     allocated_size.height, heights,
+                                     expandable_rows, self.spacing)
+        for child, (row, column, rowspan, colspan) in zip(children, cells):
+            left = lefts[column]
+            top = tops[row]
+            last = column + colspan - 1
+            width = lefts[last] + widths[last] - left
+            last = row + rowspan - 1
+            height = tops[last] + heights[last] - top
+            requested_size = child.requested_size
+            if not child.can_expand_width and width > requested_size.width:
+                width = requested_size.width
+            if not child.can_expand_height and height > requested_size.height:
+                height = requested_size.height
+            child.allocateSize(FrozenSizeAllocation((left, top),
+                                                    (width, height)))
+        if key is not None:
+            self._storeInCache(allocated_size, key, children)
@@ -5,6 +5,8 @@ Created on Dec 12, 2010
 @author: Niriel
 """
 
+from size import FrozenSizeAllocation
+
 __all__ = ['Layout']
 
 class Layout(object):
@@ -15,7 +17,16 @@ class Layout(object):
 
     This class is abstract.
 
+    A layout whose cache attribute is a layoutcache.LayoutCache remembers the
+    allocations of its children, if it supports it.  The subclasses supporting
+    it implement _cacheParameters and call _allocateFromCache and
+    _storeInCache in their allocateSize.
+
     """
+
+    # Opt-in memo of the allocations, shared or not between layouts.
+    cache = None
+
     def requestSize(self, children):
         """Does the actual computation of the requested size.
 
@@ -45,3 +56,58 @@ class Layout(object):
 
         """
         raise NotImplementedError("Class is abstract.")
+
+    def forgetChild(self, child):
+        """Forget what the layout knows about child, removed from its container.
+
+        The container calls this method when it loses a child.  Layouts that
+        store something per child override it; the others have nothing to do.
+
+        """
+        pass
+
+    def _cacheParameters(self, children):
+        """Return a hashable object describing the parameters of the layout.
+
+        Everything that the allocation of the children depends on, besides
+        the allocated size, the requested size and the requested sizes and
+        expansion flags of the children, must be in there.
+
+        """
+        raise NotImplementedError("Layout %s cannot be cached." %
+                                  self.__class__.__name__)
+
+    def _cacheKey(self, allocated_size, requested_size, children):
+        """Return the key of the allocation of the children in the cache."""
+        return (self.__class__, self._cacheParameters(children),
+                allocated_size.width, allocated_size.height,
+                requested_size.width, requested_size.height,
+                tuple([(child.requested_size.width,
+                        child.requested_size.height,
+                        child.can_expand_width, child.can_expand_height)
+                       for child in children]))
+
+    def _allocateFromCache(self, allocated_size, key, children):
+        """Allocate the children from the cache, return False if not there."""
+        rects = self.cache.get(key)
+        if rects is None:
+            return False
+        left = allocated_size.left
+        top = allocated_size.top
+        for child, (rel_left, rel_top, width, height) in zip(children, rects):
+            child.allocateSize(FrozenSizeAllocation((left + rel_left,
+                                                     top + rel_top),
+                                                    (width, height)))
+        return True
+
+    def _storeInCache(self, allocated_size, key, children):
+        """Store the allocations of the children, relative to allocated_size.
+        """
+        left = allocated_size.left
+        top = allocated_size.top
+        rects = []
+        for child in children:
+            child_size = child.allocated_size
+            rects.append((child_size.left - left, child_size.top - top,
+                          child_size.width, child_size.height))
+        self.cache.put(key, tuple(rects))
@@ -0,0 +1,91 @@
+#! /usr/bin/python
+"""Memo of the allocations computed by the layouts.
+
+Created on Oct 18, 2026
+
+@author: Niriel
+
+A list of identical rows makes the layout of each row compute the same thing:
+same children requesting the same sizes, same allocated width.  A LayoutCache
+remembers the rectangles given to the children, relative to the origin of the
+allocation, for the last combinations it saw.  When the same combination comes
+back, the layout translates the stored rectangles instead of computing them.
+
+The cache is opt-in: give a LayoutCache to the cache attribute of a layout.
+Several layouts can share the same cache, this is the point for identical
+rows.  BoxLayout and GridLayout support it.
+
+"""
+
+from collections import OrderedDict
+
+__all__ = ['LayoutCache']
+
+
+class LayoutCache(object):
+    """A bounded LRU memo of relative child rectangles.
+
+    The keys are built by the layouts, see Layout._cacheKey.  The values are
+    tuples of rectangles (left, top, width, height) relative to the origin of
+    the allocation, one per child.
+
+    >>> cache = LayoutCache(2)
+    >>> cache.put('a', ((0, 0, 10, 10),))
+    >>> cache.put('b', ((0, 0, 20, 10),))
+    >>> print cache.get('a')
+    ((0, 0, 10, 10),)
+    >>> cache.put('c', ((0, 0, 30, 10),)) # 'b' is the least recently used.
+    >>> print cache.get('b')
+    None
+    >>> print len(cache), cache.hits, cache.misses
+    2 1 1
+
+    """
+
+    def __init__(self, capacity=128):
+        """Initialize a new LayoutCache holding at most capacity entries."""
+        object.__init__(self)
+        if capacity < 1:
+            raise ValueError("A LayoutCache holds at least one entry.")
+        self.capacity = capacity
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """Return the rectangles stored for key, or None."""
+        entries = self._entries
+        try:
+            value = entries.pop(key)
+        except KeyError:
+            self.misses += 1
+            return None
+        entries[key] = value # Most recently used.
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """Store the rectangles of key, forgetting the oldest if full."""
+        entries = self._entries
+        entries.pop(key, None)
+        entries[key] = value
+        if len(entries) > self.capacity:
+            entries.popitem(last=False)
+
+    def clear(self):
+        """Forget all the entries.  The counters are kept."""
+        self._entries.clear()
+
+    def getStats(self):
+        """Return a dict with the keys 'hits', 'misses', 'size', 'capacity'.
+        """
+        return {'hits': self.hits, 'misses': self.misses,
+                'size': len(self._entries), 'capacity': self.capacity}
+
+    def resetStats(self):
+        """Set the hit and miss counters back to 0."""
+        self.hits = 0
+        self.misses = 0
@@ -19,7 +19,21 @@ class AlreadyParentError(ParentableError):
     """Parentable already has a parent."""
 
 class Parentable(object):
-    """Inherit from this class objects you want to put in a container."""
+    """Inherit from this class objects you want to put in a container.
+
+    The class attribute tree_version is incremented each time a Parentable
+    object changes of parent.  Whatever is computed from the shape of the
+    trees, like the depth of a node, can be cached along with the version it
+    was computed for, and recomputed only when the version changed::
+
+        >>> version = Parentable.tree_version
+        >>> Parentable().parent = Parentable()
+        >>> Parentable.tree_version == version + 1
+        True
+
+    """
+    tree_version = 0
+
     def __init__(self):
         """Initialize a Parentable object.
 
@@ -39,6 +53,7 @@ class Parentable(object):
         return self._parent()
     def _setParent(self, parent):
         """Create a weakref to the parent, or set _parent to None."""
+        Parentable.tree_version += 1
         if parent is None:
             self._parent = None
         else:
@@ -5,7 +5,7 @@ Created on Dec 12, 2010
 @author: Niriel
 """
 
-from size import SizeAllocation
+from size import FrozenSizeAllocation
 from windowlayout import WindowLayout
 
 __all__ = ['ScrollLayout']
@@ -31,4 +31,4 @@ class ScrollLayout(WindowLayout):
         """
         max_size = allocated_size.size | requested_size
         for child in children:
-            child.allocateSize(SizeAllocation((0, 0), max_size))
+            child.allocateSize(FrozenSizeAllocation((0, 0), max_size))
@@ -16,10 +16,24 @@ The present module defines
     - a Size class, extending Vector for sizes.
     - a SizeAllocation class, binding a Pos and a Size together.
 
+These classes are mutable.  Each of them has an immutable counterpart:
+FrozenVector, FrozenPos, FrozenSize and FrozenSizeAllocation.  The frozen
+classes are tuples: they are compact, they have no __dict__ and they can be
+shared without being copied.  Their copy method returns the object itself.
+FrozenSizeAllocation is a flat (left, top, width, height) tuple, there is no
+Pos nor Size object inside.
+
+The frozen objects provide the same read-only interface as the mutable ones
+and compare equal to them.  The methods freeze and thaw convert from one kind
+to the other.  The layouts produce frozen allocations.
+
 """
 
+from operator import itemgetter
 
-__all__ = ['Size', 'Pos', 'SizeAllocation']
+
+__all__ = ['Size', 'Pos', 'SizeAllocation', 'FrozenSize', 'FrozenPos',
+           'FrozenSizeAllocation']
 
 # pylint: disable-msg=C0103
 # Because I like c1 and c2 as variable names. 
@@ -204,8 +218,10 @@ class Vector(object):
         Vector(1, 4)
 
         """
-        return self.__class__(min([self.c1, other.c1]),
-                              min([self.c2, other.c2]))
+        c1, c2 = self.c1, self.c2
+        other_c1, other_c2 = other.c1, other.c2
+        return self.__class__(other_c1 if other_c1 < c1 else c1,
+                              other_c2 if other_c2 < c2 else c2)
 
     def __or__(self, other):
         """Return a new Vector with the biggest coordinates.
@@ -227,8 +243,10 @@ class Vector(object):
         Vector(3, 5)
 
         """
-        return self.__class__(max([self.c1, other.c1]),
-                              max([self.c2, other.c2]))
+        c1, c2 = self.c1, self.c2
+        other_c1, other_c2 = other.c1, other.c2
+        return self.__class__(other_c1 if other_c1 > c1 else c1,
+                              other_c2 if other_c2 > c2 else c2)
 
     def __iadd__(self, other):
         """Add the coordinates in place.
@@ -294,8 +312,10 @@ class Vector(object):
         Vector(1, 4)
 
         """
-        self.c1 = min([self.c1, other.c1])
-        self.c2 = min([self.c2, other.c2])
+        if other.c1 < self.c1:
+            self.c1 = other.c1
+        if other.c2 < self.c2:
+            self.c2 = other.c2
         return self
 
     def __ior__(self, other):
@@ -310,8 +330,10 @@ class Vector(object):
         Vector(3, 5)
 
         """
-        self.c1 = max([self.c1, other.c1])
-        self.c2 = max([self.c2, other.c2])
+        if other.c1 > self.c1:
+            self.c1 = other.c1
+        if other.c2 > self.c2:
+            self.c2 = other.c2
         return self
 
     def subZero(self, other):
@@ -406,6 +428,18 @@ class Vector(object):
         """
         return self.c1, self.c2
 
+    def freeze(self):
+        """Return an immutable copy of the object.
+
+        >>> v1 = Vector(1, 2)
+        >>> print v1.freeze()
+        FrozenVector(1, 2)
+        >>> print SizeAllocation((1, 2), (3, 4)).freeze()
+        FrozenSizeAllocation(FrozenPos(1, 2), FrozenSize(3, 4))
+
+        """
+        return FrozenVector(self.c1, self.c2)
+
     def _getC1(self):
         """Return _c1.
 
@@ -592,6 +626,10 @@ class Size(Vector):
             raise ValueError("Size.height must be positive, not %i." % value)
         self._c2 = value
 
+    def freeze(self):
+        """Return an immutable copy of the object: a FrozenSize."""
+        return FrozenSize(self.c1, self.c2)
+
     c1 = width = property(Vector._getC1, _setC1, None,
                           "Secured access to the width (c1).")
     c2 = height = property(Vector._getC2, _setC2, None,
@@ -604,6 +642,10 @@ class Pos(Vector):
     Two properties: x and y.
     
     """
+    def freeze(self):
+        """Return an immutable copy of the object: a FrozenPos."""
+        return FrozenPos(self.c1, self.c2)
+
     x = Vector.c1
     y = Vector.c2
 
@@ -688,6 +730,10 @@ class SizeAllocation(Vector):
         self.pos = other.pos.copy()
         self.size = other.size.copy()
 
+    def freeze(self):
+        """Return an immutable copy of the object: a FrozenSizeAllocation."""
+        return FrozenSizeAllocation(self.pos, self.size)
+
     def asDeepTuple(self):
         """Return a tuple of tuples.
 
@@ -794,5 +840,334 @@ class SizeAllocation(Vector):
     height = property(_getHeight, _setHeight, None,
                       "Convenient access to size.height.")
 
+
+def _CheckLength(value, name):
+    """Raise an error if value is not a valid width or height."""
+    if not isinstance(value, int):
+        raise TypeError("Size.%s must be an integer, not %r." % (name, value))
+    if value < 0:
+        raise ValueError("Size.%s must be positive, not %i." % (name, value))
+
+
+class FrozenVector(tuple):
+    """Immutable Vector, stored as a tuple (c1, c2).
+
+    >>> v = FrozenVector(1, 2)
+    >>> print v
+    FrozenVector(1, 2)
+    >>> print v + FrozenVector(3, 4)
+    FrozenVector(4, 6)
+    >>> print v == Vector(1, 2), Vector(1, 2) == v
+    True True
+    >>> print v.copy() is v
+    True
+    >>> print v.thaw()
+    Vector(1, 2)
+    >>> v.c1 = 3
+    Traceback (most recent call last):
+     ...
+    AttributeError: can't set attribute
+
+    The in-place operators create new objects.
+
+    >>> w = v
+    >>> w += FrozenVector(1, 1)
+    >>> print v, w
+    FrozenVector(1, 2) FrozenVector(2, 3)
+
+    """
+    __slots__ = ()
+
+    def __new__(cls, c1, c2):
+        """Create a new FrozenVector with coordinates c1 and c2."""
+        return tuple.__new__(cls, (c1, c2))
+
+    def __getnewargs__(self):
+        """Return the arguments of __new__, for copy and pickle."""
+        return tuple(self)
+
+    def __repr__(self):
+        """Return a string that Python can evaluate to create a similar object.
+        """
+        return "%s(%r, %r)" % (self.__class__.__name__, self[0], self[1])
+
+    def __eq__(self, other):
+        """Return True if c1 and c2 are equal, False otherwise."""
+        try:
+            return self[0] == other.c1 and self[1] == other.c2
+        except AttributeError:
+            return tuple.__eq__(self, other)
+
+    def __ne__(self, other):
+        """Return True if c1 or c2 differ, False otherwise."""
+        return not self == other
+
+    __hash__ = tuple.__hash__
+
+    def __add__(self, other):
+        """Return a new object with added coordinates."""
+        return self.__class__(self[0] + other.c1, self[1] + other.c2)
+
+    def __sub__(self, other):
+        """Return a new object with subtracted coordinates."""
+        return self.__class__(self[0] - other.c1, self[1] - other.c2)
+
+    def __mul__(self, other):
+        """Return a new object with coordinates multiplied by a scalar."""
+        return self.__class__(self[0] * other, self[1] * other)
+
+    __rmul__ = __mul__
+
+    def __div__(self, other):
+        """Return a new object with coordinates divided by a scalar."""
+        return self.__class__(self[0] / other, self[1] / other)
+
+    def __and__(self, other):
+        """Return a new object with the smallest coordinates.
+
+        >>> print FrozenSize(1, 5) & Size(3, 4)
+        FrozenSize(1, 4)
+
+        """
+        c1, c2 = self
+        other_c1, other_c2 = other.c1, other.c2
+        return self.__class__(other_c1 if other_c1 < c1 else c1,
+                              other_c2 if other_c2 < c2 else c2)
+
+    def __or__(self, other):
+        """Return a new object with the biggest coordinates.
+
+        >>> print FrozenSize(1, 5) | Size(3, 4)
+        FrozenSize(3, 5)
+
+        """
+        c1, c2 = self
+        other_c1, other_c2 = other.c1, other.c2
+        return self.__class__(other_c1 if other_c1 > c1 else c1,
+                              other_c2 if other_c2 > c2 else c2)
+
+    def subZero(self, other):
+        """Subtract the coordinates with a minimum of 0."""
+        c1, c2 = self
+        other_c1, other_c2 = other.c1, other.c2
+        return self.__class__(c1 - other_c1 if other_c1 < c1 else 0,
+                              c2 - other_c2 if other_c2 < c2 else 0)
+
+    def copy(self):
+        """Return the object itself: there is no need to copy it."""
+        return self
+
+    def __copy__(self):
+        """Return the object itself, for the copy module."""
+        return self
+
+    def __deepcopy__(self, memo):
+        """Return the object itself, for the copy module."""
+        return self
+
+    def freeze(self):
+        """Return the object itself: it is already immutable."""
+        return self
+
+    def thaw(self):
+        """Return a mutable copy of the object."""
+        return Vector(self[0], self[1])
+
+    def asTuple(self):
+        """Return a tuple (c1, c2)."""
+        return self[0], self[1]
+
+    c1 = property(itemgetter(0), None, None, "c1 coordinate.")
+    c2 = property(itemgetter(1), None, None, "c2 coordinate.")
+
+
+class FrozenSize(FrozenVector):
+    """Immutable Size.
+
+    >>> s = FrozenSize(1, 2)
+    >>> print s.width, s.height
+    1 2
+    >>> print s == Size(1, 2)
+    True
+    >>> FrozenSize(-42, 0)
+    Traceback (most recent call last):
+     ...
+    ValueError: Size.width must be positive, not -42.
+
+    """
+    __slots__ = ()
+
+    def __new__(cls, width, height):
+        """Create a FrozenSize object from a width and a height."""
+        _CheckLength(width, 'width')
+        _CheckLength(height, 'height')
+        return tuple.__new__(cls, (width, height))
+
+    occupiesSurface = Size.occupiesSurface.im_func
+
+    def thaw(self):
+        """Return a mutable copy of the object: a Size."""
+        return Size(self[0], self[1])
+
+    c1 = width = FrozenVector.c1
+    c2 = height = FrozenVector.c2
+
+
+class FrozenPos(FrozenVector):
+    """Immutable position.
+
+    >>> p = FrozenPos(1, 2)
+    >>> print p.x, p.y
+    1 2
+
+    """
+    __slots__ = ()
+
+    def thaw(self):
+        """Return a mutable copy of the object: a Pos."""
+        return Pos(self[0], self[1])
+
+    x = FrozenVector.c1
+    y = FrozenVector.c2
+
+
+class FrozenSizeAllocation(tuple):
+    """Immutable SizeAllocation, stored as a tuple (left, top, width, height).
+
+    The constructor takes the same parameters as SizeAllocation: a pos and a
+    size, as tuples or objects.  Unlike SizeAllocation, nothing is copied and
+    no Pos or Size object is stored: the pos and size attributes create them
+    when they are read.  Prefer left, top, width and height, which cost
+    nothing.
+
+    >>> sa = FrozenSizeAllocation((1, 2), Size(3, 4))
+    >>> print sa
+    FrozenSizeAllocation(FrozenPos(1, 2), FrozenSize(3, 4))
+    >>> print sa.left, sa.top, sa.width, sa.height
+    1 2 3 4
+    >>> print sa.pos, sa.size
+    FrozenPos(1, 2) FrozenSize(3, 4)
+    >>> print sa.asDeepTuple()
+    ((1, 2), (3, 4))
+    >>> print sa == SizeAllocation((1, 2), (3, 4))
+    True
+    >>> print SizeAllocation((1, 2), (3, 4)) == sa
+    True
+    >>> print sa * 10
+    FrozenSizeAllocation(FrozenPos(10, 20), FrozenSize(30, 40))
+    >>> print sa.copy() is sa
+    True
+    >>> print sa.thaw()
+    SizeAllocation(Pos(1, 2), Size(3, 4))
+
+    Being a tuple, it can be given to pygame as a rect.
+
+    >>> print tuple(sa)
+    (1, 2, 3, 4)
+
+    """
+    __slots__ = ()
+
+    def __new__(cls, pos, size):
+        """Create a FrozenSizeAllocation from a position and a size."""
+        if isinstance(pos, tuple):
+            left, top = pos
+        else:
+            left, top = pos.c1, pos.c2
+        if isinstance(size, tuple):
+            width, height = size
+        else:
+            width, height = size.c1, size.c2
+        _CheckLength(width, 'width')
+        _CheckLength(height, 'height')
+        return tuple.__new__(cls, (left, top, width, height))
+
+    def __getnewargs__(self):
+        """Return the arguments of __new__, for copy and pickle."""
+        return (self[0], self[1]), (self[2], self[3])
+
+    def __repr__(self):
+        """Return a string that Python can evaluate to create a similar object.
+        """
+        return "%s(%r, %r)" % (self.__class__.__name__, self.pos, self.size)
+
+    def __eq__(self, other):
+        """Return True if the positions and sizes are equal."""
+        if isinstance(other, FrozenSizeAllocation):
+            return tuple.__eq__(self, other)
+        try:
+            return self[0] == other.left and self[1] == other.top and \
+                   self[2] == other.width and self[3] == other.height
+        except AttributeError:
+            return tuple.__eq__(self, other)
+
+    def __ne__(self, other):
+        """Return True if the positions or sizes differ."""
+        return not self == other
+
+    __hash__ = tuple.__hash__
+
+    def __add__(self, other):
+        """Return a new object with added positions and sizes."""
+        return self.__class__(self.pos + other.pos, self.size + other.size)
+
+    def __sub__(self, other):
+        """Return a new object with subtracted positions and sizes."""
+        return self.__class__(self.pos - other.pos, self.size - other.size)
+
+    def __mul__(self, other):
+        """Return a new object with position and size times a scalar."""
+        return self.__class__(self.pos * other, self.size * other)
+
+    __rmul__ = __mul__
+
+    def __div__(self, other):
+        """Return a new object with position and size divided by a scalar."""
+        return self.__class__(self.pos / other, self.size / other)
+
+    def copy(self):
+        """Return the object itself: there is no need to copy it."""
+        return self
+
+    def __copy__(self):
+        """Return the object itself, for the copy module."""
+        return self
+
+    def __deepcopy__(self, memo):
+        """Return the object itself, for the copy module."""
+        return self
+
+    def freeze(self):
+        """Return the object itself: it is already immutable."""
+        return self
+
+    def thaw(self):
+        """Return a mutable copy of the object: a SizeAllocation."""
+        return SizeAllocation((self[0], self[1]), (self[2], self[3]))
+
+    def asTuple(self):
+        """Return a tuple (pos, size)."""
+        return self.pos, self.size
+
+    def asDeepTuple(self):
+        """Return a tuple of tuples ((left, top), (width, height))."""
+        return (self[0], self[1]), (self[2], self[3])
+
+    def _getPos(self):
+        """Return a FrozenPos."""
+        return tuple.__new__(FrozenPos, (self[0], self[1]))
+
+    def _getSize(self):
+        """Return a FrozenSize."""
+        return tuple.__new__(FrozenSize, (self[2], self[3]))
+
+    c1 = pos = property(_getPos, None, None, "Position, as a FrozenPos.")
+    c2 = size = property(_getSize, None, None, "Size, as a FrozenSize.")
+    left = property(itemgetter(0), None, None, "Left coordinate.")
+    top = property(itemgetter(1), None, None, "Top coordinate.")
+    width = property(itemgetter(2), None, None, "Width.")
+    height = property(itemgetter(3), None, None, "Height.")
+
+
 if __name__ == '__main__':
     help(__name__)
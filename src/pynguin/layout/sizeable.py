@@ -7,7 +7,24 @@ Created on Nov 29, 2010
 
 from size import SizeAllocation
 
-__all__ = ['SizeableError', 'SizeAllocationError', 'ExpandError', 'Sizeable']
+__all__ = ['SizeableError', 'SizeAllocationError', 'ExpandError', 'Sizeable',
+           'GetAllocationCounts', 'ResetAllocationCounts']
+
+_allocation_counts = {'performed': 0, 'skipped': 0}
+
+def GetAllocationCounts():
+    """Return a dict counting the size allocations performed and skipped.
+
+    Sizeable.allocateSize skips the allocation when nothing changed since the
+    previous one.  The keys of the dict are 'performed' and 'skipped'.
+
+    """
+    return dict(_allocation_counts)
+
+def ResetAllocationCounts():
+    """Set the counters returned by GetAllocationCounts back to 0."""
+    _allocation_counts['performed'] = 0
+    _allocation_counts['skipped'] = 0
 
 class SizeableError(RuntimeError):
     """Base error raised by the sizeable module."""
@@ -30,24 +47,21 @@ class Sizeable(object):
         None
         >>> print s.forced_requested_size
         None
+        >>> print s.is_requested_size_valid
+        False
+        >>> print s.is_allocation_valid
+        False
 
         """
         object.__init__(self)
         self.requested_size = None
         self.allocated_size = None
-        self.forced_requested_size = None
+        self._forced_requested_size = None
+        self.is_requested_size_valid = False
+        self.is_allocation_valid = False
         self.can_expand_width = True
         self.can_expand_height = True
 
-    def canExpand(self, direction):
-        """Return can_expand_<direction>.
-
-        direction: string "width" or "height".
-
-        """
-        attribute_name = 'can_expand_%s' % direction
-        return getattr(self, attribute_name)
-
     def _requestSize(self):
         """Compute the requested size and returns it.
 
@@ -102,9 +116,128 @@ class Sizeable(object):
         False
 
         """
+        old_requested_size = self.requested_size
         self.requested_size = self._requestSize()
         if self.forced_requested_size:
             self.requested_size = self.forced_requested_size.copy()
+        self.is_requested_size_valid = True
+        if old_requested_size is None or \
+           old_requested_size != self.requested_size:
+            # This object and its parent use this requested size when they
+            # allocate the size of their children.  invalidateAllocation
+            # marks the parent, and all the ancestors.
+            self.invalidateAllocation()
+
+    def refreshRequestedSize(self):
+        """Compute the requested size again, but only if it is invalid.
+
+        The requested size is cached: requestSize marks it as valid, and
+        invalidateRequestedSize marks it as invalid.  refreshRequestedSize
+        does nothing at all when the cached requested size is still valid.
+        Containers overload this method in order to refresh only their invalid
+        children.  Refreshing the root of a tree therefore only visits the
+        path going from the root to the modified elements.
+
+        >>> import size
+        >>> calls = []
+        >>> def giveASize():
+        ...     calls.append(None)
+        ...     return size.Size(1, 2)
+        >>> s = Sizeable()
+        >>> s._requestSize = giveASize # Remove the NotImplementedError.
+        >>> s.refreshRequestedSize()
+        >>> s.refreshRequestedSize()
+        >>> print len(calls)
+        1
+        >>> s.invalidateRequestedSize()
+        >>> s.refreshRequestedSize()
+        >>> print len(calls)
+        2
+
+        """
+        if not self.is_requested_size_valid:
+            self.requestSize(False)
+
+    def invalidateRequestedSize(self):
+        """Mark the requested size as invalid, as well as that of the parents.
+
+        Call this method whenever something that the requested size depends on
+        changes: a text, a font, a child, etc..  The next call to
+        refreshRequestedSize on the root of the tree will recompute the
+        requested size of this object and of its ancestors, and only them.
+
+        The walk up the tree stops at the first parent that was already
+        invalid: its own ancestors have been invalidated at the same time.
+
+        """
+        self.is_requested_size_valid = False
+        child = self
+        parent = getattr(self, 'parent', None)
+        while parent is not None:
+            parent._invalid_children.add(child)
+            if not parent.is_requested_size_valid:
+                break
+            parent.is_requested_size_valid = False
+            child = parent
+            parent = getattr(parent, 'parent', None)
+
+    def _getForcedRequestedSize(self):
+        """Return the forced requested size, or None."""
+        return self._forced_requested_size
+
+    def _setForcedRequestedSize(self, forced_requested_size):
+        """Set the forced requested size and invalidate the requested size.
+
+        >>> import size
+        >>> s = Sizeable()
+        >>> s.is_requested_size_valid = True
+        >>> s.forced_requested_size = size.Size(10, 20)
+        >>> print s.is_requested_size_valid
+        False
+        >>> print s.is_allocation_valid
+        False
+
+        """
+        self._forced_requested_size = forced_requested_size
+        self.invalidateRequestedSize()
+
+    forced_requested_size = property(_getForcedRequestedSize,
+                                     _setForcedRequestedSize, None,
+                                     "Size overriding the requested size.")
+
+    def invalidateAllocation(self):
+        """Force the next call to allocateSize to perform the allocation.
+
+        allocateSize does nothing when it receives the same allocation as the
+        previous time, unless the allocation has been invalidated.  The
+        requested size of the object or of one of its children changing
+        invalidates the allocation automatically.  Call this method when
+        something else that the allocation depends on changes, like the
+        can_expand_* attributes of a child or the spacing of a layout.
+
+        The ancestors are invalidated too: an allocation is only valid when
+        that of all the descendants is.  Otherwise a parent receiving the same
+        allocation as before would skip it, and never reach this object.  The
+        walk up the tree stops at the first parent that was already invalid,
+        like in invalidateRequestedSize: the layouts allocate all their
+        children, so the ancestors of an invalid parent are invalid too.
+
+        >>> from container import Container
+        >>> root, middle, leaf = Container(), Container(), Sizeable()
+        >>> leaf.parent = None # Sizeable is not Parentable.
+        >>> root.addChild(middle, 'end')
+        >>> middle.addChild(leaf, 'end')
+        >>> root.is_allocation_valid = middle.is_allocation_valid = True
+        >>> leaf.invalidateAllocation()
+        >>> print middle.is_allocation_valid, root.is_allocation_valid
+        False False
+
+        """
+        self.is_allocation_valid = False
+        parent = getattr(self, 'parent', None)
+        while parent is not None and parent.is_allocation_valid:
+            parent.is_allocation_valid = False
+            parent = getattr(parent, 'parent', None)
 
     def _allocateSize(self):
         """Proceed to the size allocation.
@@ -132,11 +265,19 @@ class Sizeable(object):
         1. `allocateSize` performs a deep copy of the parameter
            `allocated_size` and stores it in the `allocated_size` attribute of
            the object.  Copying prevents a lot of bad surprises and
-           hard-to-find bugs.
+           hard-to-find bugs.  A FrozenSizeAllocation is immutable: it is
+           stored as is, copying it would be useless.
         2. calls the method `_allocateSize` (notice the underscore) which
            does the real work of size allocation.  Each layout has its own
            implementation of `_allocateSize`.
 
+        If `allocated_size` is equal to the current allocated size and the
+        allocation has not been invalidated, neither that of the object nor
+        that of one of its descendants, then nothing is done: the children
+        already have the right allocation.  The functions
+        GetAllocationCounts and ResetAllocationCounts give access to the
+        number of allocations performed and skipped.
+
         Usage.
         ======
 
@@ -168,6 +309,15 @@ class Sizeable(object):
         False
         >>> print s.allocated_size.size is sa.size
         False
+        >>> s.allocateSize(sa) # Nothing changed, nothing done.
+        >>> s.invalidateAllocation()
+        >>> s.allocateSize(sa)
+        _allocateSize called.
+        >>> fsa = size.FrozenSizeAllocation((1, 2), (5, 6)) # Not copied.
+        >>> s.allocateSize(fsa)
+        _allocateSize called.
+        >>> print s.allocated_size is fsa
+        True
 
         """
         if not self.requested_size:
@@ -178,8 +328,13 @@ class Sizeable(object):
         if not self.can_expand_height:
             if allocated_size.height > self.requested_size.height:
                 raise ExpandError() 
+        if self.is_allocation_valid and self.allocated_size == allocated_size:
+            _allocation_counts['skipped'] += 1
+            return
         self.allocated_size = allocated_size.copy()
         self._allocateSize()
+        self.is_allocation_valid = True
+        _allocation_counts['performed'] += 1
 
     def negotiateSize(self, forward_request):
         """Run the full cycle of size negotiation: request and allocation.
@@ -210,9 +365,8 @@ class Sizeable(object):
         """
         allocated_size = self.allocated_size
         if allocated_size:
-            allocated_size.pos.x = pos_x
-            allocated_size.pos.y = pos_y
-            self.allocateSize(allocated_size)
+            self.allocateSize(SizeAllocation((pos_x, pos_y),
+                                             allocated_size.size))
         else:
             raise SizeableError("No allocated size yet, call allocateSize.")
 
@@ -222,9 +376,8 @@ class Sizeable(object):
         """
         allocated_size = self.allocated_size
         if allocated_size:
-            allocated_size.width = width
-            allocated_size.height = height
-            self.allocateSize(allocated_size)
+            self.allocateSize(SizeAllocation(allocated_size.pos,
+                                             (width, height)))
         else:
             raise SizeableError("No allocated size yet, call allocateSize.")
 
@@ -232,12 +385,7 @@ class Sizeable(object):
         """Change allocated_size to the given position and size, then allocate.
 
         """
-        allocated_size = self.allocated_size
         if self.allocated_size:
-            allocated_size.pos.x = pos_x
-            allocated_size.pos.y = pos_y
-            allocated_size.width = width
-            allocated_size.height = height
-            self.allocateSize(allocated_size)
+            self.allocateSize(SizeAllocation((pos_x, pos_y), (width, height)))
         else:
             raise SizeableError("No allocated size yet, call allocateSize.")
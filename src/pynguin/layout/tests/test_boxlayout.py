@@ -11,10 +11,12 @@ Created on Nov 9, 2010
 # pylint: disable-msg=R0904
 # Because too many public methods is acceptable in a test.
 
+import random
 import unittest
 from pynguin.layout.size import Size
 from pynguin.layout.size import SizeAllocation
 from pynguin.layout.size import Pos
+from pynguin.layout.size import FrozenSizeAllocation
 from pynguin.layout.sizeable import ExpandError
 from pynguin.layout import boxlayout
 from mock import MockWidget
@@ -98,6 +100,20 @@ class TestHBoxLayout(unittest.TestCase):
         # Height: the biggest is 15.
         self.assertEquals(requested_size, Size(134, 15))
 
+    def testShrinkOnlyChildToNothing(self):
+        """HBoxLayout.allocateSize gives no width to an only child shrunk."""
+        children = [self.widget1]
+        for threshold in (0, 1000): # With and without NumPy.
+            for box in (self.homo_box, self.hetero_box):
+                box.VECTORIZE_THRESHOLD = threshold
+                requested_size = box.requestSize(children)
+                box.allocateSize(SizeAllocation((200, 100), (0, 15)),
+                                 requested_size, children)
+                self.assertEqual(self.widget1.allocated_size.pos,
+                                 Pos(200, 100))
+                self.assertEqual(self.widget1.allocated_size.size,
+                                 Size(0, 15))
+
     def testIdealHeterogeneous(self):
         """HBoxLayout.allocateSize ideal heterogeneous works."""
         requested_size = self.hetero_box.requestSize(self.children)
@@ -638,5 +654,204 @@ class TestVBoxLayout(unittest.TestCase):
         self.assertEqual(self.widget3.allocated_size.pos, Pos(100, 294))
 
 
+class GenericBoxLayout(boxlayout.BoxLayout):
+    """BoxLayout whose accessors find the attributes by name.
+
+    It is a reference for the accessors of HBoxLayout and VBoxLayout, written
+    out for speed.
+
+    """
+    # The names of the attributes, to overload in the subclasses.
+    PRIMARY_LENGTH = 'undefined'
+    SECONDARY_LENGTH = 'undefined'
+    PRIMARY_COORD = 'undefined'
+    SECONDARY_COORD = 'undefined'
+    PRIMARY_COORD_XY = 'undefined'
+    SECONDARY_COORD_XY = 'undefined'
+
+    def _splitSize(self, size):
+        """Return the primary and secondary lengths of a size."""
+        return (getattr(size, self.PRIMARY_LENGTH),
+                getattr(size, self.SECONDARY_LENGTH))
+
+    def _splitPos(self, allocated_size):
+        """Return the primary and secondary coords of an allocation."""
+        return (getattr(allocated_size, self.PRIMARY_COORD),
+                getattr(allocated_size, self.SECONDARY_COORD))
+
+    def _makeSize(self, primary_length, secondary_length):
+        """Return a Size from its primary and secondary lengths."""
+        result = Size(0, 0)
+        setattr(result, self.PRIMARY_LENGTH, primary_length)
+        setattr(result, self.SECONDARY_LENGTH, secondary_length)
+        return result
+
+    def _makeAllocation(self, primary_coord, secondary_coord, primary_length,
+                        secondary_length):
+        """Return a FrozenSizeAllocation from its primary and secondary parts.
+        """
+        pos = Pos(0, 0)
+        size = Size(0, 0)
+        setattr(pos, self.PRIMARY_COORD_XY, primary_coord)
+        setattr(pos, self.SECONDARY_COORD_XY, secondary_coord)
+        setattr(size, self.PRIMARY_LENGTH, primary_length)
+        setattr(size, self.SECONDARY_LENGTH, secondary_length)
+        return FrozenSizeAllocation(pos, size)
+
+    def _primaryLengths(self, children):
+        """Return the list of the requested primary lengths of the children.
+        """
+        name = self.PRIMARY_LENGTH
+        return [getattr(child.requested_size, name) for child in children]
+
+    def _secondaryLengths(self, children):
+        """Return the list of the requested secondary lengths of the children.
+        """
+        name = self.SECONDARY_LENGTH
+        return [getattr(child.requested_size, name) for child in children]
+
+    def _primaryExpandables(self, children):
+        """Return a list of booleans: can the children expand in primary."""
+        name = 'can_expand_' + self.PRIMARY_LENGTH
+        return [getattr(child, name) for child in children]
+
+    def _secondaryExpandables(self, children):
+        """Return a list of booleans: can the children expand in secondary."""
+        name = 'can_expand_' + self.SECONDARY_LENGTH
+        return [getattr(child, name) for child in children]
+
+
+class GenericHBoxLayout(GenericBoxLayout):
+    """HBoxLayout using only the generic accessors."""
+    PRIMARY_LENGTH = 'width'
+    SECONDARY_LENGTH = 'height'
+    PRIMARY_COORD = 'left'
+    SECONDARY_COORD = 'top'
+    PRIMARY_COORD_XY = 'x'
+    SECONDARY_COORD_XY = 'y'
+
+
+class GenericVBoxLayout(GenericBoxLayout):
+    """VBoxLayout using only the generic accessors."""
+    PRIMARY_LENGTH = 'height'
+    SECONDARY_LENGTH = 'width'
+    PRIMARY_COORD = 'top'
+    SECONDARY_COORD = 'left'
+    PRIMARY_COORD_XY = 'y'
+    SECONDARY_COORD_XY = 'x'
+
+
+def _Generic(layout):
+    """Return the generic class of layout, which names its attributes."""
+    if isinstance(layout, (boxlayout.HBoxLayout, GenericHBoxLayout)):
+        return GenericHBoxLayout
+    return GenericVBoxLayout
+
+
+class TestSpecialized(unittest.TestCase):
+    """Test the specialized accessors of HBoxLayout and VBoxLayout."""
+    def _negotiate(self, layout, sizes, expands, length, threshold):
+        """Return the requested size and the allocations of MockWidgets."""
+        layout.VECTORIZE_THRESHOLD = threshold
+        names = _Generic(layout)
+        children = []
+        for (width, height), (expand_primary, expand_secondary) in zip(
+                sizes, expands):
+            child = MockWidget(width, height)
+            setattr(child, 'can_expand_' + names.PRIMARY_LENGTH,
+                    expand_primary)
+            setattr(child, 'can_expand_' + names.SECONDARY_LENGTH,
+                    expand_secondary)
+            child.requestSize(True)
+            children.append(child)
+        requested_size = layout.requestSize(children)
+        allocated_size = SizeAllocation((7, 9), requested_size)
+        setattr(allocated_size, names.PRIMARY_LENGTH, length)
+        layout.allocateSize(allocated_size, requested_size, children)
+        return requested_size, [child.allocated_size for child in children]
+
+    def testSameAsGeneric(self):
+        """Specialized and generic boxes negotiate the same sizes."""
+        rng = random.Random(8)
+        for specialized, generic in [(boxlayout.HBoxLayout, GenericHBoxLayout),
+                                     (boxlayout.VBoxLayout, GenericVBoxLayout)]:
+            for is_homogeneous in (False, True):
+                sizes = [(rng.randint(0, 50), rng.randint(0, 50))
+                         for unused in range(20)]
+                # Every child fills the secondary dimension, and homogeneous
+                # boxes inflate all their children.
+                expands = [(is_homogeneous or rng.random() < 0.5, True)
+                           for unused in range(20)]
+                expands[0] = (True, True)
+                for length in (0, 40, 300, 600, 1200):
+                    for threshold in (0, 1000):
+                        args = (sizes, expands, length, threshold)
+                        self.assertEquals(
+                            self._negotiate(specialized(3, is_homogeneous),
+                                            *args),
+                            self._negotiate(generic(3, is_homogeneous),
+                                            *args))
+
+    def testForgotToRequestSize(self):
+        """BoxLayout.requestSize tells when a child has no requested size."""
+        for layout_class in (boxlayout.HBoxLayout, GenericHBoxLayout):
+            child = MockWidget(10, 10)
+            try:
+                layout_class(0, False).requestSize([child])
+            except AttributeError as ex:
+                self.assertTrue('forget' in ex.args[0])
+            else:
+                self.fail("AttributeError not raised.")
+
+
 if __name__ == "__main__":
     unittest.main()
+
+
+@unittest.skipIf(boxlayout.numpy is None, "NumPy is not installed.")
+class TestVectorized(unittest.TestCase):
+    """Test the NumPy path of the BoxLayout allocation."""
+    def _allocate(self, layout_class, is_homogeneous, threshold, sizes,
+                  expands, allocated_size):
+        """Return the allocations of MockWidgets in a box."""
+        layout = layout_class(3, is_homogeneous)
+        layout.VECTORIZE_THRESHOLD = threshold
+        children = []
+        for (width, height), expand in zip(sizes, expands):
+            child = MockWidget(width, height)
+            setattr(child, 'can_expand_' + _Generic(layout).PRIMARY_LENGTH,
+                    expand)
+            child.requestSize(True)
+            children.append(child)
+        requested_size = layout.requestSize(children)
+        layout.allocateSize(allocated_size, requested_size, children)
+        return [child.allocated_size for child in children]
+
+    def testSameAllocations(self):
+        """Vectorized and pure Python allocations are identical."""
+        rng = random.Random(12)
+        for layout_class in (boxlayout.HBoxLayout, boxlayout.VBoxLayout):
+            for is_homogeneous in (False, True):
+                sizes = [(rng.randint(1, 50), rng.randint(1, 50))
+                         for unused in range(40)]
+                # Homogeneous boxes inflate all their children.
+                expands = [is_homogeneous or rng.random() < 0.5
+                           for unused in range(40)]
+                expands[0] = True
+                layout = layout_class(3, is_homogeneous)
+                children = [MockWidget(*size) for size in sizes]
+                for child in children:
+                    child.requestSize(True)
+                requested = layout.requestSize(children)
+                name = _Generic(layout).PRIMARY_LENGTH
+                primary = getattr(requested, name)
+                for length in (0, 30, primary // 3, primary, primary + 1,
+                               primary * 2):
+                    allocated_size = SizeAllocation((7, 9), requested)
+                    setattr(allocated_size, name, length)
+                    args = (layout_class, is_homogeneous)
+                    self.assertEquals(
+                        self._allocate(*(args + (0, sizes, expands,
+                                                 allocated_size))),
+                        self._allocate(*(args + (1000, sizes, expands,
+                                                 allocated_size))))
@@ -5,8 +5,10 @@ Created on Nov 17, 2010
 @author: Niriel
 """
 
+import random
 import unittest
 from pynguin.layout import container
+from pynguin.layout.parentable import Parentable
 from pynguin.layout.size import Size
 from mock import MockWidget, MockLayout
 
@@ -47,6 +49,27 @@ class TestContainer(unittest.TestCase):
         requested_size = my_container.requested_size
         self.assertEquals(requested_size, Size(60, 60))
 
+    def testRequestSizeWithoutForwardKeepsInvalidChildren(self):
+        """Container.requestSize(False) does not lose the invalid children."""
+        grandparent = container.Container()
+        grandparent._layout = MockLayout()
+        parent = container.Container()
+        parent._layout = MockLayout()
+        leaf = MockWidget(10, 5)
+        grandparent.addChild(parent, 'end')
+        parent.addChild(leaf, 'end')
+        grandparent.requestSize(True)
+        leaf.width = 20
+        leaf.invalidateRequestedSize()
+        grandparent.requestSize(False)
+        self.assertFalse(grandparent.is_requested_size_valid)
+        leaf.width = 30
+        leaf.invalidateRequestedSize()
+        grandparent.refreshRequestedSize()
+        for sizeable in (grandparent, parent, leaf):
+            self.assertEquals(sizeable.requested_size, Size(30, 5))
+        self.assertTrue(grandparent.is_requested_size_valid)
+
     def testMaxChildren(self):
         """Container.max_children is checked when adding a child."""
         widget1 = MockWidget(10, 20)
@@ -60,5 +83,240 @@ class TestContainer(unittest.TestCase):
         my_container.max_children = -1 # No limit.
         my_container.addChild(widget2, 'end')
 
+    def testRefreshRequestedSize(self):
+        """Container.refreshRequestedSize only visits the invalid path."""
+        calls = []
+        class CountingWidget(MockWidget):
+            """MockWidget counting the calls to _requestSize."""
+            def _requestSize(self):
+                """Remember the call, then return the size."""
+                calls.append(self)
+                return MockWidget._requestSize(self)
+        root = container.Container()
+        root._layout = MockLayout()
+        branches = []
+        leaves = []
+        for unused in range(3):
+            branch = container.Container()
+            branch._layout = MockLayout()
+            root.addChild(branch, 'end')
+            branches.append(branch)
+            for unused in range(4):
+                leaf = CountingWidget(1, 2)
+                branch.addChild(leaf, 'end')
+                leaves.append(leaf)
+        root.refreshRequestedSize()
+        self.assertEquals(len(calls), 12)
+        self.assertEquals(root.requested_size, Size(12, 24))
+        # Nothing changed: nothing is computed.
+        del calls[:]
+        root.refreshRequestedSize()
+        self.assertEquals(calls, [])
+        # One leaf changed: only that leaf is computed.
+        leaves[5].width = 11
+        leaves[5].invalidateRequestedSize()
+        self.assertFalse(branches[1].is_requested_size_valid)
+        self.assertTrue(branches[0].is_requested_size_valid)
+        self.assertTrue(branches[2].is_requested_size_valid)
+        root.refreshRequestedSize()
+        self.assertEquals(calls, [leaves[5]])
+        self.assertEquals(root.requested_size, Size(22, 24))
+        self.assertTrue(root.is_requested_size_valid)
+        self.assertTrue(branches[1].is_requested_size_valid)
+
+    def testAllocateSizeSkipSubtrees(self):
+        """Container.allocateSize does not descend into unchanged subtrees."""
+        from pynguin.layout import sizeable
+        from pynguin.layout.size import SizeAllocation
+        from pynguin.layout.boxlayout import VBoxLayout, HBoxLayout
+        root = container.Container()
+        root._layout = VBoxLayout(0, False)
+        leaves = []
+        for unused in range(4):
+            row = container.Container()
+            row._layout = HBoxLayout(0, False)
+            root.addChild(row, 'end')
+            for unused in range(3):
+                leaf = MockWidget(10, 10)
+                row.addChild(leaf, 'end')
+                leaves.append(leaf)
+        root.refreshRequestedSize()
+        allocation = SizeAllocation((0, 0), root.requested_size)
+        sizeable.ResetAllocationCounts()
+        root.allocateSize(allocation)
+        self.assertEquals(sizeable.GetAllocationCounts(),
+                          {'performed': 17, 'skipped': 0})
+        # A leaf of the second row shrinks: the root keeps its requested size
+        # but the second row and its leaves are allocated again.  The other
+        # rows are skipped.
+        leaves[4].width = 5
+        leaves[4].invalidateRequestedSize()
+        root.refreshRequestedSize()
+        sizeable.ResetAllocationCounts()
+        root.allocateSize(SizeAllocation((0, 0), root.requested_size))
+        counts = sizeable.GetAllocationCounts()
+        self.assertEquals(counts, {'performed': 5, 'skipped': 3})
+
+    def testAllocateSizeDeepChange(self):
+        """A change deep in the tree is allocated even if the parents keep
+        their requested size."""
+        from pynguin.layout.size import SizeAllocation
+        from pynguin.layout.boxlayout import VBoxLayout, HBoxLayout
+        root = container.Container()
+        root._layout = VBoxLayout(0, False)
+        middle = container.Container()
+        middle._layout = VBoxLayout(0, False)
+        root.addChild(middle, 'end')
+        row = container.Container()
+        row._layout = HBoxLayout(0, False)
+        middle.addChild(row, 'end')
+        # The middle box keeps its width thanks to this wide sibling.
+        middle.addChild(MockWidget(30, 10), 'end')
+        leaves = [MockWidget(10, 10) for unused in range(3)]
+        for leaf in leaves:
+            row.addChild(leaf, 'end')
+        root.refreshRequestedSize()
+        allocation = SizeAllocation((0, 0), root.requested_size)
+        root.allocateSize(allocation)
+        self.assertEquals([leaf.allocated_size.width for leaf in leaves],
+                          [10, 10, 10])
+        leaves[0].width = 5
+        leaves[0].invalidateRequestedSize()
+        root.refreshRequestedSize()
+        self.assertEquals(root.requested_size, allocation.size)
+        self.assertFalse(root.is_allocation_valid)
+        root.allocateSize(allocation)
+        self.assertEquals([leaf.allocated_size.width for leaf in leaves],
+                          [6, 12, 12])
+        self.assertTrue(root.is_allocation_valid)
+        self.assertTrue(row.is_allocation_valid)
+
+    def testLayoutsAllocateAllChildren(self):
+        """Every layout allocates all the children of its container.
+
+        invalidateAllocation relies on it to stop at the first invalid
+        parent: a container whose allocation is valid has no invalid child.
+
+        """
+        from pynguin.layout.size import SizeAllocation
+        from pynguin.layout.boxlayout import HBoxLayout, VBoxLayout
+        from pynguin.layout.borderlayout import BorderLayout
+        from pynguin.layout.windowlayout import WindowLayout
+        from pynguin.layout.scrolllayout import ScrollLayout
+        from pynguin.layout.boardlayout import BoardLayout
+        from pynguin.layout.gridlayout import GridLayout
+        from pynguin.layout.virtualboxlayout import VirtualBoxLayout
+        from pynguin.layout.layoutcache import LayoutCache
+        def Attach(layout, children):
+            """Give a cell or an item to the children that need one."""
+            for index, child in enumerate(children):
+                if isinstance(layout, GridLayout):
+                    layout.attach(child, index // 2, index % 2)
+                elif isinstance(layout, VirtualBoxLayout):
+                    layout.attach(child, index)
+        cached_box = HBoxLayout(2, False)
+        cached_box.cache = LayoutCache()
+        # The layouts that hold one child only, and the others.
+        layouts = [(BorderLayout(3), 1), (WindowLayout(), 1),
+                   (ScrollLayout(), 1), (HBoxLayout(2, False), 3),
+                   (VBoxLayout(2, True), 3), (cached_box, 3),
+                   (BoardLayout(), 3), (GridLayout(2), 3),
+                   (VirtualBoxLayout(3), 3)]
+        for layout, children_nb in layouts:
+            box = container.Container()
+            box._layout = layout
+            children = [MockWidget(10 + index, 5) for index in
+                        xrange(children_nb)]
+            Attach(layout, children)
+            for child in children:
+                box.addChild(child, 'end')
+            box.requestSize(True)
+            for size in (box.requested_size, box.requested_size + Size(7, 3),
+                         box.requested_size + Size(7, 3)):
+                for child in children:
+                    child.invalidateAllocation()
+                box.allocateSize(SizeAllocation((0, 0), size))
+                self.assertTrue(box.is_allocation_valid)
+                for child in children:
+                    self.assertTrue(child.is_allocation_valid,
+                                    layout.__class__.__name__)
+
+    def testInvalidateOnAddRemove(self):
+        """Container.addChild and removeChild invalidate the requested size."""
+        widget1 = MockWidget(10, 20)
+        widget2 = MockWidget(30, 40)
+        my_container = container.Container()
+        my_container._layout = MockLayout()
+        my_container.addChild(widget1, 'end')
+        my_container.refreshRequestedSize()
+        self.assertEquals(my_container.requested_size, Size(10, 20))
+        my_container.addChild(widget2, 'end')
+        self.assertFalse(my_container.is_requested_size_valid)
+        my_container.refreshRequestedSize()
+        self.assertEquals(my_container.requested_size, Size(40, 60))
+        my_container.removeChild(widget1)
+        self.assertFalse(my_container.is_requested_size_valid)
+        my_container.refreshRequestedSize()
+        self.assertEquals(my_container.requested_size, Size(30, 40))
+
+    def testInvalidateOnForcedRequestedSize(self):
+        """Setting forced_requested_size invalidates the parents."""
+        widget = MockWidget(10, 20)
+        my_container = container.Container()
+        my_container._layout = MockLayout()
+        my_container.addChild(widget, 'end')
+        my_container.refreshRequestedSize()
+        widget.forced_requested_size = Size(1, 1)
+        self.assertFalse(my_container.is_requested_size_valid)
+        my_container.refreshRequestedSize()
+        self.assertEquals(my_container.requested_size, Size(1, 1))
+
+    def testSameOrderAsList(self):
+        """The children keep the order of a list receiving the same inserts."""
+        rng = random.Random(5)
+        my_container = container.Container()
+        expected = []
+        for unused in range(500):
+            action = rng.choice(['end', 'beginning', 'index', 'before',
+                                 'after', 'remove'])
+            if action in ('index', 'before', 'after', 'remove') and \
+               not expected:
+                action = 'end'
+            child = Parentable()
+            if action == 'end':
+                my_container.addChild(child, 'end')
+                expected.append(child)
+            elif action == 'beginning':
+                my_container.addChild(child, 'beginning')
+                expected.insert(0, child)
+            elif action == 'index':
+                index = rng.randrange(len(expected))
+                my_container.addChild(child, ('index', index))
+                expected.insert(index, child)
+            elif action == 'remove':
+                child = rng.choice(expected)
+                my_container.removeChild(child)
+                expected.remove(child)
+                self.assertFalse(child in my_container)
+            else:
+                ref_child = rng.choice(expected)
+                my_container.addChild(child, (action, ref_child))
+                index = expected.index(ref_child)
+                expected.insert(index + (action == 'after'), child)
+            self.assertEquals(my_container.children, expected)
+        self.assertEquals(list(my_container), expected)
+        for child in expected:
+            self.assertTrue(child in my_container)
+
+    def testStaleChildrenList(self):
+        """A list of children read before a modification is left untouched."""
+        my_container = container.Container()
+        first = Parentable()
+        my_container.addChild(first, 'end')
+        children = my_container.children
+        my_container.addChild(Parentable(), ('before', first))
+        self.assertEquals(children, [first])
+        self.assertEquals(len(my_container.children), 2)
+
 if __name__ == "__main__":
     unittest.main()
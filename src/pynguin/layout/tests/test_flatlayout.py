@@ -0,0 +1,157 @@
+#! /usr/bin/python
+"""
+Created on Oct 18, 2026
+
+@author: Niriel
+"""
+
+import random
+import unittest
+from pynguin.layout import flatlayout
+from pynguin.layout.container import Container
+from pynguin.layout.boxlayout import HBoxLayout
+from pynguin.layout.boxlayout import VBoxLayout
+from pynguin.layout.borderlayout import BorderLayout
+from pynguin.layout.windowlayout import WindowLayout
+from pynguin.layout.scrolllayout import ScrollLayout
+from pynguin.layout.size import Size
+from pynguin.layout.size import SizeAllocation
+from pynguin.layout.sizeable import ExpandError
+from mock import MockWidget
+
+# pylint: disable-msg=R0904
+# Because unit tests have tons of public methods and that's normal.
+
+# pylint: disable-msg=W0212
+# Because I know what I'm doing when I use a protected attribute in a test.
+
+
+def MakeContainer(layout):
+    """Return a new Container using layout."""
+    container = Container()
+    container._layout = layout
+    return container
+
+
+def MakeRandomTree(rng, depth):
+    """Return a random tree of containers and MockWidgets."""
+    if depth == 0 or rng.random() < 0.2:
+        widget = MockWidget(rng.randint(0, 50), rng.randint(0, 50))
+    else:
+        kind = rng.choice(['hbox', 'vbox', 'border', 'window'])
+        if kind == 'hbox':
+            widget = MakeContainer(HBoxLayout(rng.randint(0, 7),
+                                              rng.random() < 0.5))
+        elif kind == 'vbox':
+            widget = MakeContainer(VBoxLayout(rng.randint(0, 7),
+                                              rng.random() < 0.5))
+        elif kind == 'border':
+            widget = MakeContainer(BorderLayout([rng.randint(0, 9)
+                                                 for unused in range(4)]))
+        else:
+            widget = MakeContainer(WindowLayout())
+        if kind in ('hbox', 'vbox'):
+            children_nb = rng.randint(0, 5)
+        else:
+            children_nb = 1
+        for unused in range(children_nb):
+            widget.addChild(MakeRandomTree(rng, depth - 1), 'end')
+        if rng.random() < 0.1:
+            # Forcing a size smaller than the content leads to negative sizes.
+            widget.requestSize(True)
+            widget.forced_requested_size = widget.requested_size + \
+                                           Size(rng.randint(0, 20),
+                                                rng.randint(0, 20))
+    widget.can_expand_width = rng.random() < 0.8
+    widget.can_expand_height = rng.random() < 0.8
+    return widget
+
+
+def IterTree(widget):
+    """Yield widget and all its descendants, depth first."""
+    yield widget
+    for child in getattr(widget, 'children', []):
+        for descendant in IterTree(child):
+            yield descendant
+
+
+class TestFlatLayout(unittest.TestCase):
+    """Test the flatlayout module."""
+
+    def testDocTest(self):
+        """Module flatlayout passes its doctests."""
+        import doctest
+        failures, unused = doctest.testmod(m=flatlayout)
+        del unused
+        self.assertEquals(failures, 0)
+
+    def testParentBeforeChildren(self):
+        """FlatLayoutTree.addNode refuses a parent not yet added."""
+        tree = flatlayout.FlatLayoutTree()
+        self.assertRaises(ValueError, tree.addNode, flatlayout.LEAF, 0)
+
+    def testAttachUnsupportedLayout(self):
+        """FlatLayoutTree.attach refuses the layouts it does not know."""
+        tree = flatlayout.FlatLayoutTree()
+        scroll = MakeContainer(ScrollLayout())
+        scroll.addChild(MockWidget(10, 10), 'end')
+        self.assertRaises(ValueError, tree.attach, scroll)
+
+    def testSameNumbersAsObjects(self):
+        """FlatLayoutTree computes exactly what the objects compute."""
+        rng = random.Random(42)
+        for unused in range(200):
+            root = MakeRandomTree(rng, 4)
+            root.can_expand_width = root.can_expand_height = True
+            tree = flatlayout.FlatLayoutTree()
+            tree.attach(root)
+            widgets = list(IterTree(root))
+            self.assertEquals(len(tree), len(widgets))
+            root.requestSize(True)
+            tree.requestSizes()
+            for index, widget in enumerate(widgets):
+                self.assertEquals(tree.getRequestedSize(index),
+                                  widget.requested_size.asTuple())
+            # Ideal, shrunk and inflated allocations.
+            requested = root.requested_size
+            for width, height in [(requested.width, requested.height),
+                                  (requested.width // 2, requested.height),
+                                  (requested.width, requested.height // 3),
+                                  (requested.width + 37,
+                                   requested.height + 11)]:
+                try:
+                    root.allocateSize(SizeAllocation((3, 4), (width, height)))
+                except ExpandError:
+                    # Inflating a tree where nothing can expand.  Both engines
+                    # must refuse it.
+                    self.assertRaises(ExpandError, tree.allocateSize,
+                                      0, 3, 4, width, height)
+                    continue
+                tree.allocateSize(0, 3, 4, width, height)
+                for index, widget in enumerate(widgets):
+                    pos, size = widget.allocated_size.asDeepTuple()
+                    self.assertEquals(tree.getAllocation(index), pos + size)
+
+    def testWriteBack(self):
+        """FlatLayoutTree.writeBack gives the sizes to the objects."""
+        box = MakeContainer(HBoxLayout(5, False))
+        leaves = [MockWidget(10, 20), MockWidget(30, 10)]
+        for leaf in leaves:
+            box.addChild(leaf, 'end')
+        tree = flatlayout.FlatLayoutTree()
+        tree.attach(box)
+        tree.negotiateSize()
+        tree.writeBack()
+        self.assertEquals(box.requested_size, Size(45, 20))
+        self.assertEquals(leaves[1].allocated_size,
+                          SizeAllocation((15, 0), (30, 20)))
+        self.assertTrue(box.is_requested_size_valid)
+        self.assertTrue(leaves[1].is_allocation_valid)
+        # Modifying a leaf only requires the leaf to be updated.
+        tree.setLeafSize(2, 40, 10)
+        tree.negotiateSize()
+        self.assertEquals(tree.getRequestedSize(0), (55, 20))
+
+
+if __name__ == "__main__":
+    unittest.main()
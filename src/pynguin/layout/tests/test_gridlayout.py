@@ -0,0 +1,183 @@
+#! /usr/bin/python
+"""
+Created on Oct 18, 2026
+
+@author: Niriel
+"""
+
+import random
+import unittest
+from pynguin.layout import gridlayout
+from pynguin.layout.container import Container
+from pynguin.layout.boxlayout import HBoxLayout
+from pynguin.layout.size import Size
+from pynguin.layout.size import SizeAllocation
+from pynguin.layout.sizeable import ExpandError
+from mock import MockWidget
+
+# pylint: disable-msg=R0904
+# Because unit tests have tons of public methods and that's normal.
+
+# pylint: disable-msg=W0212
+# Because I know what I'm doing when I use a protected attribute in a test.
+
+
+def MakeGrid(spacing, children_and_cells):
+    """Return a Container with a GridLayout holding the given children."""
+    grid = Container()
+    grid._layout = gridlayout.GridLayout(spacing)
+    for child, cell in children_and_cells:
+        grid._layout.attach(child, *cell)
+        grid.addChild(child, 'end')
+    return grid
+
+
+class TestGridLayout(unittest.TestCase):
+    """Test the gridlayout module."""
+
+    def testDocTest(self):
+        """Module gridlayout passes its doctests."""
+        import doctest
+        failures, unused = doctest.testmod(m=gridlayout)
+        del unused
+        self.assertEquals(failures, 0)
+
+    def testAttachInvalid(self):
+        """GridLayout.attach refuses negative cells and empty spans."""
+        layout = gridlayout.GridLayout()
+        child = MockWidget(1, 1)
+        self.assertRaises(ValueError, layout.attach, child, -1, 0)
+        self.assertRaises(ValueError, layout.attach, child, 0, 0, 0, 1)
+        self.assertRaises(ValueError, layout.attach, child, 0, 0, 1, 0)
+
+    def testNotAttached(self):
+        """GridLayout.requestSize refuses the children not attached."""
+        child = MockWidget(1, 1)
+        child.requestSize(True)
+        layout = gridlayout.GridLayout()
+        self.assertRaises(ValueError, layout.requestSize, [child])
+        layout.attach(child, 0, 0)
+        layout.detach(child)
+        self.assertRaises(ValueError, layout.requestSize, [child])
+
+    def testAttachInvalidates(self):
+        """Attaching a child already in the grid invalidates the grid."""
+        first, second = MockWidget(10, 10), MockWidget(20, 10)
+        grid = MakeGrid(0, [(first, (0, 0)), (second, (0, 1))])
+        grid.refreshRequestedSize()
+        grid.allocateSize(SizeAllocation((0, 0), grid.requested_size))
+        # Swapping the columns keeps the requested size of the grid.
+        grid._layout.attach(first, 0, 1)
+        grid._layout.attach(second, 0, 0)
+        self.assertFalse(grid.is_requested_size_valid)
+        self.assertFalse(grid.is_allocation_valid)
+        grid.refreshRequestedSize()
+        self.assertEquals(grid.requested_size, Size(30, 10))
+        grid.allocateSize(SizeAllocation((0, 0), grid.requested_size))
+        self.assertEquals(first.allocated_size.left, 20)
+        self.assertEquals(second.allocated_size.left, 0)
+
+    def testRemoveChildDetaches(self):
+        """The children removed from the grid are detached."""
+        children = [MockWidget(10, 10) for unused in range(4)]
+        grid = MakeGrid(0, [(child, (0, i))
+                            for i, child in enumerate(children)])
+        grid.removeChild(children[0])
+        grid.removeChildren(children[1:3])
+        self.assertEquals(grid._layout._cells.keys(), [children[3]])
+        grid.replaceChildren([])
+        self.assertEquals(grid._layout._cells, {})
+        self.assertRaises(ValueError, grid._layout.getCell, children[0])
+
+    def testColumnsAligned(self):
+        """All the cells of a column have the same left and width."""
+        children = [MockWidget(10 + 7 * i % 13, 10) for i in range(12)]
+        grid = MakeGrid(3, [(child, (i // 4, i % 4))
+                            for i, child in enumerate(children)])
+        grid.negotiateSize(True)
+        for column in range(4):
+            allocations = set((child.allocated_size.left,
+                               child.allocated_size.width)
+                              for child in children[column::4])
+            self.assertEquals(len(allocations), 1)
+
+    def testSpanGrowsTracks(self):
+        """A wide child spanning two columns makes them grow."""
+        wide = MockWidget(100, 10)
+        left, right = MockWidget(10, 10), MockWidget(30, 10)
+        grid = MakeGrid(2, [(wide, (0, 0, 1, 2)), (left, (1, 0)),
+                            (right, (1, 1))])
+        grid.negotiateSize(True)
+        self.assertEquals(grid.requested_size, Size(100, 22))
+        self.assertEquals(left.allocated_size.width +
+                          right.allocated_size.width + 2, 100)
+        self.assertEquals(right.allocated_size.left,
+                          left.allocated_size.width + 2)
+
+    def testChildCannotExpand(self):
+        """A child that cannot expand keeps its requested size."""
+        big, small = MockWidget(40, 30), MockWidget(10, 10)
+        small.can_expand_width = small.can_expand_height = False
+        grid = MakeGrid(0, [(big, (0, 0)), (small, (1, 0))])
+        grid.negotiateSize(True)
+        self.assertEquals(small.allocated_size,
+                          SizeAllocation((0, 30), (10, 10)))
+
+    def testCannotInflate(self):
+        """Inflating a grid without any expandable column raises."""
+        child = MockWidget(10, 10)
+        child.can_expand_width = False
+        grid = MakeGrid(0, [(child, (0, 0))])
+        grid.requestSize(True)
+        self.assertRaises(ExpandError, grid.allocateSize,
+                          SizeAllocation((0, 0), (20, 10)))
+
+    def testOneRowIsAnHBox(self):
+        """A grid of one row allocates like a heterogeneous HBox."""
+        rng = random.Random(3)
+        for unused in range(20):
+            sizes = [(rng.randint(0, 40), rng.randint(0, 40))
+                     for unused in range(rng.randint(2, 8))]
+            expands = [rng.random() < 0.5 for size in sizes]
+            expands[0] = True
+            grid_children = [MockWidget(*size) for size in sizes]
+            box_children = [MockWidget(*size) for size in sizes]
+            for children in (grid_children, box_children):
+                for child, expand in zip(children, expands):
+                    child.can_expand_width = expand
+            grid = MakeGrid(4, [(child, (0, i))
+                                for i, child in enumerate(grid_children)])
+            box = Container()
+            box._layout = HBoxLayout(4, False)
+            for child in box_children:
+                box.addChild(child, 'end')
+            for container in (grid, box):
+                container.requestSize(True)
+            self.assertEquals(grid.requested_size, box.requested_size)
+            for width in (0, 13, box.requested_size.width,
+                          box.requested_size.width * 2):
+                allocation = SizeAllocation((5, 6),
+                                            (width, box.requested_size.height))
+                grid.allocateSize(allocation)
+                box.allocateSize(allocation)
+                self.assertEquals([child.allocated_size
+                                   for child in grid_children],
+                                  [child.allocated_size
+                                   for child in box_children])
+
+    def testLargeTable(self):
+        """A table of 200 rows and 50 columns fills its allocation."""
+        children = [MockWidget(20 + (row * column) % 30, 12 + row % 5)
+                    for row in range(200) for column in range(50)]
+        grid = MakeGrid(1, [(child, (i // 50, i % 50))
+                            for i, child in enumerate(children)])
+        grid.requestSize(True)
+        width, height = grid.requested_size.asTuple()
+        grid.allocateSize(SizeAllocation((0, 0), (width + 99, height - 99)))
+        last = children[-1].allocated_size
+        self.assertEquals(last.left + last.width, width + 99)
+        self.assertEquals(last.top + last.height, height - 99)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+#! /usr/bin/python
+"""
+Created on Oct 18, 2026
+
+@author: Niriel
+"""
+
+import random
+import unittest
+from pynguin.layout import layoutcache
+from pynguin.layout.container import Container
+from pynguin.layout.boxlayout import HBoxLayout
+from pynguin.layout.boxlayout import VBoxLayout
+from pynguin.layout.gridlayout import GridLayout
+from pynguin.layout.size import SizeAllocation
+from pynguin.layout.sizeable import ExpandError
+from mock import MockWidget
+
+# pylint: disable-msg=R0904
+# Because unit tests have tons of public methods and that's normal.
+
+# pylint: disable-msg=W0212
+# Because I know what I'm doing when I use a protected attribute in a test.
+
+
+def MakeRow(cache, sizes, homogeneous=False):
+    """Return an HBox Container of MockWidgets, using cache."""
+    row = Container()
+    row._layout = HBoxLayout(2, homogeneous)
+    row._layout.cache = cache
+    for width, height in sizes:
+        row.addChild(MockWidget(width, height), 'end')
+    return row
+
+
+def Allocations(container):
+    """Return the allocations of the children as tuples."""
+    return [child.allocated_size.asDeepTuple() for child in container.children]
+
+
+class TestLayoutCache(unittest.TestCase):
+    """Test the layoutcache module."""
+
+    def testDocTest(self):
+        """Module layoutcache passes its doctests."""
+        import doctest
+        failures, unused = doctest.testmod(m=layoutcache)
+        del unused
+        self.assertEquals(failures, 0)
+
+    def testCapacity(self):
+        """LayoutCache refuses to hold nothing, and never exceeds capacity."""
+        self.assertRaises(ValueError, layoutcache.LayoutCache, 0)
+        cache = layoutcache.LayoutCache(3)
+        for key in range(10):
+            cache.put(key, ())
+        self.assertEquals(len(cache), 3)
+        self.assertEquals([cache.get(key) for key in (6, 7, 8, 9)],
+                          [None, (), (), ()])
+        self.assertEquals(cache.getStats(), {'hits': 3, 'misses': 1,
+                                             'size': 3, 'capacity': 3})
+        cache.resetStats()
+        cache.clear()
+        self.assertEquals(cache.getStats(), {'hits': 0, 'misses': 0,
+                                             'size': 0, 'capacity': 3})
+
+    def testIdenticalRows(self):
+        """Identical rows share the allocations, translated."""
+        cache = layoutcache.LayoutCache()
+        sizes = [(10, 5), (20, 8), (7, 3)]
+        rows = [MakeRow(cache, sizes) for unused in range(5)]
+        for index, row in enumerate(rows):
+            row.requestSize(True)
+            row.allocateSize(SizeAllocation((3, 50 * index), (80, 8)))
+        self.assertEquals((cache.misses, cache.hits), (1, 4))
+        reference = MakeRow(None, sizes)
+        for index, row in enumerate(rows):
+            reference.requestSize(True)
+            reference.allocateSize(SizeAllocation((3, 50 * index), (80, 8)))
+            self.assertEquals(Allocations(row), Allocations(reference))
+
+    def testSameAsUncached(self):
+        """Cached boxes and grids allocate like the uncached ones."""
+        cache = layoutcache.LayoutCache(8)
+        rand = random.Random(42)
+        for unused in range(200):
+            sizes = [(rand.randint(0, 4), rand.randint(0, 4))
+                     for unused in range(3)]
+            expandables = [rand.random() < 0.7 for unused in range(3)]
+            homogeneous = rand.random() < 0.5
+            pair = [MakeRow(cache, sizes, homogeneous),
+                    MakeRow(None, sizes, homogeneous)]
+            if rand.random() < 0.5:
+                for row in pair:
+                    row._layout = GridLayout(1)
+                    row._layout.cache = cache if row is pair[0] else None
+                    for index, child in enumerate(row.children):
+                        row._layout.attach(child, index % 2, index // 2)
+            for row in pair:
+                for child, expandable in zip(row.children, expandables):
+                    child.can_expand_width = expandable
+                row.requestSize(True)
+            size = (rand.randint(0, 20), rand.randint(0, 20))
+            # The second time, the cached row is allocated from the cache.
+            for unused in range(2):
+                allocation = SizeAllocation((rand.randint(-9, 9),
+                                             rand.randint(-9, 9)), size)
+                results = []
+                for row in pair:
+                    try:
+                        row.allocateSize(allocation)
+                    except ExpandError:
+                        results.append(None)
+                    else:
+                        results.append(Allocations(row))
+                self.assertEquals(results[0], results[1])
+        self.assertTrue(cache.hits > 0)
+
+    def testKey(self):
+        """A change of requested size, flag or parameter is a miss."""
+        cache = layoutcache.LayoutCache()
+        row = MakeRow(cache, [(10, 5), (20, 8)])
+        def Allocate():
+            row.requestSize(True)
+            row.invalidateAllocation()
+            row.allocateSize(SizeAllocation((0, 0), (40, 8)))
+        Allocate()
+        Allocate()
+        self.assertEquals((cache.misses, cache.hits), (1, 1))
+        row.children[0].width = 11
+        row.children[0].invalidateRequestedSize()
+        Allocate()
+        row.children[1].can_expand_width = False
+        Allocate()
+        row._layout.spacing = 3
+        Allocate()
+        self.assertEquals((cache.misses, cache.hits), (4, 1))
+        # A VBox of the same children is another layout.
+        row._layout = VBoxLayout(3, False)
+        row._layout.cache = cache
+        row.requestSize(True)
+        row.allocateSize(SizeAllocation((0, 0), row.requested_size))
+        self.assertEquals((cache.misses, cache.hits), (5, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
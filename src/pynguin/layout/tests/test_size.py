@@ -5,6 +5,8 @@ Created on Nov 4, 2010
 @author: Niriel
 """
 
+import copy
+import pickle
 import unittest
 from pynguin.layout import size
 
@@ -16,5 +18,47 @@ class TestDocTest(unittest.TestCase):
         del tests # Just to remove the eclipse warning on the unused variable.
         self.assertEquals(failures, 0)
 
+class TestFrozen(unittest.TestCase):
+    """Test the immutable geometry types."""
+    def testNoDict(self):
+        """Frozen objects have no __dict__."""
+        for frozen in (size.FrozenSize(1, 2), size.FrozenPos(1, 2),
+                       size.FrozenSizeAllocation((1, 2), (3, 4))):
+            self.assertFalse(hasattr(frozen, '__dict__'))
+
+    def testCompareWithMutable(self):
+        """Frozen and mutable objects compare equal both ways."""
+        pairs = [(size.Size(1, 2), size.FrozenSize(1, 2)),
+                 (size.Pos(1, 2), size.FrozenPos(1, 2)),
+                 (size.SizeAllocation((1, 2), (3, 4)),
+                  size.FrozenSizeAllocation((1, 2), (3, 4)))]
+        for mutable, frozen in pairs:
+            self.assertTrue(mutable == frozen)
+            self.assertTrue(frozen == mutable)
+            self.assertFalse(mutable != frozen)
+            self.assertFalse(frozen != mutable)
+            self.assertEquals(mutable.freeze(), frozen)
+            self.assertEquals(frozen.thaw().__class__, mutable.__class__)
+        self.assertNotEqual(size.FrozenSizeAllocation((1, 2), (3, 4)),
+                            size.SizeAllocation((1, 2), (3, 5)))
+
+    def testCopyAndPickle(self):
+        """Frozen objects survive copy and pickle."""
+        for frozen in (size.FrozenSize(1, 2), size.FrozenPos(1, 2),
+                       size.FrozenSizeAllocation((1, 2), (3, 4))):
+            self.assertTrue(copy.copy(frozen) is frozen)
+            for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+                clone = pickle.loads(pickle.dumps(frozen, protocol))
+                self.assertEquals(clone, frozen)
+                self.assertEquals(clone.__class__, frozen.__class__)
+
+    def testCheckSize(self):
+        """FrozenSizeAllocation refuses invalid sizes."""
+        self.assertRaises(ValueError, size.FrozenSizeAllocation, (0, 0),
+                          (-1, 0))
+        self.assertRaises(TypeError, size.FrozenSizeAllocation, (0, 0),
+                          (0, 1.5))
+
+
 if __name__ == "__main__":
     unittest.main()
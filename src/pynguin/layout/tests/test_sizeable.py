@@ -70,5 +70,50 @@ class TestSizeable(unittest.TestCase):
         widget.allocateSize(big_width)
         widget.allocateSize(big_height)
 
+    def testAllocateSizeSkip(self):
+        """Sizeable.allocateSize skips unchanged allocations."""
+        widget = MockWidget(10, 20)
+        widget.requestSize(True)
+        allocation = size.SizeAllocation((1, 2), (10, 20))
+        sizeable.ResetAllocationCounts()
+        widget.allocateSize(allocation)
+        widget.allocateSize(allocation)
+        widget.allocateSize(size.SizeAllocation((1, 2), (10, 20)))
+        self.assertEquals(sizeable.GetAllocationCounts(),
+                          {'performed': 1, 'skipped': 2})
+        # A new allocation is performed.
+        widget.allocateSize(size.SizeAllocation((1, 3), (10, 20)))
+        self.assertEquals(sizeable.GetAllocationCounts(),
+                          {'performed': 2, 'skipped': 2})
+        # Same allocation but new requested size: performed.
+        widget.height = 30
+        widget.requestSize(True)
+        widget.allocateSize(size.SizeAllocation((1, 3), (10, 20)))
+        self.assertEquals(sizeable.GetAllocationCounts(),
+                          {'performed': 3, 'skipped': 2})
+        # Same requested size: skipped.
+        widget.requestSize(True)
+        widget.allocateSize(size.SizeAllocation((1, 3), (10, 20)))
+        self.assertEquals(sizeable.GetAllocationCounts(),
+                          {'performed': 3, 'skipped': 3})
+
+    def testMoveToResize(self):
+        """Sizeable.moveTo and resize perform a new allocation."""
+        widget = MockWidget(10, 20)
+        widget.negotiateSize(True)
+        allocated_size = widget.allocated_size
+        widget.moveTo(5, 6)
+        self.assertEquals(widget.allocated_size,
+                          size.SizeAllocation((5, 6), (10, 20)))
+        widget.resize(3, 4)
+        self.assertEquals(widget.allocated_size,
+                          size.SizeAllocation((5, 6), (3, 4)))
+        widget.moveAndResize(7, 8, 9, 10)
+        self.assertEquals(widget.allocated_size,
+                          size.SizeAllocation((7, 8), (9, 10)))
+        # The previous allocation was not modified in place.
+        self.assertEquals(allocated_size,
+                          size.SizeAllocation((0, 0), (10, 20)))
+
 #if __name__ == "__main__":
 #    unittest.main()
@@ -0,0 +1,109 @@
+#! /usr/bin/python
+"""
+Created on Oct 18, 2026
+
+@author: Niriel
+"""
+
+import random
+import unittest
+from pynguin.layout import tools
+
+# pylint: disable-msg=R0904
+# Because unit tests have tons of public methods and that's normal.
+
+
+def RandomCases(rng, cases_nb):
+    """Yield random (ori_lengths, dest_length) couples, zeros included."""
+    for unused in xrange(cases_nb):
+        count = rng.randint(0, 12)
+        ori_lengths = [rng.choice([0, 1, rng.randint(0, 500)])
+                       for unused in xrange(count)]
+        dest_length = rng.choice([0, sum(ori_lengths),
+                                  rng.randint(0, 2000)])
+        yield ori_lengths, dest_length
+
+
+class TestTools(unittest.TestCase):
+    """Test the tools module."""
+
+    def testDocTest(self):
+        """Module tools passes its doctests."""
+        import doctest
+        failures, unused = doctest.testmod(m=tools)
+        del unused
+        self.assertEquals(failures, 0)
+
+    def testHomothecyProperties(self):
+        """Homothecy preserves the sum and stays close to the exact values."""
+        rng = random.Random(6)
+        for ori_lengths, dest_length in RandomCases(rng, 2000):
+            positions, lengths = tools.Homothecy(ori_lengths, dest_length)
+            self.assertEquals(len(lengths), len(ori_lengths))
+            if not ori_lengths:
+                continue
+            self.assertEquals(sum(lengths), dest_length)
+            # Positions are the accumulated lengths.
+            self.assertEquals(positions[0], 0)
+            for i in xrange(1, len(lengths)):
+                self.assertEquals(positions[i],
+                                  positions[i - 1] + lengths[i - 1])
+            # Each length is its exact value rounded down or up.
+            ori_end = sum(ori_lengths)
+            if not ori_end:
+                ori_lengths = [1] * len(ori_lengths)
+                ori_end = len(ori_lengths)
+            for ori_length, length in zip(ori_lengths, lengths):
+                exact = ori_length * dest_length
+                self.assertTrue(length * ori_end >= exact - ori_end + 1)
+                self.assertTrue(length * ori_end <= exact + ori_end - 1)
+            # Equal lengths differ by one at most.
+            for i in xrange(len(lengths) - 1):
+                if ori_lengths[i] == ori_lengths[i + 1]:
+                    self.assertTrue(abs(lengths[i] - lengths[i + 1]) <= 1)
+
+    def testHomothecyIdentity(self):
+        """Homothecy returns the original lengths when they fit."""
+        ori_lengths = [3, 0, 7]
+        positions, lengths = tools.Homothecy(ori_lengths, 10)
+        self.assertEquals(lengths, ori_lengths)
+        self.assertFalse(lengths is ori_lengths)
+        self.assertEquals(positions, [0, 3, 3])
+
+    def testHomothecyBatch(self):
+        """HomothecyBatch gives the results of Homothecy for every list."""
+        rng = random.Random(7)
+        cases = list(RandomCases(rng, 300))
+        # Lists of different sizes.
+        ori_lengths_list = [case[0] for case in cases]
+        dest_lengths = [case[1] for case in cases]
+        expected = ([tools.Homothecy(*case)[0] for case in cases],
+                    [tools.Homothecy(*case)[1] for case in cases])
+        self.assertEquals(tools.HomothecyBatch(ori_lengths_list,
+                                               dest_lengths), expected)
+        # Rectangular batch, vectorized when NumPy is installed.
+        ori_lengths_list = [[rng.randint(0, 3) for unused in xrange(5)]
+                            for unused in xrange(300)]
+        dest_lengths = [rng.randint(0, 40) for unused in xrange(300)]
+        expected = [tools.Homothecy(ori_lengths, dest_length)
+                    for ori_lengths, dest_length in zip(ori_lengths_list,
+                                                        dest_lengths)]
+        expected = ([result[0] for result in expected],
+                    [result[1] for result in expected])
+        self.assertEquals(tools.HomothecyBatch(ori_lengths_list,
+                                               dest_lengths), expected)
+        self.assertRaises(ValueError, tools.HomothecyBatch, [[1]], [1, 2])
+
+    @unittest.skipIf(tools.numpy is None, "NumPy is not installed.")
+    def testVectorHomothecy(self):
+        """VectorHomothecy gives the results of Homothecy."""
+        rng = random.Random(8)
+        for ori_lengths, dest_length in RandomCases(rng, 500):
+            positions, lengths = tools.VectorHomothecy(ori_lengths,
+                                                       dest_length)
+            self.assertEquals((positions.tolist(), lengths.tolist()),
+                              tools.Homothecy(ori_lengths, dest_length))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+#! /usr/bin/python
+"""
+Created on Oct 18, 2026
+
+@author: Niriel
+"""
+
+import random
+import unittest
+from pynguin.layout import virtualboxlayout
+from pynguin.layout.size import Size
+from pynguin.layout.size import SizeAllocation
+from mock import MockWidget
+
+# pylint: disable-msg=R0904
+# Because unit tests have tons of public methods and that's normal.
+
+
+class TestHeightIndex(unittest.TestCase):
+    """Test the class virtualboxlayout.HeightIndex."""
+
+    def testDocTest(self):
+        """Module virtualboxlayout passes its doctests."""
+        import doctest
+        failures, unused = doctest.testmod(m=virtualboxlayout)
+        del unused
+        self.assertEquals(failures, 0)
+
+    def testSameAsLists(self):
+        """HeightIndex gives the same results as sums over a list."""
+        rng = random.Random(1)
+        for unused in range(100):
+            heights = [rng.choice([0, 1, 5, 17])
+                       for unused in range(rng.randint(1, 40))]
+            index = virtualboxlayout.HeightIndex(heights[:3])
+            for height in heights[3:]:
+                index.append(height)
+            for unused in range(10):
+                item = rng.randrange(len(heights))
+                heights[item] = rng.randint(0, 9)
+                index.setHeight(item, heights[item])
+            count = rng.randint(1, len(heights))
+            del heights[count:]
+            index.truncate(count)
+            self.assertEquals(len(index), len(heights))
+            self.assertEquals(index.getTotal(), sum(heights))
+            for item in range(len(heights) + 1):
+                self.assertEquals(index.getTop(item), sum(heights[:item]))
+            for pos_y in range(sum(heights)):
+                item = index.findIndex(pos_y)
+                self.assertTrue(sum(heights[:item]) <= pos_y <
+                                sum(heights[:item + 1]))
+
+
+class TestVirtualBoxLayout(unittest.TestCase):
+    """Test the class virtualboxlayout.VirtualBoxLayout."""
+
+    def testMeasure(self):
+        """The requested size uses the measured heights and the estimates."""
+        layout = virtualboxlayout.VirtualBoxLayout(100, 10)
+        child = MockWidget(30, 25)
+        child.requestSize(True)
+        layout.attach(child, 7)
+        self.assertEquals(layout.requestSize([child]), Size(30, 1015))
+        self.assertEquals(layout.getRange(70, 95), (7, 8))
+        self.assertEquals(layout.getRange(70, 96), (7, 9))
+
+    def testAttachOutOfRange(self):
+        """VirtualBoxLayout.attach refuses the items that do not exist."""
+        layout = virtualboxlayout.VirtualBoxLayout(3)
+        self.assertRaises(IndexError, layout.attach, MockWidget(1, 1), 3)
+        layout.setCount(4)
+        layout.attach(MockWidget(1, 1), 3)
+
+    def testAllocate(self):
+        """Each child is placed at the top of its item."""
+        layout = virtualboxlayout.VirtualBoxLayout(10, 10)
+        children = [MockWidget(5, 10), MockWidget(5, 10)]
+        for item, child in zip((3, 4), children):
+            child.requestSize(True)
+            layout.attach(child, item)
+        layout.allocateSize(SizeAllocation((1, -20), (50, 30)),
+                            layout.requestSize(children), children)
+        self.assertEquals(children[1].allocated_size,
+                          SizeAllocation((1, 20), (50, 10)))
+
+
+if __name__ == "__main__":
+    unittest.main()
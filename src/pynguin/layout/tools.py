@@ -5,6 +5,15 @@ Created on Mar 17, 2011
 @author: delforge
 """
 
+try:
+    import numpy
+except ImportError:
+    # NumPy is optional: HomothecyBatch then falls back to Homothecy.
+    numpy = None
+
+__all__ = ['Homothecy', 'HomothecyBatch', 'VectorHomothecy']
+
+
 def Homothecy(ori_lengths, dest_length):
     """Return a list of pos and lengths zoomed in or out to fit a length.
 
@@ -40,26 +49,122 @@ def Homothecy(ori_lengths, dest_length):
     the destination length you pass as a parameter.  That's what this function
     is made for.
 
+    The computation only uses integers.  Each length first receives the
+    integer part of its exact zoomed value.  The pixels left are given one by
+    one to the lengths having the largest fractional parts (largest
+    remainder method).  In case of a tie, the first length wins.
+
+    >>> print Homothecy([1, 1, 1], 5)
+    ([0, 2, 4], [2, 2, 1])
+
+    When all the original lengths are 0, the destination length is shared
+    evenly.
+
+    >>> print Homothecy([0, 0, 0], 7)
+    ([0, 3, 5], [3, 2, 2])
+
+    """
+    dest_lengths = list(ori_lengths) # Safer to return a new object.
+    ori_end = sum(dest_lengths)
+    count = len(dest_lengths)
+    if ori_end != dest_length and count:
+        if not ori_end:
+            # Nothing to be proportional to: share evenly.
+            dest_lengths = [1] * count
+            ori_end = count
+        remainders = []
+        for i, length in enumerate(dest_lengths):
+            dest_lengths[i], remainder = divmod(length * dest_length, ori_end)
+            remainders.append(remainder)
+        left = dest_length - sum(dest_lengths)
+        if left:
+            # sorted is stable: the first lengths win the ties.
+            ids = sorted(xrange(count), key=remainders.__getitem__,
+                         reverse=True)
+            for i in ids[:left]:
+                dest_lengths[i] += 1
+    dest_positions = [0] * count
+    position = 0
+    for i, length in enumerate(dest_lengths):
+        dest_positions[i] = position
+        position += length
+    return dest_positions, dest_lengths
+
+
+def _VectorLengths(ori_lengths, dest_lengths):
+    """Return the lengths of Homothecy for each row of a 2D int64 array.
+
+    dest_lengths is a 1D int64 array with one destination length per row.
+
+    """
+    rows_nb, count = ori_lengths.shape
+    if not count:
+        return ori_lengths.copy()
+    ori_ends = ori_lengths.sum(axis=1)
+    # Rows that already have the right length are left as they are: the
+    # computation gives them their original lengths anyway.  Rows full of 0
+    # are shared evenly, as if they were full of 1.
+    zeros = ori_ends == 0
+    if zeros.any():
+        ori_lengths = ori_lengths.copy()
+        ori_lengths[zeros] = 1
+        ori_ends = numpy.where(zeros, count, ori_ends)
+    products = ori_lengths * dest_lengths[:, numpy.newaxis]
+    lengths = products // ori_ends[:, numpy.newaxis]
+    remainders = products - lengths * ori_ends[:, numpy.newaxis]
+    lefts = dest_lengths - lengths.sum(axis=1)
+    # Rank the remainders of each row, largest first.  The merge sort is
+    # stable: the first lengths win the ties.
+    order = numpy.argsort(-remainders, axis=1, kind='mergesort')
+    ranks = numpy.empty_like(order)
+    ranks[numpy.arange(rows_nb)[:, numpy.newaxis], order] = \
+        numpy.arange(count)
+    lengths += ranks < lefts[:, numpy.newaxis]
+    return lengths
+
+
+def VectorHomothecy(ori_lengths, dest_length):
+    """NumPy version of Homothecy: take and return 1D int64 arrays.
+
+    Requires NumPy.  The results are exactly those of Homothecy.
+
+    """
+    ori_lengths = numpy.asarray(ori_lengths, numpy.int64)
+    lengths = _VectorLengths(ori_lengths[numpy.newaxis, :],
+                             numpy.array([dest_length], numpy.int64))[0]
+    positions = numpy.cumsum(lengths) - lengths
+    return positions, lengths
+
+
+def HomothecyBatch(ori_lengths_list, dest_lengths):
+    """Apply Homothecy to many lists of lengths at once.
+
+    Parameters.
+    ===========
+
+    * ori_lengths_list: a list of lists of integers, like the rows of a grid.
+    * dest_lengths: a list of integers, one destination length per list.
+
+    The result is a tuple containing two lists of lists: the positions and the
+    lengths, exactly as if Homothecy had been called for each list.
+
+    When NumPy is installed and all the lists have the same number of
+    elements, all the lists are processed at once with array operations.
+
+    >>> print HomothecyBatch([[50, 100, 33], [1, 1, 1]], [91, 5])
+    ([[0, 25, 75], [0, 2, 4]], [[25, 50, 16], [2, 2, 1]])
+
     """
-    ori_positions = [0]
-    for length in ori_lengths:
-        ori_positions.append(ori_positions[-1] + length)
-    ori_end = ori_positions[-1]
-    if ori_end == dest_length:
-        # No need to do any math here.
-        dest_lengths = list(ori_lengths) # Safer to return a new object.
-        dest_positions = [0]
-        for length in dest_lengths[:-1]:
-            dest_positions.append(dest_positions[-1] + length)
-        return dest_positions, dest_lengths
-    #
-    factor = float(dest_length) / ori_end # Integer divisions create problems.
-    dest_positions = [int(round(ori_position * factor)) \
-                      for ori_position in ori_positions]
-    #
-    dest_lengths = []
-    for i in xrange(len(dest_positions) - 1):
-        dest_length = dest_positions[i + 1] - dest_positions[i]
-        dest_lengths.append(dest_length)
-    #
-    return dest_positions[:-1], dest_lengths
\ No newline at end of file
+    if len(ori_lengths_list) != len(dest_lengths):
+        raise ValueError("One destination length per list of lengths.")
+    counts = set(len(ori_lengths) for ori_lengths in ori_lengths_list)
+    if numpy is None or len(counts) != 1:
+        results = [Homothecy(ori_lengths, dest_length)
+                   for ori_lengths, dest_length in zip(ori_lengths_list,
+                                                       dest_lengths)]
+        return [result[0] for result in results], \
+               [result[1] for result in results]
+    lengths = _VectorLengths(numpy.array(ori_lengths_list, numpy.int64),
+                             numpy.array(dest_lengths, numpy.int64))
+    positions = numpy.cumsum(lengths, axis=1) - lengths
+    return positions.tolist(), lengths.tolist()
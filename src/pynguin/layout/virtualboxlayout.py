@@ -0,0 +1,268 @@
+#! /usr/bin/python
+"""Layout of very long lists, of which only a few rows exist at a time.
+
+Created on Oct 18, 2026
+
+@author: Niriel
+
+A chat log of 50000 lines does not need 50000 widgets: only the lines visible
+on the screen need to exist.  A VirtualBoxLayout is a vertical list of items
+identified by their index.  It knows the height of every item, either measured
+(for the items that have been given a widget once) or estimated (for the
+others), and stores them in a HeightIndex.  That index answers in O(log n)
+which item is at a given height and where a given item starts.
+
+The widgets of the visible items are the children of the container.  Each of
+them is attached to the index of its item with VirtualBoxLayout.attach.  The
+size negotiation only involves these children.
+
+"""
+
+from size import Size
+from size import FrozenSizeAllocation
+from layout import Layout
+
+__all__ = ['HeightIndex', 'VirtualBoxLayout']
+
+
+class HeightIndex(object):
+    """Heights of a sequence of items, with fast prefix sums.
+
+    The heights are stored in a Fenwick tree (binary indexed tree): changing a
+    height, finding the top of an item and finding the item at a given height
+    all cost O(log n).
+
+    >>> index = HeightIndex([10, 20, 0, 30])
+    >>> print index.getTop(3), index.getTotal()
+    30 60
+    >>> print index.findIndex(0), index.findIndex(29), index.findIndex(30)
+    0 1 3
+    >>> index.setHeight(1, 5)
+    >>> print index.getTop(3), index.findIndex(29)
+    15 3
+
+    """
+
+    def __init__(self, heights=()):
+        """Initialize a new HeightIndex with a sequence of heights."""
+        object.__init__(self)
+        self._heights = list(heights)
+        self._total = sum(self._heights)
+        # 1-based: node i holds the sum of the heights ]i - lowbit(i), i].
+        tree = [0] + self._heights
+        count = len(self._heights)
+        for i in xrange(1, count + 1):
+            parent = i + (i & -i)
+            if parent <= count:
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def __len__(self):
+        return len(self._heights)
+
+    def getHeight(self, index):
+        """Return the height of the item index."""
+        return self._heights[index]
+
+    def getTotal(self):
+        """Return the sum of all the heights."""
+        return self._total
+
+    def setHeight(self, index, height):
+        """Change the height of the item index."""
+        delta = height - self._heights[index]
+        if not delta:
+            return
+        self._heights[index] = height
+        self._total += delta
+        tree = self._tree
+        count = len(self._heights)
+        i = index + 1
+        while i <= count:
+            tree[i] += delta
+            i += i & -i
+
+    def getTop(self, index):
+        """Return the sum of the heights of the items before index."""
+        tree = self._tree
+        result = 0
+        i = index
+        while i > 0:
+            result += tree[i]
+            i -= i & -i
+        return result
+
+    def findIndex(self, pos_y):
+        """Return the index of the item covering the height pos_y.
+
+        The items of height 0 never cover anything.  Return 0 for a negative
+        pos_y, and the index of the last item for a pos_y beyond the total.
+        The index must not be empty.
+
+        """
+        tree = self._tree
+        count = len(self._heights)
+        index = 0
+        remaining = pos_y
+        bit = 1
+        while bit * 2 <= count:
+            bit *= 2
+        while bit:
+            # Invariant: the items before index are all above pos_y.
+            if index + bit <= count and tree[index + bit] <= remaining:
+                index += bit
+                remaining -= tree[index]
+            bit //= 2
+        return min(index, count - 1)
+
+    def append(self, height):
+        """Add an item at the end."""
+        self._heights.append(height)
+        self._total += height
+        count = len(self._heights)
+        first = count - (count & -count)
+        self._tree.append(height + self.getTop(count - 1) - self.getTop(first))
+
+    def truncate(self, count):
+        """Remove the items from index count onward."""
+        removed = self._heights[count:]
+        if removed:
+            del self._heights[count:]
+            # The nodes kept only cover items that are kept.
+            del self._tree[count + 1:]
+            self._total -= sum(removed)
+
+
+class VirtualBoxLayout(Layout):
+    """A vertical list of items of which only some have a widget.
+
+    Parameters.
+    ===========
+
+    * count: the number of items in the list.
+    * estimate: the height given to the items that have never been measured.
+
+    The requested height is the height of all the items, measured or not.  The
+    requested width is the largest width measured so far.  Each child gets
+    the allocated width, and the height of its item.  Its top is the top of
+    the allocation plus the top of its item: allocate a negative top to scroll
+    the list down.
+
+    >>> from sizeable import Sizeable
+    >>> class Row(Sizeable):
+    ...     def _requestSize(self):
+    ...         return Size(50, 30)
+    ...     def _allocateSize(self):
+    ...         pass
+    >>> layout = VirtualBoxLayout(1000, 20)
+    >>> rows = [Row(), Row()]
+    >>> layout.attach(rows[0], 500)
+    >>> layout.attach(rows[1], 501)
+    >>> for row in rows:
+    ...     row.requestSize(True)
+    >>> print layout.requestSize(rows)
+    Size(50, 20020)
+    >>> print layout.getRange(10000, 10040)
+    (500, 502)
+    >>> layout.allocateSize(FrozenSizeAllocation((0, -10000), (80, 40)),
+    ...                     Size(50, 20020), rows)
+    >>> print rows[1].allocated_size.asDeepTuple()
+    ((0, 30), (80, 30))
+
+    """
+
+    def __init__(self, count=0, estimate=20):
+        """Initialize a new VirtualBoxLayout object."""
+        Layout.__init__(self)
+        self.estimate = estimate
+        self.index = HeightIndex([estimate] * count)
+        self.width = 0
+        self._items = {}
+
+    def setCount(self, count):
+        """Change the number of items.
+
+        The new items get the estimated height.  The children attached to
+        removed items must be removed by the caller.
+
+        """
+        index = self.index
+        if count < len(index):
+            index.truncate(count)
+        else:
+            estimate = self.estimate
+            for unused in xrange(count - len(index)):
+                index.append(estimate)
+
+    def attach(self, child, item):
+        """Give to child the item of index item."""
+        if not 0 <= item < len(self.index):
+            raise IndexError("Item %i out of range." % item)
+        self._items[child] = item
+
+    def detach(self, child):
+        """Forget the item of child."""
+        del self._items[child]
+
+    def getItem(self, child):
+        """Return the index of the item of child."""
+        try:
+            return self._items[child]
+        except KeyError:
+            raise ValueError("Child not attached to the VirtualBoxLayout, "
+                             "call attach first.")
+
+    def measure(self, child):
+        """Store the requested size of child as the size of its item.
+
+        Return True when the height of the item changed.
+
+        """
+        requested_size = child.requested_size
+        if requested_size.width > self.width:
+            self.width = requested_size.width
+        item = self.getItem(child)
+        index = self.index
+        if index.getHeight(item) == requested_size.height:
+            return False
+        index.setHeight(item, requested_size.height)
+        return True
+
+    def getRange(self, top, bottom):
+        """Return (first, end): the items between the heights top and bottom.
+
+        The items first to end - 1 intersect the interval [top, bottom[.
+
+        """
+        index = self.index
+        if not len(index) or bottom <= top:
+            return 0, 0
+        total = index.getTotal()
+        if bottom <= 0 or top >= total:
+            return 0, 0
+        return index.findIndex(top), index.findIndex(bottom - 1) + 1
+
+    def requestSize(self, children):
+        """Measure the children and return the size of the whole list."""
+        for child in children:
+            self.measure(child)
+        return Size(self.width, self.index.getTotal())
+
+    def allocateSize(self, allocated_size, requested_size, children):
+        """Place each child at the top of its item.
+
+        A child that cannot expand horizontally keeps its requested width.
+
+        """
+        index = self.index
+        left = allocated_size.left
+        top = allocated_size.top
+        width = allocated_size.width
+        for child in children:
+            item = self.getItem(child)
+            child_width = width
+            if not child.can_expand_width:
+                child_width = min(width, child.requested_size.width)
+            child.allocateSize(FrozenSizeAllocation(
+                (left, top + index.getTop(item)),
+                (child_width, index.getHeight(item))))
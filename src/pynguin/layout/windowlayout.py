@@ -6,7 +6,7 @@ Created on Dec 12, 2010
 """
 
 from size import Size
-from size import SizeAllocation
+from size import FrozenSizeAllocation
 from layout import Layout
 
 __all__ = ['WindowLayout']
@@ -37,6 +37,7 @@ class WindowLayout(Layout):
         As a result, the position of the child is always (0, 0).
 
         """
+        cell_size = FrozenSizeAllocation((0, 0), (allocated_size.width,
+                                                  allocated_size.height))
         for child in cells:
-            cell_size = SizeAllocation((0, 0), allocated_size.size)
             child.allocateSize(cell_size)
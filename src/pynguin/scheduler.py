@@ -0,0 +1,190 @@
+#! /usr/bin/python
+"""Schedule the size negotiations and the redrawings of the widgets.
+
+Created on Oct 18, 2026
+
+@author: Niriel
+
+Widgets that change do not negotiate their size or redraw themselves
+immediately.  They ask a Scheduler to do it later, once per frame.  That way a
+widget modified ten times during a frame is processed only once, and the
+parents shared by several modified widgets are processed only once too.
+
+The Scheduler owns two dirty queues: one for the size negotiation, one for the
+redrawing.  Each queue is a dictionary mapping a widget to a priority, so
+asking twice for the same widget costs nothing.
+
+Once per frame, the application calls Scheduler.proceed.  The work is done in
+a defined order:
+
+1. size negotiation, one tree at a time.  Several roots are supported: each
+   modified widget is attached to the root of its tree, and every root
+   involved renegotiates its size.  Only the invalid path of each tree is
+   recomputed (see Sizeable.refreshRequestedSize).
+2. redrawing, from the deepest widgets up to the roots.  Each redrawn widget
+   asks its closest ancestor having a sprite to be redrawn too.
+
+Each frame has a time budget.  When it is exhausted, the remaining work having
+a priority lower than PRIORITY_HIGH is deferred to the next frame.  Work with
+PRIORITY_HIGH is always done.
+
+"""
+
+import heapq
+import time
+from pynguin.layout.size import SizeAllocation
+
+__all__ = ['Scheduler', 'GetDefaultScheduler',
+           'PRIORITY_LOW', 'PRIORITY_NORMAL', 'PRIORITY_HIGH']
+
+PRIORITY_LOW = 0
+PRIORITY_NORMAL = 1
+PRIORITY_HIGH = 2
+
+
+def _Enqueue(queue, wid, priority):
+    """Add wid to the queue, keeping the highest priority if already there."""
+    if queue.get(wid, -1) < priority:
+        queue[wid] = priority
+
+
+def _GetRoot(wid):
+    """Return the root of the tree containing wid."""
+    parent = wid.parent
+    while parent is not None:
+        wid = parent
+        parent = wid.parent
+    return wid
+
+
+class Scheduler(object):
+    """Decide when the widgets negotiate their size and redraw themselves.
+
+    >>> scheduler = Scheduler()
+    >>> print scheduler.hasPendingWork()
+    False
+
+    """
+    FRAME_BUDGET = 1.0 / 60
+
+    def __init__(self, frame_budget=None, clock=time.time):
+        """Initialize a new Scheduler object.
+
+        Parameters.
+        ===========
+
+        * frame_budget: float, number of seconds that proceed may spend per
+          frame.  None for FRAME_BUDGET.
+        * clock: function returning the current time in seconds.
+
+        """
+        object.__init__(self)
+        if frame_budget is None:
+            frame_budget = self.FRAME_BUDGET
+        self.frame_budget = frame_budget
+        self.clock = clock
+        self._to_resize = {}
+        self._to_redraw = {}
+        self.frame_stats = {'negotiated': 0, 'redrawn': 0, 'deferred': 0}
+
+    def askForSizeNegotiation(self, wid, priority=PRIORITY_NORMAL):
+        """Renegotiate the size of the tree containing wid at next frame."""
+        _Enqueue(self._to_resize, wid, priority)
+
+    def askForRedrawing(self, wid, priority=PRIORITY_NORMAL):
+        """Redraw wid and the widgets displaying it at next frame."""
+        _Enqueue(self._to_redraw, wid, priority)
+
+    def hasPendingWork(self):
+        """Return True if some work is waiting, deferred or not."""
+        return bool(self._to_resize or self._to_redraw)
+
+    def _isOverBudget(self, deadline):
+        """Return True when the deadline is passed.  None means no deadline."""
+        return deadline is not None and self.clock() >= deadline
+
+    def proceedToSizeNegotiation(self, deadline=None):
+        """Negotiate the size of all the trees containing modified widgets.
+
+        The roots with the highest priorities are processed first.  Once the
+        deadline is passed, the roots having a priority lower than
+        PRIORITY_HIGH are left in the queue for the next call.
+
+        """
+        roots = {}
+        for wid, priority in self._to_resize.iteritems():
+            wid.invalidateRequestedSize()
+            _Enqueue(roots, _GetRoot(wid), priority)
+        self._to_resize = {}
+        ordered = sorted(roots.iteritems(), key=lambda item: -item[1])
+        for root, priority in ordered:
+            if priority < PRIORITY_HIGH and self._isOverBudget(deadline):
+                self._to_resize[root] = priority
+                self.frame_stats['deferred'] += 1
+                continue
+            root.refreshRequestedSize()
+            allocated_size = root.allocated_size
+            pos = allocated_size.pos if allocated_size else (0, 0)
+            root.allocateSize(SizeAllocation(pos, root.requested_size))
+            self.frame_stats['negotiated'] += 1
+
+    def proceedToRedrawing(self, deadline=None):
+        """Redraw the modified widgets, from the deepest to the roots.
+
+        Redrawing is a bit different from resizing: only the widgets that
+        have a sprite can be redrawn.  BUT we do not want to break the chain:
+        in the case of a window-hbox-button, window and button have sprites
+        and hbox doesn't.  Even though hbox needs no redrawing, window does.
+        So each redrawn widget asks the first ancestor having a sprite to be
+        redrawn too.
+
+        Once the deadline is passed, the widgets having a priority lower than
+        PRIORITY_HIGH are left in the queue for the next call.  Their
+        ancestors are not asked to redraw because of them.
+
+        """
+        queue = self._to_redraw
+        self._to_redraw = {}
+        heap = []
+        counter = 0
+        for wid in queue:
+            heap.append((-wid.altitude, counter, wid))
+            counter += 1
+        heapq.heapify(heap)
+        while heap:
+            unused, unused, wid = heapq.heappop(heap)
+            priority = queue[wid]
+            if priority < PRIORITY_HIGH and self._isOverBudget(deadline):
+                self._to_redraw[wid] = priority
+                self.frame_stats['deferred'] += 1
+                continue
+            wid.draw()
+            self.frame_stats['redrawn'] += 1
+            parent = wid.parent
+            while parent is not None and not parent._sprite:
+                parent = parent.parent
+            if parent is not None:
+                if parent not in queue:
+                    heapq.heappush(heap, (-parent.altitude, counter, parent))
+                    counter += 1
+                _Enqueue(queue, parent, priority)
+
+    def proceed(self):
+        """Do the work of one frame: size negotiation, then redrawing.
+
+        The work takes at most frame_budget seconds, plus the work having
+        PRIORITY_HIGH, plus the duration of the last unit of work started
+        before the deadline.  Whatever remains is done at the next call.
+
+        """
+        self.frame_stats = {'negotiated': 0, 'redrawn': 0, 'deferred': 0}
+        deadline = self.clock() + self.frame_budget
+        self.proceedToSizeNegotiation(deadline)
+        self.proceedToRedrawing(deadline)
+
+
+_default_scheduler = Scheduler()
+
+def GetDefaultScheduler():
+    """Return the Scheduler used by the functions of the pynguin package."""
+    return _default_scheduler
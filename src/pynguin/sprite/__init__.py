@@ -11,3 +11,17 @@ from textboxsprite import TextBoxSprite
 from screensprite import ScreenSprite
 from scrollsprite import ScrollSprite
 from windowsprite import WindowSprite
+from textcache import TextMetricsCache
+from textcache import GetDefaultTextMetricsCache
+from textcache import RenderedTextCache
+from textcache import GetDefaultRenderedTextCache
+from glyphatlas import GlyphAtlas
+from glyphatlas import GetGlyphAtlas
+from rectangle import GradientCache
+from rectangle import GetDefaultGradientCache
+from skin import NineSlice
+from skin import Skin
+from surfacepool import SurfacePool
+from surfacepool import GetDefaultSurfacePool
+from displayformat import CreateSurface
+from displayformat import GetFormatVersion
@@ -15,6 +15,14 @@ class ButtonSprite(GuiSprite):
 
     Its appearance is set by the setMode method.
 
+    The gradients of the backgrounds come from the GradientCache of the
+    sprite, shared by default: all the buttons of the same size and colors
+    blit the same surface.  Set gradients to None to draw the gradient each
+    time.
+
+    With a skin, each mode is drawn by the image of the same name, if the skin
+    has it.
+
     """
     BG_COLOR_NORMAL_TOP = (240, 240, 240)
     BG_COLOR_NORMAL_BOTTOM = (230, 230, 230)
@@ -23,6 +31,7 @@ class ButtonSprite(GuiSprite):
     BG_COLOR_PRESSED = (220, 220, 220)
     BG_COLOR_INACTIVE = (200, 200, 200)
     BD_COLOR = (100, 100, 100)
+    SKIN_NAME = 'button'
 
     def __init__(self):
         """Initialize a new button.
@@ -31,30 +40,46 @@ class ButtonSprite(GuiSprite):
 
         """
         GuiSprite.__init__(self)
+        self.gradients = rectangle.GetDefaultGradientCache()
         self._draw_function = None
         self.setMode('normal')
 
+    def _drawVGrad(self, bg_color_top, bg_color_bottom):
+        """Fill the image with a vertical gradient."""
+        if self.gradients is None:
+            rectangle.RectangleVGrad(self.drawable_image, bg_color_top,
+                                     bg_color_bottom)
+        else:
+            gradient = self.gradients.getVGrad(self.drawable_image.get_size(),
+                                               bg_color_top, bg_color_bottom)
+            self.drawable_image.blit(gradient, (0, 0))
+
     def _drawNormal(self):
         """Draw a normal button."""
-        rectangle.RectangleVGrad(self.drawable_image,
-                                 self.BG_COLOR_NORMAL_TOP,
-                                 self.BG_COLOR_NORMAL_BOTTOM)
+        if self._drawSkin('normal'):
+            return
+        self._drawVGrad(self.BG_COLOR_NORMAL_TOP, self.BG_COLOR_NORMAL_BOTTOM)
         rectangle.Border(self.drawable_image, self.BD_COLOR, 2)
 
     def _drawHighlighted(self):
         """Draw a highlighted button."""
-        rectangle.RectangleVGrad(self.drawable_image,
-                                 self.BG_COLOR_HIGHLIGHT_TOP,
-                                 self.BG_COLOR_HIGHLIGHT_BOTTOM)
+        if self._drawSkin('highlighted'):
+            return
+        self._drawVGrad(self.BG_COLOR_HIGHLIGHT_TOP,
+                        self.BG_COLOR_HIGHLIGHT_BOTTOM)
         rectangle.Border(self.drawable_image, self.BD_COLOR, 2)
 
     def _drawPressed(self):
         """Draw a pressed button."""
+        if self._drawSkin('pressed'):
+            return
         self.drawable_image.fill(self.BG_COLOR_PRESSED)
         rectangle.Border(self.drawable_image, self.BD_COLOR, 2)
 
     def _drawInactive(self):
         """Draw an inactive button."""
+        if self._drawSkin('inactive'):
+            return
         self.drawable_image.fill(self.BG_COLOR_INACTIVE)
         rectangle.Border(self.drawable_image, self.BD_COLOR, 2)
 
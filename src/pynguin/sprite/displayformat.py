@@ -0,0 +1,142 @@
+#! /usr/bin/python
+"""Create the surfaces of the sprites in the pixel format of the display.
+
+Created on Oct 18, 2026
+
+@author: Niriel
+
+A blit between two surfaces of different pixel formats converts each pixel.
+The sprites are blitted on their windows, and the windows on the display, at
+each redraw: their surfaces are created in the format of the display, so that
+these blits are plain copies.  Only the sprites having SRCALPHA in their
+SURFACE_FLAGS get an alpha channel, in the format convert_alpha gives.
+
+The format is read from templates: surfaces of 1x1 pixel converted to the
+display format.  When the display mode changes format, the templates are
+built again and GetFormatVersion changes: the sprites then create their
+images again at their next update.  The format is only read again when the
+display surface or its depth changed: asking for the version costs two
+calls to pygame.
+
+The caches of surfaces shared by the sprites (gradients, rendered texts,
+skins) give the surfaces they make to ConvertSurface, and forget them when
+the version changes.
+
+Before a display mode is set, the surfaces are created as pygame does by
+default, except that the surfaces with alpha always have 32 bits per pixel:
+pygame has no other depth with per-pixel alpha.
+
+"""
+
+import pygame
+
+__all__ = ['ConvertSurface', 'CreateSurface', 'GetFormat', 'GetFormatVersion',
+           'GetSurfaceFormat']
+
+# Format of the display the templates were built for, and the templates.
+_display_format = None
+# (display surface, depth) when the format was read.  pygame keeps the same
+# display surface when the mode changes, hence the depth.
+_display_key = None
+_templates = {}
+_version = 0
+
+
+def GetSurfaceFormat(surface):
+    """Return (bitsize, masks, alpha): what makes the format of surface."""
+    return (surface.get_bitsize(), surface.get_masks(),
+            surface.get_flags() & pygame.SRCALPHA)
+
+
+def _CheckDisplay():
+    """Forget the templates if the format of the display changed."""
+    global _display_format, _display_key, _version
+    display = pygame.display.get_surface() if pygame.display.get_init() \
+              else None
+    if display is None:
+        display_key = None
+    else:
+        display_key = display, display.get_bitsize()
+    if display_key == _display_key:
+        return
+    _display_key = display_key
+    display_format = None if display is None else GetSurfaceFormat(display)
+    if display_format != _display_format:
+        _display_format = display_format
+        _templates.clear()
+        _version += 1
+
+
+def GetFormatVersion():
+    """Return a number that changes when the format of the display changes.
+    """
+    _CheckDisplay()
+    return _version
+
+
+def _CreateDefaultSurface(size, flags):
+    """Return a new surface created as pygame does without display."""
+    # pylint: disable-msg=E1121,E1123
+    if flags & pygame.SRCALPHA:
+        return pygame.Surface(size, flags, 32)
+    return pygame.Surface(size, flags=flags)
+
+
+def _GetTemplate(alpha):
+    """Return a 1x1 surface in the format for alpha.
+
+    Without display, it is a surface created as pygame does by default.
+
+    """
+    try:
+        return _templates[alpha]
+    except KeyError:
+        # pylint: disable-msg=E1121,E1123
+        if _display_format is None:
+            template = _CreateDefaultSurface((1, 1), alpha)
+        elif alpha:
+            template = pygame.Surface((1, 1), pygame.SRCALPHA, 32)
+            template = template.convert_alpha()
+        else:
+            template = pygame.Surface((1, 1), 0, 32).convert()
+        _templates[alpha] = template
+        return template
+
+
+def GetFormat(flags=0):
+    """Return the format CreateSurface gives with flags, see GetSurfaceFormat.
+    """
+    _CheckDisplay()
+    return GetSurfaceFormat(_GetTemplate(flags & pygame.SRCALPHA))
+
+
+def CreateSurface(size, flags=0):
+    """Return a new surface of size, in the display format.
+
+    The surface has per-pixel alpha only if flags has SRCALPHA.
+
+    """
+    _CheckDisplay()
+    if _display_format is None:
+        return _CreateDefaultSurface(size, flags)
+    # pylint: disable-msg=E1121
+    return pygame.Surface(size, flags,
+                          _GetTemplate(flags & pygame.SRCALPHA))
+
+
+def ConvertSurface(surface):
+    """Return surface in the display format, or surface itself if it is.
+
+    A surface with per-pixel alpha is converted with convert_alpha, the
+    others with convert.  Without display, surface is returned as it is.
+
+    """
+    _CheckDisplay()
+    if _display_format is None:
+        return surface
+    alpha = surface.get_flags() & pygame.SRCALPHA
+    if GetSurfaceFormat(surface) == GetSurfaceFormat(_GetTemplate(alpha)):
+        return surface
+    if alpha:
+        return surface.convert_alpha()
+    return surface.convert()
@@ -0,0 +1,206 @@
+#! /usr/bin/python
+"""Draw texts by copying glyphs rasterized once.
+
+Created on Oct 18, 2026
+
+@author: Niriel
+
+pygame.font.Font.render lays out and rasterizes the whole string, with
+anti-aliasing, at each call.  A score, a timer or a chat line changing at each
+frame pays it at each frame.  A GlyphAtlas rasterizes each character once for
+a font and a color, and stores it in a page: a big surface shared by many
+glyphs.  Drawing a text then costs one blit per character.
+
+The characters are placed one after the other, each one moved forward by the
+advance given by Font.metrics.  pygame does not give the kerning of the pairs
+of characters: a text drawn by an atlas can be a pixel narrower or wider than
+the same text rendered by the font.
+
+The atlases are not used by default.  Set USE_GLYPH_ATLAS to True on a
+TextSprite class or object to use them.
+
+"""
+
+import weakref
+import pygame
+from displayformat import CreateSurface
+from displayformat import GetFormatVersion
+
+__all__ = ['GlyphAtlas', 'AtlasText', 'GetGlyphAtlas']
+
+
+class AtlasText(object):
+    """A text ready to be drawn by a GlyphAtlas.
+
+    It is what GlyphAtlas.render returns instead of a surface.  Like a surface
+    it has get_size and get_rect, so that it can be placed before being drawn.
+
+    """
+
+    def __init__(self, atlas, text):
+        """Initialize a new AtlasText, the size of text in atlas."""
+        object.__init__(self)
+        self.atlas = atlas
+        self.text = text
+        self.size = atlas.getSize(text)
+
+    def get_size(self):
+        """Return the size (width, height) of the text."""
+        return self.size
+
+    def get_rect(self, **kwargs):
+        """Return a Rect of the size of the text, placed like Surface.get_rect.
+        """
+        rect = pygame.Rect((0, 0), self.size)
+        for name, value in kwargs.iteritems():
+            setattr(rect, name, value)
+        return rect
+
+    def blitOn(self, dest, pos):
+        """Draw the text on the surface dest, its top left corner at pos."""
+        self.atlas.blitText(dest, pos, self.text)
+
+
+class GlyphAtlas(object):
+    """The glyphs of a font in a color, rasterized once.
+
+    The glyphs are packed in rows on pages of PAGE_SIZE x PAGE_SIZE pixels (or
+    larger for huge fonts).  A new page is created when the current one is
+    full.  The pages are in the format of the display (see displayformat):
+    the glyphs are forgotten, and rasterized again, when that format changes.
+
+    The atlas does not keep its font alive: GetGlyphAtlas forgets the atlases
+    of a font when the font disappears.
+
+    """
+
+    PAGE_SIZE = 256
+
+    def __init__(self, font, color):
+        """Initialize a new empty GlyphAtlas for font and color."""
+        object.__init__(self)
+        self._font = weakref.ref(font)
+        self.color = color
+        self.height = font.get_height()
+        self.pages = []
+        # Position of the next glyph on the last page, and height of the row.
+        self._pen = [0, 0]
+        self._row_height = 0
+        # char: (page, area, advance)
+        self._glyphs = {}
+        self._format_version = GetFormatVersion()
+
+    def _getFont(self):
+        """Return the font of the atlas, or None if it does not exist anymore.
+        """
+        return self._font()
+
+    font = property(_getFont, None, None, "Font of the glyphs.")
+
+    def _newPage(self, width, height):
+        """Add a page able to hold at least a glyph of size (width, height)."""
+        size = max(self.PAGE_SIZE, width), max(self.PAGE_SIZE, height)
+        self.pages.append(CreateSurface(size, pygame.SRCALPHA))
+        self._pen = [0, 0]
+        self._row_height = 0
+
+    def _addGlyph(self, char):
+        """Rasterize char, store it on a page and return its entry."""
+        image = self.font.render(char, True, self.color)
+        width, height = image.get_size()
+        metrics = self.font.metrics(char)[0]
+        advance = metrics[4] if metrics else width
+        if not self.pages:
+            self._newPage(width, height)
+        page = self.pages[-1]
+        left, top = self._pen
+        if left + width > page.get_width():
+            # Next row.
+            left = 0
+            top += self._row_height
+            self._row_height = 0
+        if top + height > page.get_height():
+            self._newPage(width, height)
+            page = self.pages[-1]
+            left, top = 0, 0
+        # The page is transparent black there: the maximum copies the glyph,
+        # alpha included, where a normal blit would blend it.
+        page.blit(image, (left, top), None, pygame.BLEND_RGBA_MAX)
+        self._pen = [left + width, top]
+        self._row_height = max(self._row_height, height)
+        entry = (page, pygame.Rect(left, top, width, height), advance)
+        self._glyphs[char] = entry
+        return entry
+
+    def _checkFormat(self):
+        """Forget the pages and the glyphs if the display format changed."""
+        version = GetFormatVersion()
+        if version != self._format_version:
+            self._format_version = version
+            self.pages = []
+            self._pen = [0, 0]
+            self._row_height = 0
+            self._glyphs = {}
+
+    def _getGlyph(self, char):
+        """Like getGlyph, without checking the format of the display."""
+        try:
+            return self._glyphs[char]
+        except KeyError:
+            return self._addGlyph(char)
+
+    def getGlyph(self, char):
+        """Return (page, area, advance) for char, rasterizing it if needed."""
+        self._checkFormat()
+        return self._getGlyph(char)
+
+    def getSize(self, text):
+        """Return the size (width, height) of text drawn by blitText."""
+        self._checkFormat()
+        get_glyph = self._getGlyph
+        pen = width = 0
+        for char in text:
+            unused, area, advance = get_glyph(char)
+            width = max(width, pen + area.width)
+            pen += advance
+        return max(width, pen), self.height
+
+    def render(self, text):
+        """Return an AtlasText: text ready to be placed and drawn."""
+        return AtlasText(self, text)
+
+    def blitText(self, dest, pos, text):
+        """Draw text on the surface dest, its top left corner at pos.
+
+        Return the number of glyphs drawn.
+
+        """
+        self._checkFormat()
+        get_glyph = self._getGlyph
+        blit = dest.blit
+        left, top = pos
+        for char in text:
+            page, area, advance = get_glyph(char)
+            blit(page, (left, top), area)
+            left += advance
+        return len(text)
+
+    def __len__(self):
+        return len(self._glyphs)
+
+
+# font: {color: GlyphAtlas}.  The atlases disappear with their font.
+_atlases = weakref.WeakKeyDictionary()
+
+def GetGlyphAtlas(font, color):
+    """Return the GlyphAtlas shared by all the texts in font and color."""
+    color = tuple(color)
+    try:
+        by_color = _atlases[font]
+    except KeyError:
+        by_color = _atlases[font] = {}
+    try:
+        return by_color[color]
+    except KeyError:
+        atlas = by_color[color] = GlyphAtlas(font, color)
+        return atlas
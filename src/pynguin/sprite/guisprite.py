@@ -5,17 +5,59 @@ Created on Nov 25, 2010
 """
 
 import pygame
+from surfacepool import GetDefaultSurfacePool
+from displayformat import CreateSurface
+from displayformat import GetFormatVersion
+
+__all__ = ['GuiSprite', 'MergeRects']
+
+
+def MergeRects(rects):
+    """Return a list of rects covering rects, none of them overlapping.
+
+    The overlapping rects are replaced by their union.  The empty rects are
+    dropped.
+
+    >>> MergeRects([(0, 0, 10, 10), (5, 5, 10, 10), (30, 0, 5, 5), (0, 0, 0, 3)])
+    [<rect(0, 0, 15, 15)>, <rect(30, 0, 5, 5)>]
+    >>> MergeRects([(0, 0, 10, 10), (20, 0, 10, 10), (5, 0, 20, 5)])
+    [<rect(0, 0, 30, 10)>]
+
+    """
+    result = []
+    for rect in rects:
+        rect = pygame.Rect(rect)
+        if not (rect.width and rect.height):
+            continue
+        index = 0
+        while index < len(result):
+            if result[index].colliderect(rect):
+                rect.union_ip(result.pop(index))
+                index = 0
+            else:
+                index += 1
+        result.append(rect)
+    return result
 
-__all__ = ['GuiSprite']
 
 class GuiSprite(pygame.sprite.Sprite):
     """Ancestor of all sprite using the PYnGUIn system.
 
     This class is abstract.  Please use its descendants.
 
+    The sprites record the areas of their image that changed: their damage.
+    update marks the whole image, markDirty a part of it.  The window drawing
+    the sprite collects them with popDirtyRects and only redraws these areas
+    of itself.
+
     """
     SURFACE_FLAGS = 0
     BG_COLOR = (32, 32, 32, 255)
+    # Kind of the sprite in a Skin.  None for the sprites that cannot be
+    # skinned.
+    SKIN_NAME = None
+    # Number of dirty areas beyond which the whole image is dirty.
+    MAX_DIRTY_AREAS = 32
 
     def __init__(self):
         """Initialize a new GuiSprite."""
@@ -23,6 +65,15 @@ class GuiSprite(pygame.sprite.Sprite):
         self.image = None
         self.rect = pygame.Rect(0, 0, 0, 0)
         self.drawable_image = self.image
+        self.skin = None
+        # Damaged areas of the image, and where the sprite was last shown.
+        self._dirty_areas = []
+        self._drawn_rect = None
+        self.surfaces = GetDefaultSurfacePool()
+        # (pool, surface): the pooled surface the image is a subsurface of.
+        self._backing = None
+        # Version of the display format the image was created in.
+        self._format_version = None
 
     def _createImage(self):
         """Create a new pygame.Surface object for this sprite.
@@ -30,15 +81,75 @@ class GuiSprite(pygame.sprite.Sprite):
         The size of the image is taken from the rect.  Therefore the rect
         must be up-to-date.
 
+        The image is a subsurface of a bigger surface acquired from the
+        SurfacePool of the sprite, shared by default.  The bigger surface is
+        kept as long as the new size fits in it, and released otherwise.  Set
+        surfaces to None to allocate a surface of the exact size instead.
+
+        Both are in the pixel format of the display (see displayformat).
+
         """
-        # pylint: disable-msg=E1123,E1121
-        self.image = pygame.Surface(self.rect.size, flags=self.SURFACE_FLAGS)
+        size = self.rect.size
+        flags = self.SURFACE_FLAGS
+        pool = self.surfaces
+        if self._backing is not None:
+            old_pool, backing = self._backing
+            if old_pool is not pool or not pool.fits(backing, size, flags):
+                self.releaseImage()
+        if pool is None:
+            self.image = CreateSurface(size, flags)
+        else:
+            if self._backing is None:
+                self._backing = pool, pool.acquire(size, flags, self)
+            self.image = self._backing[1].subsurface((0, 0) + size)
         self.drawable_image = self.image
+        self._format_version = GetFormatVersion()
+
+    def _isImageValid(self):
+        """Return whether the image can be drawn again, or must be created.
+
+        It must be created if there is none, if it does not have the size of
+        rect or if the format of the display changed.
+
+        """
+        return (self.image is not None and
+                self.image.get_size() == self.rect.size and
+                self._format_version == GetFormatVersion())
+
+    def releaseImage(self):
+        """Give the surface of the image back to the pool, if any.
+
+        The sprite has no image anymore: the next update creates a new one.
+        The surface also returns to the pool when the sprite is destroyed.
+
+        """
+        if self._backing is not None:
+            pool, backing = self._backing
+            pool.release(backing)
+            self._backing = None
+        self.image = None
+        self.drawable_image = None
 
     def _drawBackground(self):
         """Fill the drawable_image attribute with the solid color BG_COLOR."""
         self.drawable_image.fill(self.BG_COLOR)
 
+    def _drawSkin(self, state):
+        """Blit the image of state from the skin, and return True.
+
+        Return False, without drawing anything, if the sprite has no skin or
+        if its skin has no image for that state.
+
+        """
+        if self.skin is None or self.SKIN_NAME is None:
+            return False
+        surface = self.skin.render(self.SKIN_NAME, state,
+                                   self.drawable_image.get_size())
+        if surface is None:
+            return False
+        self.drawable_image.blit(surface, (0, 0))
+        return True
+
     def _draw(self):
         """Draw this sprite.
 
@@ -65,9 +176,50 @@ class GuiSprite(pygame.sprite.Sprite):
         Call this method only when you need it.  Not at every frame.
 
         """
-        if not self.image or self.image.get_size() != self.rect.size:
+        if not self._isImageValid():
             self._createImage()
         self._draw()
+        self.markDirty()
+
+    def markDirty(self, area=None):
+        """Record that area of the image changed.  None is the whole image.
+
+        The area is relative to the image.  When the whole image is dirty, the
+        areas are replaced by a single one covering it, and the next areas are
+        ignored.  Past MAX_DIRTY_AREAS areas, the whole image is marked too:
+        the areas of a sprite whose rects are never popped do not pile up.
+
+        """
+        whole = pygame.Rect((0, 0) + self.rect.size)
+        areas = self._dirty_areas
+        if len(areas) == 1 and areas[0].contains(whole):
+            return
+        if area is not None:
+            area = pygame.Rect(area)
+        if area is None or area.contains(whole) or \
+           len(areas) >= self.MAX_DIRTY_AREAS:
+            self._dirty_areas = [whole]
+        else:
+            areas.append(area)
+
+    def popDirtyRects(self):
+        """Return the damaged rects of the sprite, and forget them.
+
+        The rects are in the coordinates of the parent: they are the areas of
+        the parent to redraw.  When the sprite moved or changed of size since
+        the last call, the old and the new rects are both damaged.
+
+        """
+        rect = self.rect
+        left, top = rect.topleft
+        rects = [area.move(left, top) for area in self._dirty_areas]
+        self._dirty_areas = []
+        if rect != self._drawn_rect:
+            if self._drawn_rect is not None:
+                rects.append(self._drawn_rect)
+            rects.append(pygame.Rect(rect))
+            self._drawn_rect = pygame.Rect(rect)
+        return rects
 
     def getSpritesAt(self, pos):
         """Return [itself] if the given position is within rect.  Otherwise [].
@@ -21,17 +21,18 @@ class LabelSprite(TextSprite):
 
         Be careful, this method uses pygame.Font.render with anti-aliasing and
         alpha layers, which is time consuming.  You don't want to call that too
-        often.
+        often.  Set USE_GLYPH_ATLAS to True to copy glyphs rasterized once
+        instead.
 
         """
-        text_image = self.font.render(self.text, True, self.TX_COLOR)
+        text_image = self._renderText(self.text)
         self_center = self.drawable_image.get_rect().center
         dest_rect = text_image.get_rect(center = self_center)
         if dest_rect.left < 0:
             dest_rect.left = 0
         if dest_rect.top < 0:
             dest_rect.top = 0
-        self.drawable_image.blit(text_image, dest_rect)
+        self._blitText(text_image, dest_rect)
 
     def _draw(self):
         """Draw the label onto its own drawable image."""
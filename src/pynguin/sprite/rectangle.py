@@ -4,7 +4,16 @@ Created on Nov 27, 2010
 @author: Niriel
 """
 
+from collections import OrderedDict
 import pygame
+from displayformat import ConvertSurface
+from displayformat import GetFormatVersion
+
+try:
+    import numpy
+except ImportError:
+    # NumPy is optional: without it, the gradient strips are drawn row by row.
+    numpy = None
 
 def Border(surface, bd_color, bd_thickness):
     if not bd_thickness:
@@ -23,8 +32,125 @@ def InterpolateColor(color_from, color_to, progress, progress_max):
             InterpoloateComponent(color_from[1], color_to[1], progress, progress_max),
             InterpoloateComponent(color_from[2], color_to[2], progress, progress_max))
 
+def VGradStrip(height, bg_color_top, bg_color_bottom):
+    """Return a surface 1 pixel wide holding a vertical gradient.
+
+    The colors of the rows are the ones given by InterpolateColor.  With
+    NumPy, they are computed for all the rows at once.
+
+    """
+    # pylint: disable-msg=E1121
+    strip = pygame.Surface((1, height), 0, 32)
+    if not height:
+        return strip
+    if numpy is None:
+        for y in xrange(height):
+            strip.set_at((0, y), InterpolateColor(bg_color_top,
+                                                  bg_color_bottom, y, height))
+        return strip
+    top = numpy.array(bg_color_top[:3], numpy.float64)
+    bottom = numpy.array(bg_color_bottom[:3], numpy.float64)
+    progress = numpy.arange(height, dtype=numpy.float64)[:, None]
+    # Same operations as InterpoloateComponent.  The components are positive,
+    # so that floor(x + 0.5) rounds half away from zero like round.
+    colors = (bottom - top) * progress / height + top
+    colors = numpy.floor(colors + 0.5).astype(numpy.int32)
+    pygame.surfarray.blit_array(strip, colors[None, :, :])
+    return strip
+
 def RectangleVGrad(surface, bg_color_top, bg_color_bottom):
-    x_max, y_max = surface.get_size()
-    for y in range(y_max):
-        color = InterpolateColor(bg_color_top, bg_color_bottom, y, y_max)
-        pygame.draw.line(surface, color, (0, y), (x_max, y))
+    """Fill surface with a vertical gradient, stretching a VGradStrip."""
+    size = surface.get_size()
+    strip = VGradStrip(size[1], bg_color_top, bg_color_bottom)
+    surface.blit(pygame.transform.scale(strip, size), (0, 0))
+
+
+class GradientCache(object):
+    """A cache of gradient surfaces, bounded by the bytes of the surfaces.
+
+    The key of a surface is (size, color_top, color_bottom).  When the
+    surfaces take more than max_bytes, the least recently used are forgotten.
+    A surface bigger than max_bytes on its own is drawn but not kept.
+
+    The surfaces are shared: never draw on them, only blit them.  They are
+    in the format of the display, and forgotten when that format changes.
+
+    >>> cache = GradientCache(20000)
+    >>> normal = cache.getVGrad((64, 24), (240, 240, 240), (230, 230, 230))
+    >>> normal.get_size()
+    (64, 24)
+    >>> cache.getVGrad((64, 24), [240, 240, 240], [230, 230, 230]) is normal
+    True
+    >>> print cache.hits, cache.misses, cache.bytes
+    1 1 6144
+    >>> big = cache.getVGrad((100, 40), (0, 0, 0), (255, 255, 255))
+    >>> print len(cache), cache.bytes # The first one was forgotten.
+    1 16000
+
+    """
+
+    def __init__(self, max_bytes=4 * 1024 * 1024):
+        """Initialize a new GradientCache holding at most max_bytes."""
+        object.__init__(self)
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._format_version = None
+
+    def __len__(self):
+        return len(self._entries)
+
+    def getVGrad(self, size, bg_color_top, bg_color_bottom):
+        """Return a surface of given size filled by RectangleVGrad, shared."""
+        key = (tuple(size), tuple(bg_color_top), tuple(bg_color_bottom))
+        version = GetFormatVersion()
+        if version != self._format_version:
+            self._format_version = version
+            self.clear()
+        entries = self._entries
+        try:
+            surface, nb_bytes = entries.pop(key)
+        except KeyError:
+            self.misses += 1
+            strip = VGradStrip(key[0][1], bg_color_top, bg_color_bottom)
+            # Scaling keeps the format: convert the strip, not the result.
+            surface = pygame.transform.scale(ConvertSurface(strip), key[0])
+            nb_bytes = surface.get_pitch() * surface.get_height()
+            if nb_bytes <= self.max_bytes:
+                entries[key] = surface, nb_bytes
+                self.bytes += nb_bytes
+                while self.bytes > self.max_bytes:
+                    unused, (unused, old_bytes) = entries.popitem(last=False)
+                    self.bytes -= old_bytes
+            return surface
+        entries[key] = surface, nb_bytes # Most recently used.
+        self.hits += 1
+        return surface
+
+    def clear(self):
+        """Forget all the surfaces.  The counters are kept."""
+        self._entries.clear()
+        self.bytes = 0
+
+    def getStats(self):
+        """Return a dict with the keys 'hits', 'misses', 'size', 'bytes' and
+        'max_bytes'.
+
+        """
+        return {'hits': self.hits, 'misses': self.misses,
+                'size': len(self._entries), 'bytes': self.bytes,
+                'max_bytes': self.max_bytes}
+
+    def resetStats(self):
+        """Set the hit and miss counters back to 0."""
+        self.hits = 0
+        self.misses = 0
+
+
+_default_gradient_cache = GradientCache()
+
+def GetDefaultGradientCache():
+    """Return the GradientCache shared by the ButtonSprites."""
+    return _default_gradient_cache
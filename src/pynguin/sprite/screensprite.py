@@ -5,12 +5,21 @@ Created on Nov 27, 2010
 """
 
 import pygame
+from guisprite import MergeRects
 from windowsprite import WindowSprite
 
 __all__ = ['ScreenSprite']
 
 class ScreenSprite(WindowSprite):
-    """A screen is a window that takes the display as drawing surface."""
+    """A screen is a window that takes the display as drawing surface.
+
+    After update or refresh, getDirtyRects returns the areas of the display
+    that changed, for pygame.display.update:
+
+        screen_sprite.refresh()
+        pygame.display.update(screen_sprite.getDirtyRects())
+
+    """
 
     BG_COLOR = (255, 255, 255)
 
@@ -20,6 +29,20 @@ class ScreenSprite(WindowSprite):
         self.rect = self.image.get_rect()
         self.drawable_image = self.image
 
+    def _isImageValid(self):
+        """Return whether the image is the surface of the current display."""
+        return (self.image is not None and
+                self.image is pygame.display.get_surface())
+
+    def getDirtyRects(self):
+        """Return the list of the areas of the display that changed.
+
+        The rects do not overlap.  They are forgotten: the next call only
+        returns the areas changed after this one.
+
+        """
+        return MergeRects(self.popDirtyRects())
+
     def getDisplaySize(self):
         """Return the size of the display."""
         return pygame.display.get_surface().get_rect().size
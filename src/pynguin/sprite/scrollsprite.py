@@ -39,6 +39,8 @@ the portion of big_image to blit onto image is called "visible_rect".
 """
 
 import pygame
+from displayformat import CreateSurface
+from displayformat import GetFormatVersion
 from windowsprite import WindowSprite
 
 __all__ = ['ScrollSprite']
@@ -53,13 +55,15 @@ class ScrollSprite(WindowSprite):
         self.visible_rect = pygame.Rect(0, 0, 0, 0)
 
     def _createImage(self):
-        """Create two images: the visible one and the drawable one."""
-        # pylint: disable-msg=E1123,E1121
+        """Create two images: the visible one and the drawable one.
 
-        self.image = pygame.Surface(self.rect.size, flags=self.SURFACE_FLAGS)
-        self.big_image = pygame.Surface(self.big_rect.size,
-                                        flags=self.SURFACE_FLAGS)
+        They are in the pixel format of the display (see displayformat).
+
+        """
+        self.image = CreateSurface(self.rect.size, self.SURFACE_FLAGS)
+        self.big_image = CreateSurface(self.big_rect.size, self.SURFACE_FLAGS)
         self.drawable_image = self.big_image
+        self._format_version = GetFormatVersion()
 
     def _drawVisiblePart(self):
         """Draw the visible part of the big image onto the visible image.
@@ -84,6 +88,20 @@ class ScrollSprite(WindowSprite):
         WindowSprite._draw(self)
         self._drawVisiblePart()
 
+    def _redrawArea(self, area):
+        """Draw area of the big image, and show its visible part."""
+        image = self.drawable_image
+        image.set_clip(area)
+        WindowSprite._draw(self)
+        image.set_clip(None)
+        visible_rect = self.visible_rect
+        shown = area.move(-visible_rect.left, -visible_rect.top)
+        shown = shown.clip(self.image.get_rect())
+        if shown.width and shown.height:
+            self.image.blit(self.big_image, shown,
+                            shown.move(visible_rect.topleft))
+            self.markDirty(shown)
+
     def scrollTo(self, pos_x, pos_y):
         """Select the position of the portion of the big image to display.
 
@@ -0,0 +1,193 @@
+#! /usr/bin/python
+"""Skins: the look of the sprites taken from images rather than drawn.
+
+Created on Oct 18, 2026
+
+@author: Niriel
+
+A skin holds a NineSlice per kind of sprite and per state: the 'normal',
+'highlighted', 'pressed' and 'inactive' buttons, the 'normal' windows, the
+'normal' and 'edit' textboxes.  A nine-slice image is cut in nine parts by
+four margins.  The corners are kept as they are, the edges are stretched along
+one direction and the center along both, so that the image can be drawn at any
+size without distorting its border.
+
+Stretching nine parts costs several scales and blits.  Each NineSlice keeps
+the surfaces it composed, per size: a sprite switching state blits a surface
+already built.
+
+The sprites do not use skins by default.  Give a Skin to the attribute skin of
+a ButtonSprite, WindowSprite or TextBoxSprite to use it.  The kind of a sprite
+is its attribute SKIN_NAME.  A sprite whose state is missing from its skin is
+drawn as without skin.
+
+"""
+
+from collections import OrderedDict
+import pygame
+from displayformat import CreateSurface
+from displayformat import GetFormatVersion
+
+__all__ = ['NineSlice', 'Skin']
+
+
+class NineSlice(object):
+    """An image cut in nine parts, drawn at any size.
+
+    margins is (left, top, right, bottom): the widths of the left and right
+    columns, the heights of the top and bottom rows.  When the size is smaller
+    than the margins, they are reduced in proportion.
+
+    The last capacity surfaces composed are kept.  They are shared: never draw
+    on them, only blit them.  They are in the format of the display, and
+    composed again when that format changes.
+
+    >>> image = pygame.Surface((9, 9), 0, 32)
+    >>> image.fill((255, 0, 0))
+    <rect(0, 0, 9, 9)>
+    >>> image.fill((0, 0, 255), (3, 3, 3, 3)) # The center.
+    <rect(3, 3, 3, 3)>
+    >>> nine_slice = NineSlice(image, (3, 3, 3, 3))
+    >>> surface = nine_slice.render((100, 20))
+    >>> print surface.get_size(), surface.get_at((2, 2)), surface.get_at((50, 10))
+    (100, 20) (255, 0, 0, 255) (0, 0, 255, 255)
+    >>> nine_slice.render((100, 20)) is surface
+    True
+
+    """
+
+    def __init__(self, image, margins, capacity=16):
+        """Initialize a new NineSlice cutting image at margins."""
+        object.__init__(self)
+        if capacity < 1:
+            raise ValueError("A NineSlice keeps at least one surface.")
+        left, top, right, bottom = margins
+        width, height = image.get_size()
+        if left + right > width or top + bottom > height:
+            raise ValueError("The margins %r do not fit in an image of %r." %
+                             (tuple(margins), (width, height)))
+        self.image = image
+        self.margins = tuple(margins)
+        self.capacity = capacity
+        self._surfaces = OrderedDict()
+        self._format_version = None
+
+    def __len__(self):
+        return len(self._surfaces)
+
+    def render(self, size):
+        """Return a surface of the given size showing the nine-slice image."""
+        size = tuple(size)
+        version = GetFormatVersion()
+        if version != self._format_version:
+            self._format_version = version
+            self.clear()
+        surfaces = self._surfaces
+        try:
+            surface = surfaces.pop(size)
+        except KeyError:
+            surface = self._compose(size)
+            if len(surfaces) >= self.capacity:
+                surfaces.popitem(last=False)
+        surfaces[size] = surface # Most recently used.
+        return surface
+
+    def clear(self):
+        """Forget the surfaces composed."""
+        self._surfaces.clear()
+
+    def _compose(self, size):
+        """Return a new surface of the given size showing the image."""
+        image = self.image
+        left, top, right, bottom = self.margins
+        src_xs = _Cuts(image.get_width(), left, right)
+        src_ys = _Cuts(image.get_height(), top, bottom)
+        dest_xs = _Cuts(size[0], left, right)
+        dest_ys = _Cuts(size[1], top, bottom)
+        surface = CreateSurface(size, image.get_flags() & pygame.SRCALPHA)
+        for row in xrange(3):
+            for column in xrange(3):
+                src = pygame.Rect(src_xs[column], src_ys[row],
+                                  src_xs[column + 1] - src_xs[column],
+                                  src_ys[row + 1] - src_ys[row])
+                dest = pygame.Rect(dest_xs[column], dest_ys[row],
+                                   dest_xs[column + 1] - dest_xs[column],
+                                   dest_ys[row + 1] - dest_ys[row])
+                if not (src.width and src.height and
+                        dest.width and dest.height):
+                    continue
+                part = image.subsurface(src)
+                if dest.size != src.size:
+                    part = pygame.transform.scale(part, dest.size)
+                # Copy the pixels, alpha included.
+                surface.blit(part, dest, None, pygame.BLEND_RGBA_MAX)
+        return surface
+
+
+def _Cuts(length, before, after):
+    """Return the 4 coordinates cutting length in 3 parts.
+
+    The first part is before long, the last after long, unless length is too
+    small: then they are reduced in proportion.
+
+    >>> _Cuts(10, 3, 2)
+    (0, 3, 8, 10)
+    >>> _Cuts(4, 3, 5)
+    (0, 1, 1, 4)
+
+    """
+    if before + after > length:
+        before = before * length // (before + after)
+        after = length - before
+    return 0, before, length - after, length
+
+
+class Skin(object):
+    """The NineSlices of the states of the kinds of sprites.
+
+    >>> skin = Skin()
+    >>> button = NineSlice(pygame.Surface((6, 6), 0, 32), (2, 2, 2, 2))
+    >>> skin.setSlice('button', 'normal', button)
+    >>> skin.getSlice('button', 'normal') is button
+    True
+    >>> print skin.getSlice('button', 'pressed')
+    None
+    >>> skin.render('button', 'normal', (40, 20)).get_size()
+    (40, 20)
+    >>> print skin.render('window', 'normal', (40, 20))
+    None
+
+    """
+
+    def __init__(self):
+        """Initialize a new empty Skin."""
+        object.__init__(self)
+        self._slices = {}
+
+    def setSlice(self, name, state, nine_slice):
+        """Use nine_slice for the sprites of kind name in state.
+
+        A nine_slice of None removes the state from the skin.
+
+        """
+        if nine_slice is None:
+            self._slices.pop((name, state), None)
+        else:
+            self._slices[(name, state)] = nine_slice
+
+    def getSlice(self, name, state):
+        """Return the NineSlice of the state of name, or None."""
+        return self._slices.get((name, state))
+
+    def render(self, name, state, size):
+        """Return a surface of the given size for the state of name, or None.
+        """
+        nine_slice = self._slices.get((name, state))
+        if nine_slice is None:
+            return None
+        return nine_slice.render(size)
+
+    def clear(self):
+        """Forget the surfaces composed by all the NineSlices."""
+        for nine_slice in self._slices.itervalues():
+            nine_slice.clear()
@@ -0,0 +1,182 @@
+#! /usr/bin/python
+"""A pool of surfaces reused by the sprites when they change of size.
+
+Created on Oct 18, 2026
+
+@author: Niriel
+
+Resizing a window resizes all the sprites it contains, at each frame of the
+resize.  Each of them used to allocate a new surface of its new size.  With a
+SurfacePool, a sprite acquires a surface a bit bigger than needed and draws on
+a subsurface of the exact size.  A small growth fits in the same surface.  When
+the sprite needs a surface of another size, it releases its surface to the
+pool, where another sprite can acquire it.
+
+The surfaces are sorted in buckets: each side is rounded up to a step that is
+at most a quarter of its length.  The surfaces in a bucket all have the same
+size and pixel format.  They are created in the format of the display (see
+displayformat): the surfaces released after a change of display format are
+dropped.
+
+"""
+
+import weakref
+from collections import OrderedDict
+from displayformat import CreateSurface
+from displayformat import GetFormat
+from displayformat import GetSurfaceFormat
+
+__all__ = ['SurfacePool', 'GetDefaultSurfacePool']
+
+
+def _BucketLength(length):
+    """Return the length of the bucket holding length.
+
+    The step grows with the length, so that at most a quarter is wasted.
+
+    >>> [_BucketLength(length) for length in (0, 1, 8, 9, 30, 100, 640, 641)]
+    [0, 8, 8, 16, 32, 112, 640, 768]
+
+    """
+    step = max(8, 2 ** (length.bit_length() - 3))
+    return -(-length // step) * step
+
+
+class SurfacePool(object):
+    """Surfaces of bucketed sizes, reused instead of allocated.
+
+    A surface acquired belongs to its user until released.  The free
+    surfaces take at most max_bytes: the least recently released are
+    forgotten first.
+
+    >>> pool = SurfacePool(max_bytes=100000)
+    >>> first = pool.acquire((100, 30))
+    >>> first.get_size()
+    (112, 32)
+    >>> pool.fits(first, (110, 25))
+    True
+    >>> pool.release(first)
+    >>> pool.acquire((105, 31)) is first
+    True
+    >>> print pool.hits, pool.misses
+    1 1
+
+    """
+
+    def __init__(self, max_bytes=16 * 1024 * 1024):
+        """Initialize a new empty SurfacePool keeping at most max_bytes."""
+        object.__init__(self)
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        # key: [surfaces].  The key is (width, height) + format.
+        self._free = {}
+        # id(surface): (key, bytes) of the free surfaces, the oldest first.
+        self._free_order = OrderedDict()
+        # id(surface): weak reference to the owner, returning the surface.
+        self._owners = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._free_order)
+
+    def _getKey(self, size, flags):
+        """Return the key of the bucket for a surface of size and flags."""
+        return (_BucketLength(size[0]), _BucketLength(size[1])) + \
+               GetFormat(flags)
+
+    def fits(self, surface, size, flags=0):
+        """Return whether surface is the one the pool would give for size."""
+        return (surface.get_size() + GetSurfaceFormat(surface) ==
+                self._getKey(size, flags))
+
+    def acquire(self, size, flags=0, owner=None):
+        """Return a surface at least as big as size, with flags.
+
+        The surface is bigger than size: draw on a subsurface.  Like a new
+        surface, a surface reused is cleared to transparent black.
+
+        If owner is given, the surface returns to the pool when the owner is
+        destroyed, if it was not released before.
+
+        """
+        key = self._getKey(size, flags)
+        surfaces = self._free.get(key)
+        if surfaces:
+            self.hits += 1
+            surface = surfaces.pop()
+            unused, nb_bytes = self._free_order.pop(id(surface))
+            self.bytes -= nb_bytes
+            surface.fill((0, 0, 0, 0))
+        else:
+            self.misses += 1
+            surface = CreateSurface(key[:2], flags)
+        if owner is not None:
+            self._owners[id(surface)] = weakref.ref(
+                owner, lambda unused, surface=surface: self._reclaim(surface))
+        return surface
+
+    def _reclaim(self, surface):
+        """Release surface, whose owner was destroyed."""
+        if self._owners.pop(id(surface), None) is not None:
+            self._addFree(surface)
+
+    def release(self, surface):
+        """Give surface back to the pool."""
+        self._owners.pop(id(surface), None)
+        self._addFree(surface)
+
+    def _addFree(self, surface):
+        """Add surface to the free surfaces, and respect max_bytes.
+
+        The surfaces too big, or not in the format of the display anymore,
+        are dropped.
+
+        """
+        nb_bytes = surface.get_pitch() * surface.get_height()
+        if nb_bytes > self.max_bytes or id(surface) in self._free_order:
+            return
+        surface_format = GetSurfaceFormat(surface)
+        if surface_format != GetFormat(surface_format[2]):
+            return
+        key = surface.get_size() + surface_format
+        self._free.setdefault(key, []).append(surface)
+        self._free_order[id(surface)] = key, nb_bytes
+        self.bytes += nb_bytes
+        while self.bytes > self.max_bytes:
+            old_id, (old_key, old_bytes) = self._free_order.popitem(last=False)
+            surfaces = self._free[old_key]
+            for index, old_surface in enumerate(surfaces):
+                if id(old_surface) == old_id:
+                    del surfaces[index]
+                    break
+            if not surfaces:
+                del self._free[old_key]
+            self.bytes -= old_bytes
+
+    def clear(self):
+        """Forget the free surfaces.  The counters are kept."""
+        self._free.clear()
+        self._free_order.clear()
+        self.bytes = 0
+
+    def getStats(self):
+        """Return a dict with the keys 'hits', 'misses', 'free', 'owned',
+        'bytes' and 'max_bytes'.
+
+        """
+        return {'hits': self.hits, 'misses': self.misses,
+                'free': len(self._free_order), 'owned': len(self._owners),
+                'bytes': self.bytes, 'max_bytes': self.max_bytes}
+
+    def resetStats(self):
+        """Set the hit and miss counters back to 0."""
+        self.hits = 0
+        self.misses = 0
+
+
+_default_pool = SurfacePool()
+
+def GetDefaultSurfacePool():
+    """Return the SurfacePool shared by the GuiSprites."""
+    return _default_pool
@@ -0,0 +1,133 @@
+#! /usr/bin/python
+"""
+Created on Oct 18, 2026
+
+@author: Niriel
+"""
+
+import unittest
+import pygame
+from pynguin.sprite import displayformat
+from pynguin.sprite import guisprite
+from pynguin.sprite import surfacepool
+from pynguin.sprite import rectangle
+from pynguin.sprite import skin
+from pynguin.sprite import textcache
+
+# pylint: disable-msg=R0904
+# Because unit tests have tons of public methods and that's normal.
+
+# pylint: disable-msg=W0212
+# Because I know what I'm doing when I use a protected attribute in a test.
+
+
+class TestDisplayFormat(unittest.TestCase):
+    """Test the sprite.displayformat module."""
+    def setUp(self):
+        """Open a display of 16 bits per pixel."""
+        pygame.display.init()
+        self.display = pygame.display.set_mode((100, 100), 0, 16)
+
+    def tearDown(self):
+        """Close the display."""
+        del self.display
+        pygame.display.quit()
+
+    def testCreateSurface(self):
+        """CreateSurface gives the format of the display, alpha if asked."""
+        surface = displayformat.CreateSurface((10, 20))
+        self.assertEquals(surface.get_size(), (10, 20))
+        self.assertEquals(displayformat.GetSurfaceFormat(surface),
+                          displayformat.GetSurfaceFormat(self.display))
+        alpha = displayformat.CreateSurface((10, 20), pygame.SRCALPHA)
+        self.assertTrue(alpha.get_flags() & pygame.SRCALPHA)
+        self.assertEquals(displayformat.GetSurfaceFormat(alpha),
+                          displayformat.GetFormat(pygame.SRCALPHA))
+
+    def testModeChange(self):
+        """The version changes with the format of the display only."""
+        version = displayformat.GetFormatVersion()
+        pygame.display.set_mode((200, 100), 0, 16)
+        self.assertEquals(displayformat.GetFormatVersion(), version)
+        self.display = pygame.display.set_mode((200, 100), 0, 32)
+        self.assertNotEquals(displayformat.GetFormatVersion(), version)
+        self.assertEquals(displayformat.CreateSurface((1, 1)).get_bitsize(),
+                          32)
+
+    def testGuiSprite(self):
+        """GuiSprite creates its image again when the format changes."""
+        for pool in (None, surfacepool.SurfacePool()):
+            sprite = guisprite.GuiSprite()
+            sprite.surfaces = pool
+            sprite.rect.size = (30, 30)
+            sprite.update()
+            image = sprite.image
+            self.assertEquals(image.get_bitsize(), 16)
+            sprite.update()
+            self.assertTrue(sprite.image is image)
+            self.display = pygame.display.set_mode((100, 100), 0, 32)
+            sprite.update()
+            self.assertEquals(sprite.image.get_bitsize(), 32)
+            if pool is not None:
+                # The surface of the old format was not kept.
+                self.assertEquals(len(pool), 0)
+            self.display = pygame.display.set_mode((100, 100), 0, 16)
+
+    def testVersionCached(self):
+        """The format is read again only when the display changed."""
+        version = displayformat.GetFormatVersion()
+        key = displayformat._display_key
+        self.assertEquals(displayformat.GetFormatVersion(), version)
+        self.assertTrue(displayformat._display_key is key)
+        pygame.display.quit()
+        self.assertNotEquals(displayformat.GetFormatVersion(), version)
+        pygame.display.init()
+        self.display = pygame.display.set_mode((100, 100), 0, 16)
+
+    def testConvertSurface(self):
+        """ConvertSurface gives the format of CreateSurface, copying if needed.
+        """
+        surface = pygame.Surface((10, 20), 0, 32)
+        converted = displayformat.ConvertSurface(surface)
+        self.assertEquals(converted.get_size(), (10, 20))
+        self.assertEquals(displayformat.GetSurfaceFormat(converted),
+                          displayformat.GetFormat())
+        self.assertTrue(displayformat.ConvertSurface(converted) is converted)
+        alpha = displayformat.ConvertSurface(
+            pygame.Surface((10, 20), pygame.SRCALPHA, 32))
+        self.assertEquals(displayformat.GetSurfaceFormat(alpha),
+                          displayformat.GetFormat(pygame.SRCALPHA))
+
+    def testCaches(self):
+        """The shared surfaces are in the display format, and made again
+        when it changes.
+
+        """
+        class Font(object):
+            """Renders every text as a surface of 32 bits."""
+            def render(self, text, unused_antialias, unused_color):
+                """Return a black surface."""
+                return pygame.Surface((8 * len(text), 10), 0, 32)
+        font = Font()
+        gradients = rectangle.GradientCache()
+        texts = textcache.RenderedTextCache()
+        nine_slice = skin.NineSlice(pygame.Surface((9, 9), 0, 32),
+                                    (3, 3, 3, 3))
+        def Render():
+            """Return the surfaces of the three caches."""
+            return [gradients.getVGrad((20, 10), (0, 0, 0), (255, 255, 255)),
+                    texts.render(font, 'OK', True, (0, 0, 0)),
+                    nine_slice.render((20, 10))]
+        surfaces = Render()
+        for surface in surfaces:
+            self.assertEquals(displayformat.GetSurfaceFormat(surface),
+                              displayformat.GetFormat())
+        self.assertEquals(Render(), surfaces)
+        self.display = pygame.display.set_mode((100, 100), 0, 32)
+        for surface in Render():
+            self.assertEquals(surface.get_bitsize(), 32)
+            self.assertFalse(surface in surfaces)
+
+
+if __name__ == "__main__":
+    unittest.main()
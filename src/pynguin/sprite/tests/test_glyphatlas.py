@@ -0,0 +1,127 @@
+#! /usr/bin/python
+"""
+Created on Oct 18, 2026
+
+@author: Niriel
+"""
+
+import gc
+import unittest
+import pygame
+from pynguin.sprite import displayformat
+from pynguin.sprite import glyphatlas
+from pynguin.sprite import textboxsprite
+
+# pylint: disable-msg=R0904
+# Because unit tests have tons of public methods and that's normal.
+
+# pylint: disable-msg=W0212
+# Because I know what I'm doing when I use a protected attribute in a test.
+
+
+class TestGlyphAtlas(unittest.TestCase):
+    """Test the sprite.glyphatlas module."""
+    def setUp(self):
+        """Prepare pygame so that we can use fonts."""
+        pygame.init()
+        self.font = pygame.font.Font(None, 16)
+
+    def tearDown(self):
+        """Shut down pygame."""
+        del self.font
+        # The sprites hold their fonts in reference cycles: free them while
+        # the font module is still initialized.
+        gc.collect()
+        pygame.quit()
+
+    def testGlyphsOnce(self):
+        """GlyphAtlas rasterizes each character once."""
+        atlas = glyphatlas.GlyphAtlas(self.font, (0, 0, 0))
+        dest = pygame.Surface((200, 20), 0, 32)
+        self.assertEquals(atlas.blitText(dest, (0, 0), "Hello"), 5)
+        self.assertEquals(len(atlas), 4)
+        atlas.blitText(dest, (0, 0), "hole")
+        self.assertEquals(len(atlas), 5)
+        self.assertEquals(len(atlas.pages), 1)
+
+    def testSize(self):
+        """GlyphAtlas.getSize is within a pixel per character of Font.size."""
+        atlas = glyphatlas.GlyphAtlas(self.font, (0, 0, 0))
+        text = "Score: 12345"
+        width, height = atlas.getSize(text)
+        font_width, font_height = self.font.size(text)
+        self.assertEquals(height, font_height)
+        self.assertTrue(abs(width - font_width) <= len(text))
+        self.assertEquals(atlas.getSize(""), (0, font_height))
+        self.assertEquals(atlas.render(text).get_rect(right=100).left,
+                          100 - width)
+
+    def testSameGlyphs(self):
+        """A glyph drawn by GlyphAtlas is the glyph rendered by the font."""
+        atlas = glyphatlas.GlyphAtlas(self.font, (10, 20, 30))
+        for char in "Wj":
+            expected = pygame.Surface((20, 20), 0, 32)
+            expected.fill((255, 255, 255))
+            expected.blit(self.font.render(char, True, (10, 20, 30)), (2, 3))
+            result = pygame.Surface((20, 20), 0, 32)
+            result.fill((255, 255, 255))
+            atlas.blitText(result, (2, 3), char)
+            self.assertEquals(pygame.image.tostring(result, 'RGB'),
+                              pygame.image.tostring(expected, 'RGB'))
+
+    def testPages(self):
+        """GlyphAtlas adds pages when the current one is full."""
+        atlas = glyphatlas.GlyphAtlas(self.font, (0, 0, 0))
+        atlas.PAGE_SIZE = 24
+        dest = pygame.Surface((400, 20), 0, 32)
+        atlas.blitText(dest, (0, 0), "abcdefghijklmnopqrstuvwxyz")
+        self.assertTrue(len(atlas.pages) > 1)
+        for page, area, unused in atlas._glyphs.itervalues():
+            self.assertTrue(page.get_rect().contains(area))
+
+    def testDisplayFormat(self):
+        """The pages are in the display format, and made again when it
+        changes.
+
+        """
+        pygame.display.set_mode((100, 100), 0, 16)
+        atlas = glyphatlas.GlyphAtlas(self.font, (0, 0, 0))
+        dest = displayformat.CreateSurface((200, 20))
+        atlas.blitText(dest, (0, 0), "Hello")
+        page = atlas.pages[0]
+        self.assertEquals(displayformat.GetSurfaceFormat(page),
+                          displayformat.GetFormat(pygame.SRCALPHA))
+        pygame.display.set_mode((100, 100), 0, 32)
+        self.assertEquals(atlas.getSize("Hello")[1], self.font.get_height())
+        self.assertEquals(len(atlas), 4)
+        self.assertFalse(atlas.pages[0] is page)
+        self.assertEquals(displayformat.GetSurfaceFormat(atlas.pages[0]),
+                          displayformat.GetFormat(pygame.SRCALPHA))
+
+    def testGetGlyphAtlas(self):
+        """GetGlyphAtlas shares the atlases, and forgets them with the font."""
+        font = pygame.font.Font(None, 20)
+        atlas = glyphatlas.GetGlyphAtlas(font, (0, 0, 0))
+        self.assertTrue(glyphatlas.GetGlyphAtlas(font, [0, 0, 0]) is atlas)
+        self.assertFalse(glyphatlas.GetGlyphAtlas(font, (1, 0, 0)) is atlas)
+        self.assertTrue(atlas.font is font)
+        del font
+        self.assertTrue(atlas.font is None)
+        self.assertEquals(len(glyphatlas._atlases), 0)
+
+    def testTextBoxSprite(self):
+        """TextBoxSprite draws with the atlas when USE_GLYPH_ATLAS is True."""
+        my_sprite = textboxsprite.TextBoxSprite()
+        my_sprite.USE_GLYPH_ATLAS = True
+        my_sprite.font = self.font
+        my_sprite.text = "Hello"
+        my_sprite.rect.size = my_sprite.getTextSize()
+        my_sprite._createImage()
+        my_sprite._drawNormal()
+        my_sprite._drawEdit()
+        atlas = glyphatlas.GetGlyphAtlas(self.font, my_sprite.TX_COLOR)
+        self.assertEquals(len(atlas), len(set("Hello" + my_sprite.CURSOR)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -101,6 +101,48 @@ class TestGuiSprite(unittest.TestCase):
         sprite.update()
         self.assertEquals(sprite.image.get_at((25, 25)), sprite.BG_COLOR)
 
+    def testDocTest(self):
+        """Module guisprite passes its doctests."""
+        import doctest
+        failures, unused = doctest.testmod(m=guisprite)
+        del unused
+        self.assertEquals(failures, 0)
+
+    def testPopDirtyRects(self):
+        """GuiSprite.popDirtyRects returns the damage in parent coordinates."""
+        sprite = guisprite.GuiSprite()
+        sprite.rect = pygame.Rect(10, 20, 30, 40)
+        sprite.update()
+        self.assertEquals(sprite.popDirtyRects(),
+                          [pygame.Rect(10, 20, 30, 40)] * 2)
+        self.assertEquals(sprite.popDirtyRects(), [])
+        sprite.markDirty((1, 2, 3, 4))
+        self.assertEquals(sprite.popDirtyRects(), [pygame.Rect(11, 22, 3, 4)])
+        # Moved: the old and the new rects.
+        sprite.rect.left = 100
+        self.assertEquals(sprite.popDirtyRects(),
+                          [pygame.Rect(10, 20, 30, 40),
+                           pygame.Rect(100, 20, 30, 40)])
+
+    def testDirtyAreasBounded(self):
+        """The dirty areas of a sprite never popped do not pile up."""
+        sprite = guisprite.GuiSprite()
+        sprite.rect = pygame.Rect(0, 0, 30, 40)
+        for unused in xrange(100):
+            sprite.update()
+        self.assertEquals(sprite._dirty_areas, [pygame.Rect(0, 0, 30, 40)])
+        # Fully dirty: the smaller areas are covered already.
+        sprite.markDirty((1, 2, 3, 4))
+        self.assertEquals(len(sprite._dirty_areas), 1)
+        sprite.popDirtyRects()
+        for index in xrange(sprite.MAX_DIRTY_AREAS + 5):
+            sprite.markDirty((index % 30, 0, 1, 1))
+        self.assertEquals(sprite._dirty_areas, [pygame.Rect(0, 0, 30, 40)])
+        sprite.popDirtyRects()
+        sprite.markDirty((1, 2, 3, 4))
+        sprite.markDirty((0, 0, 30, 40))
+        self.assertEquals(sprite._dirty_areas, [pygame.Rect(0, 0, 30, 40)])
+
 if __name__ == "__main__":
     #import sys;sys.argv = ['', 'Test.testName']
     unittest.main()
@@ -5,6 +5,7 @@ Created on Jan 10, 2011
 @author: Niriel
 """
 
+import gc
 import unittest
 import pygame
 from pynguin.sprite import labelsprite
@@ -24,6 +25,9 @@ class Test(unittest.TestCase):
 
     def tearDown(self):
         """Shut down pygame."""
+        # The sprites hold their fonts in reference cycles: free them while
+        # the font module is still initialized.
+        gc.collect()
         pygame.quit()
 
     # pylint: disable-msg=R0201
@@ -0,0 +1,91 @@
+#! /usr/bin/python
+"""
+Created on Oct 18, 2026
+
+@author: Niriel
+"""
+
+import unittest
+import pygame
+from pynguin.sprite import rectangle
+from pynguin.sprite import buttonsprite
+
+# pylint: disable-msg=R0904
+# Because unit tests have tons of public methods and that's normal.
+
+# pylint: disable-msg=W0212
+# Because I know what I'm doing when I use a protected attribute in a test.
+
+
+class TestRectangle(unittest.TestCase):
+    """Test the sprite.rectangle module."""
+
+    def testDocTest(self):
+        """Module rectangle passes its doctests."""
+        import doctest
+        failures, unused = doctest.testmod(m=rectangle)
+        del unused
+        self.assertEquals(failures, 0)
+
+    def testVGradStrip(self):
+        """VGradStrip has the colors given by InterpolateColor."""
+        top, bottom = (0, 128, 255), (255, 3, 10)
+        numpy = rectangle.numpy
+        try:
+            for rectangle.numpy in (numpy, None):
+                for height in (0, 1, 7, 100):
+                    strip = rectangle.VGradStrip(height, top, bottom)
+                    self.assertEquals(strip.get_size(), (1, height))
+                    for y in range(height):
+                        self.assertEquals(
+                            tuple(strip.get_at((0, y)))[:3],
+                            rectangle.InterpolateColor(top, bottom, y, height))
+        finally:
+            rectangle.numpy = numpy
+
+    def testRectangleVGrad(self):
+        """RectangleVGrad draws the same color on a whole row."""
+        surface = pygame.Surface((5, 10), 0, 32)
+        rectangle.RectangleVGrad(surface, (0, 0, 0), (100, 100, 100))
+        for y in range(10):
+            color = rectangle.InterpolateColor((0, 0, 0), (100, 100, 100),
+                                               y, 10)
+            for x in range(5):
+                self.assertEquals(tuple(surface.get_at((x, y)))[:3], color)
+
+    def testGradientCache(self):
+        """GradientCache stays within max_bytes."""
+        cache = rectangle.GradientCache(700)
+        cache.getVGrad((100, 100), (0, 0, 0), (1, 1, 1))
+        self.assertEquals((len(cache), cache.bytes), (0, 0))
+        for size in ((10, 10), (5, 10), (10, 10), (10, 5)):
+            cache.getVGrad(size, (0, 0, 0), (1, 1, 1))
+            self.assertTrue(cache.bytes <= 700)
+        # (5, 10) was the least recently used.
+        self.assertEquals(cache.getStats(), {'hits': 1, 'misses': 4,
+                                             'size': 2, 'bytes': 600,
+                                             'max_bytes': 700})
+        cache.clear()
+        cache.resetStats()
+        self.assertEquals(cache.getStats()['bytes'], 0)
+
+    def testButtonSprites(self):
+        """ButtonSprites of the same size share their gradients."""
+        cache = rectangle.GradientCache()
+        for unused in range(10):
+            my_button = buttonsprite.ButtonSprite()
+            my_button.gradients = cache
+            my_button.rect.size = (64, 24)
+            my_button._createImage()
+            my_button.setMode('highlighted')
+            my_button._draw()
+            my_button.setMode('normal')
+            my_button._draw()
+        self.assertEquals((cache.hits, cache.misses), (18, 2))
+        my_button.gradients = None
+        my_button._draw()
+        self.assertEquals((cache.hits, cache.misses), (18, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
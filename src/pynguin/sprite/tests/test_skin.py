@@ -0,0 +1,155 @@
+#! /usr/bin/python
+"""
+Created on Oct 18, 2026
+
+@author: Niriel
+"""
+
+import unittest
+import pygame
+from pynguin.sprite import skin
+from pynguin.sprite import buttonsprite
+from pynguin.sprite import textboxsprite
+from pynguin.sprite import windowsprite
+
+# pylint: disable-msg=R0904
+# Because unit tests have tons of public methods and that's normal.
+
+# pylint: disable-msg=W0212
+# Because I know what I'm doing when I use a protected attribute in a test.
+
+
+def MakeSlice(border_color, center_color):
+    """Return a NineSlice of 3x3 pixels with a border of 1 pixel."""
+    image = pygame.Surface((3, 3), 0, 32)
+    image.fill(border_color)
+    image.fill(center_color, (1, 1, 1, 1))
+    return skin.NineSlice(image, (1, 1, 1, 1))
+
+
+class Font(object):
+    """A font of 10 pixels per character, remembering the backgrounds."""
+    def __init__(self):
+        self.backgrounds = []
+    def size(self, text):
+        return 10 * len(text), 10
+    def render(self, text, antialias, color, background=None):
+        self.backgrounds.append(background)
+        return pygame.Surface(self.size(text), 0, 32)
+
+
+class TestSkin(unittest.TestCase):
+    """Test the sprite.skin module."""
+
+    def testDocTest(self):
+        """Module skin passes its doctests."""
+        import doctest
+        failures, unused = doctest.testmod(m=skin)
+        del unused
+        self.assertEquals(failures, 0)
+
+    def testMargins(self):
+        """NineSlice refuses margins larger than the image."""
+        image = pygame.Surface((4, 4), 0, 32)
+        self.assertRaises(ValueError, skin.NineSlice, image, (2, 0, 3, 0))
+        self.assertRaises(ValueError, skin.NineSlice, image, (0, 0, 0, 0), 0)
+
+    def testCompose(self):
+        """NineSlice stretches the edges and the center, not the corners."""
+        image = pygame.Surface((4, 4), 0, 32)
+        for x in range(4):
+            for y in range(4):
+                image.set_at((x, y), (x * 60, y * 60, 0))
+        nine_slice = skin.NineSlice(image, (1, 1, 1, 1))
+        surface = nine_slice.render((10, 6))
+        self.assertEquals(surface.get_size(), (10, 6))
+        for pos, color in (((0, 0), (0, 0, 0)), ((9, 0), (180, 0, 0)),
+                           ((0, 5), (0, 180, 0)), ((9, 5), (180, 180, 0))):
+            self.assertEquals(tuple(surface.get_at(pos))[:3], color)
+        # The top edge is only stretched horizontally.
+        for x in range(1, 9):
+            self.assertEquals(surface.get_at((x, 0))[1], 0)
+        # Smaller than the margins.
+        self.assertEquals(nine_slice.render((1, 1)).get_size(), (1, 1))
+        self.assertEquals(nine_slice.render((0, 5)).get_size(), (0, 5))
+
+    def testCapacity(self):
+        """NineSlice forgets the least recently used sizes."""
+        nine_slice = MakeSlice((0, 0, 0), (255, 255, 255))
+        nine_slice.capacity = 2
+        first = nine_slice.render((10, 10))
+        nine_slice.render((20, 10))
+        self.assertTrue(nine_slice.render((10, 10)) is first)
+        nine_slice.render((30, 10))
+        self.assertEquals(len(nine_slice), 2)
+        self.assertTrue(nine_slice.render((10, 10)) is first)
+        nine_slice.clear()
+        self.assertFalse(nine_slice.render((10, 10)) is first)
+
+    def testSetSlice(self):
+        """Skin.setSlice with None removes a state."""
+        my_skin = skin.Skin()
+        my_skin.setSlice('button', 'normal', MakeSlice((0, 0, 0), (0, 0, 0)))
+        my_skin.setSlice('button', 'normal', None)
+        self.assertEquals(my_skin.getSlice('button', 'normal'), None)
+        my_skin.setSlice('button', 'normal', None) # Does not fail.
+
+    def testButtonSprite(self):
+        """ButtonSprite draws its modes with the skin, or without it."""
+        my_skin = skin.Skin()
+        my_skin.setSlice('button', 'pressed',
+                         MakeSlice((0, 0, 0), (10, 20, 30)))
+        my_button = buttonsprite.ButtonSprite()
+        my_button.skin = my_skin
+        my_button.rect.size = (64, 24)
+        my_button._createImage()
+        my_button.drawable_image = pygame.Surface((64, 24), 0, 32)
+        my_button.setMode('pressed')
+        my_button._draw()
+        self.assertEquals(tuple(my_button.drawable_image.get_at((32, 12))),
+                          (10, 20, 30, 255))
+        self.assertEquals(len(my_skin.getSlice('button', 'pressed')), 1)
+        my_button.setMode('normal')
+        my_button._draw()
+        self.assertEquals(tuple(my_button.drawable_image.get_at((0, 0)))[:3],
+                          my_button.BD_COLOR)
+
+    def testWindowSprite(self):
+        """WindowSprite draws its background with the skin."""
+        my_skin = skin.Skin()
+        my_skin.setSlice('window', 'normal',
+                         MakeSlice((0, 0, 0), (10, 20, 30)))
+        my_window = windowsprite.WindowSprite()
+        my_window.skin = my_skin
+        my_window.rect.size = (50, 50)
+        my_window._createImage()
+        my_window.drawable_image = pygame.Surface((50, 50), 0, 32)
+        my_window._draw()
+        self.assertEquals(tuple(my_window.drawable_image.get_at((25, 25))),
+                          (10, 20, 30, 255))
+
+    def testTextBoxSprite(self):
+        """TextBoxSprite renders its text without background on a skin."""
+        my_skin = skin.Skin()
+        my_skin.setSlice('textbox', 'edit', MakeSlice((0, 0, 0), (10, 20, 30)))
+        my_sprite = textboxsprite.TextBoxSprite()
+        my_sprite.skin = my_skin
+        my_sprite.font = Font()
+        my_sprite.text = "Hello"
+        my_sprite.rect.size = (100, 30)
+        my_sprite._createImage()
+        my_sprite.drawable_image = pygame.Surface((100, 30), 0, 32)
+        my_sprite.setMode('edit')
+        my_sprite._draw()
+        self.assertEquals(my_sprite.font.backgrounds, [None, None])
+        self.assertEquals(tuple(my_sprite.drawable_image.get_at((90, 15))),
+                          (10, 20, 30, 255))
+        my_sprite.skin = None
+        my_sprite._draw()
+        # Only the segment is rendered again, the cursor is shared.
+        self.assertEquals(my_sprite.font.backgrounds[2:],
+                          [my_sprite.BG_COLOR])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+#! /usr/bin/python
+"""
+Created on Oct 18, 2026
+
+@author: Niriel
+"""
+
+import unittest
+import pygame
+from pynguin.sprite import surfacepool
+from pynguin.sprite import guisprite
+
+# pylint: disable-msg=R0904
+# Because unit tests have tons of public methods and that's normal.
+
+# pylint: disable-msg=W0212
+# Because I know what I'm doing when I use a protected attribute in a test.
+
+
+class TestSurfacePool(unittest.TestCase):
+    """Test the sprite.surfacepool module."""
+
+    def testDocTest(self):
+        """Module surfacepool passes its doctests."""
+        import doctest
+        failures, unused = doctest.testmod(m=surfacepool)
+        del unused
+        self.assertEquals(failures, 0)
+
+    def testBuckets(self):
+        """SurfacePool only reuses the surfaces of the same bucket."""
+        pool = surfacepool.SurfacePool()
+        small = pool.acquire((30, 30))
+        pool.release(small)
+        self.assertFalse(pool.acquire((60, 30)) is small)
+        self.assertTrue(pool.acquire((25, 32)) is small)
+        self.assertFalse(pool.fits(small, (33, 30)))
+
+    def testCleared(self):
+        """SurfacePool clears the surfaces it gives again."""
+        pool = surfacepool.SurfacePool()
+        surface = pool.acquire((10, 10))
+        surface.fill((1, 2, 3))
+        pool.release(surface)
+        pool.release(surface) # Only once in the pool.
+        self.assertEquals(len(pool), 1)
+        self.assertTrue(pool.acquire((10, 10)) is surface)
+        self.assertEquals(tuple(surface.get_at((5, 5)))[:3], (0, 0, 0))
+
+    def testMaxBytes(self):
+        """SurfacePool keeps at most max_bytes of free surfaces."""
+        pool = surfacepool.SurfacePool(2 * 16 * 16 * 4)
+        surfaces = [pool.acquire((16, 16)) for unused in range(3)]
+        pool.release(pool.acquire((100, 100))) # Too big to be kept.
+        for surface in surfaces:
+            pool.release(surface)
+            self.assertTrue(pool.bytes <= pool.max_bytes)
+        self.assertEquals(pool.getStats(), {'hits': 0, 'misses': 4,
+                                            'free': 2, 'owned': 0,
+                                            'bytes': 2048,
+                                            'max_bytes': 2048})
+        # The first one was forgotten.
+        self.assertFalse(pool.acquire((16, 16)) is surfaces[0])
+        pool.clear()
+        pool.resetStats()
+        self.assertEquals((len(pool), pool.bytes, pool.hits), (0, 0, 0))
+
+    def testOwner(self):
+        """A surface returns to the pool when its owner is destroyed."""
+        pool = surfacepool.SurfacePool()
+        sprite = guisprite.GuiSprite()
+        surface = pool.acquire((10, 10), 0, sprite)
+        self.assertEquals(pool.getStats()['owned'], 1)
+        del sprite
+        self.assertEquals(pool.getStats()['owned'], 0)
+        self.assertEquals(len(pool), 1)
+        self.assertTrue(pool.acquire((10, 10)) is surface)
+
+    def testGuiSprite(self):
+        """GuiSprite draws on a subsurface of a pooled surface."""
+        pool = surfacepool.SurfacePool()
+        sprite = guisprite.GuiSprite()
+        sprite.surfaces = pool
+        sprite.rect.size = (100, 30)
+        sprite.update()
+        backing = sprite.image.get_parent()
+        self.assertEquals(backing.get_size(), (112, 32))
+        self.assertEquals(sprite.image.get_size(), (100, 30))
+        # Growing a bit: same surface.
+        sprite.rect.size = (110, 32)
+        sprite.update()
+        self.assertTrue(sprite.image.get_parent() is backing)
+        # Shrinking: back to the pool.
+        sprite.rect.size = (40, 20)
+        sprite.update()
+        self.assertFalse(sprite.image.get_parent() is backing)
+        self.assertEquals(len(pool), 1)
+        other = guisprite.GuiSprite()
+        other.surfaces = pool
+        other.rect.size = (105, 30)
+        other.update()
+        self.assertTrue(other.image.get_parent() is backing)
+        # Without pool.
+        other.surfaces = None
+        other.rect.size = (50, 50)
+        other.update()
+        self.assertEquals(other.image.get_parent(), None)
+        self.assertEquals(len(pool), 1)
+        other.releaseImage()
+        sprite.releaseImage()
+        self.assertEquals((sprite.image, len(pool)), (None, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,6 +5,7 @@ Created on Jan 10, 2011
 @author: Niriel
 """
 
+import gc
 import unittest
 import pygame
 from pynguin.sprite import textboxsprite
@@ -16,6 +17,17 @@ from pynguin.sprite import textboxsprite
 # Because I know what I'm doing when I use a protected attribute in a test.
 
 
+class CountingFont(object):
+    """A font of 10 pixels per character, remembering what it renders."""
+    def __init__(self):
+        self.rendered = []
+    def size(self, text):
+        return 10 * len(text), 10
+    def render(self, text, antialias, color, background=None):
+        self.rendered.append(text)
+        return pygame.Surface(self.size(text), 0, 32)
+
+
 class Test(unittest.TestCase):
     """Test the sprite.textboxsprite module."""
     def setUp(self):
@@ -24,6 +36,9 @@ class Test(unittest.TestCase):
 
     def tearDown(self):
         """Shut down pygame."""
+        # The sprites hold their fonts in reference cycles: free them while
+        # the font module is still initialized.
+        gc.collect()
         pygame.quit()
 
     def testInit(self):
@@ -64,5 +79,143 @@ class Test(unittest.TestCase):
         my_sprite._drawEdit()
     # pylint: enable-msg=R0201
 
+    def _makeEditSprite(self, text, width):
+        """Return a TextBoxSprite in edit mode, rendering with CountingFont."""
+        my_sprite = textboxsprite.TextBoxSprite()
+        my_sprite.SEGMENT_LENGTH = 4
+        my_sprite.font = CountingFont()
+        my_sprite.rendered_texts = None
+        my_sprite.metrics = None
+        my_sprite.text = text
+        my_sprite.rect.size = (width, 10)
+        my_sprite._createImage()
+        my_sprite.setMode('edit')
+        return my_sprite
+
+    def testEditing(self):
+        """TextBoxSprite edits the text at the caret."""
+        my_sprite = self._makeEditSprite("Hello", 200)
+        self.assertEquals(my_sprite.caret, 5)
+        my_sprite.caret = -1
+        self.assertEquals(my_sprite.caret, 0)
+        my_sprite.caret = 100
+        self.assertEquals(my_sprite.caret, 5)
+        my_sprite.moveCaret(-2)
+        my_sprite.insertText(", world! ")
+        self.assertEquals(my_sprite.text, "Hel, world! lo")
+        self.assertEquals(my_sprite.caret, 12)
+        my_sprite.deleteBackward(2)
+        my_sprite.deleteForward()
+        self.assertEquals(my_sprite.text, "Hel, worldo")
+        my_sprite.moveCaret(-100)
+        my_sprite.deleteBackward()
+        self.assertEquals(my_sprite.text, "Hel, worldo")
+        my_sprite.deleteForward(100)
+        self.assertEquals(my_sprite.text, "")
+        self.assertEquals(my_sprite._segments, [''])
+        my_sprite.text = "Bye"
+        my_sprite.caret = 3
+        my_sprite.text = "B"
+        self.assertEquals(my_sprite.caret, 1)
+
+    def testSegments(self):
+        """TextBoxSprite renders again only the segments that changed."""
+        text = "abcdefghijklmnopqrst"
+        my_sprite = self._makeEditSprite(text, 300)
+        self.assertEquals(my_sprite._segments, ['abcd', 'efgh', 'ijkl',
+                                                'mnop', 'qrst'])
+        my_sprite._draw()
+        self.assertEquals(my_sprite.font.rendered,
+                          ['|', 'abcd', 'efgh', 'ijkl', 'mnop', 'qrst'])
+        del my_sprite.font.rendered[:]
+        my_sprite.caret = 10
+        my_sprite._draw()
+        self.assertEquals(my_sprite.font.rendered, ['|'])
+        del my_sprite.font.rendered[:]
+        my_sprite.insertText("X")
+        my_sprite._draw()
+        self.assertEquals(my_sprite.font.rendered, ['|', 'ijXkl'])
+        self.assertEquals(my_sprite.getCaretX(), 110)
+        del my_sprite.font.rendered[:]
+        my_sprite.text = "abcdefghijXkl-nopqrst"
+        my_sprite._draw()
+        self.assertEquals(my_sprite.font.rendered, ['|', '-nop'])
+        self.assertEquals(my_sprite.text, "abcdefghijXkl-nopqrst")
+
+    def testSetCursorVisible(self):
+        """TextBoxSprite.setCursorVisible only damages the cursor."""
+        my_sprite = self._makeEditSprite("Hello", 100)
+        my_sprite.drawable_image = my_sprite.image = pygame.Surface((100, 10),
+                                                                    0, 32)
+        my_sprite.caret = 5
+        my_sprite.update()
+        my_sprite.popDirtyRects()
+        my_sprite.setCursorVisible(True)
+        self.assertEquals(my_sprite.popDirtyRects(), [])
+        my_sprite.setCursorVisible(False)
+        self.assertEquals(my_sprite.popDirtyRects(),
+                          [pygame.Rect(50, 0, 10, 10)])
+        self.assertEquals(my_sprite.image.get_at((55, 5)),
+                          my_sprite.BG_COLOR + (255,))
+        # Never drawn: nothing to draw.
+        textboxsprite.TextBoxSprite().setCursorVisible(False)
+
+    def testIncrementalDraw(self):
+        """TextBoxSprite redraws only what changed, as a full drawing would."""
+        my_sprite = self._makeEditSprite("abcdefghijklmnopqrst", 300)
+        my_sprite.drawable_image = my_sprite.image = pygame.Surface((300, 10),
+                                                                    0, 32)
+        my_sprite.update()
+        self.assertEquals(my_sprite.popDirtyRects(),
+                          [pygame.Rect(0, 0, 300, 10)] * 2)
+        my_sprite.caret = 0
+        my_sprite.update()
+        self.assertEquals(my_sprite.popDirtyRects(),
+                          [pygame.Rect(200, 0, 10, 10),
+                           pygame.Rect(0, 0, 10, 10)])
+        my_sprite.caret = 20
+        my_sprite.update()
+        self.assertEquals(my_sprite.popDirtyRects(),
+                          [pygame.Rect(0, 0, 10, 10),
+                           pygame.Rect(200, 0, 10, 10)])
+        # Typing at the end: the last segment and the cursor, in one area.
+        my_sprite.insertText("X")
+        my_sprite.update()
+        self.assertEquals(my_sprite.popDirtyRects(),
+                          [pygame.Rect(160, 0, 60, 10)])
+        # Each incremental drawing gives the image of a full drawing.
+        for edit in (lambda: my_sprite.moveCaret(-10),
+                     lambda: my_sprite.insertText("Hello"),
+                     lambda: my_sprite.deleteBackward(7),
+                     lambda: my_sprite.deleteForward(3),
+                     lambda: setattr(my_sprite, 'text', "abc")):
+            edit()
+            my_sprite.update()
+            incremental = pygame.image.tostring(my_sprite.image, 'RGB')
+            my_sprite._edit_drawn = None
+            my_sprite.update()
+            self.assertEquals(pygame.image.tostring(my_sprite.image, 'RGB'),
+                              incremental)
+
+    def testScroll(self):
+        """TextBoxSprite scrolls to show the caret."""
+        my_sprite = self._makeEditSprite("abcdefghijklmnopqrst", 100)
+        my_sprite._draw()
+        # A box created with a text shows the end of it.
+        self.assertEquals(my_sprite._scroll, 200 + 10 - 100)
+        my_sprite.caret = 0
+        my_sprite._draw()
+        self.assertEquals(my_sprite._scroll, 0)
+        my_sprite.caret = 20
+        my_sprite._draw()
+        # The end of the text and the cursor on the right of the image.
+        self.assertEquals(my_sprite._scroll, 200 + 10 - 100)
+        my_sprite.caret = 15
+        my_sprite._draw()
+        self.assertEquals(my_sprite._scroll, 110)
+        my_sprite.caret = 5
+        my_sprite._draw()
+        self.assertEquals(my_sprite._scroll, 50)
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,172 @@
+#! /usr/bin/python
+"""
+Created on Oct 18, 2026
+
+@author: Niriel
+"""
+
+import unittest
+import pygame
+from pynguin.sprite import textcache
+from pynguin.sprite import textsprite
+from pynguin.sprite import textboxsprite
+
+# pylint: disable-msg=R0904
+# Because unit tests have tons of public methods and that's normal.
+
+# pylint: disable-msg=W0212
+# Because I know what I'm doing when I use a protected attribute in a test.
+
+
+class CountingFont(object):
+    """A font of 10 pixels per character, counting its measures."""
+    def __init__(self):
+        self.measures = 0
+        self.renders = 0
+    def size(self, text):
+        self.measures += 1
+        return 10 * len(text), 10
+    def render(self, text, antialias, color, background=None):
+        self.renders += 1
+        return pygame.Surface(self.size(text), 0, 32)
+
+
+class SlottedFont(object):
+    """A font that cannot be weakly referenced."""
+    __slots__ = ()
+    def size(self, text):
+        return len(text), 1
+
+
+class TestTextMetricsCache(unittest.TestCase):
+    """Test the sprite.textcache module."""
+
+    def testDocTest(self):
+        """Module textcache passes its doctests."""
+        import doctest
+        failures, unused = doctest.testmod(m=textcache)
+        del unused
+        self.assertEquals(failures, 0)
+
+    def testCapacity(self):
+        """TextMetricsCache forgets the least recently used sizes."""
+        self.assertRaises(ValueError, textcache.TextMetricsCache, 0)
+        cache = textcache.TextMetricsCache(2)
+        font = CountingFont()
+        for text in ('a', 'bb', 'a', 'ccc', 'a', 'bb'):
+            cache.getSize(font, text)
+        # 'bb' was the least recently used when 'ccc' came.
+        self.assertEquals(font.measures, 4)
+        self.assertEquals(cache.getStats(), {'hits': 2, 'misses': 4,
+                                             'size': 2, 'capacity': 2})
+        cache.resetStats()
+        cache.clear()
+        self.assertEquals(len(cache), 0)
+        self.assertEquals(cache.getHitRate(), 0.0)
+
+    def testNewFont(self):
+        """A new font is measured again, even if it reuses an id."""
+        cache = textcache.TextMetricsCache()
+        for unused in range(3):
+            font = CountingFont()
+            self.assertEquals(cache.getSize(font, 'abc'), (30, 10))
+            self.assertEquals(font.measures, 1)
+            del font
+        self.assertEquals(len(cache._tokens), 0)
+
+    def testUntrackableFont(self):
+        """Fonts without weak references are measured each time."""
+        cache = textcache.TextMetricsCache()
+        font = SlottedFont()
+        self.assertEquals(cache.getSize(font, 'abc'), (3, 1))
+        self.assertEquals(cache.getSize(font, 'abc'), (3, 1))
+        self.assertEquals((cache.hits, cache.misses), (0, 2))
+        cache.forgetFont(font) # Does not fail.
+
+    def testTextSprite(self):
+        """TextSprite.getTextSize measures a text once."""
+        font = CountingFont()
+        sprites = [textsprite.TextSprite() for unused in range(3)]
+        for sprite in sprites:
+            sprite.font = font
+            sprite.text = 'Hello'
+            self.assertEquals(sprite.getTextSize(), (50, 10))
+        self.assertEquals(font.measures, 1)
+        sprites[0].metrics = None
+        sprites[0].getTextSize()
+        self.assertEquals(font.measures, 2)
+
+
+class TestRenderedTextCache(unittest.TestCase):
+    """Test the sprite.textcache.RenderedTextCache class."""
+
+    def testKey(self):
+        """RenderedTextCache renders each combination of arguments once."""
+        cache = textcache.RenderedTextCache()
+        font = CountingFont()
+        other_font = CountingFont()
+        calls = [(font, 'OK', True, (0, 0, 0)),
+                 (font, 'OK', False, (0, 0, 0)),
+                 (font, 'OK', True, (0, 0, 1)),
+                 (font, 'OK', True, (0, 0, 0), (9, 9, 9)),
+                 (other_font, 'OK', True, (0, 0, 0))]
+        surfaces = [cache.render(*args) for args in calls]
+        self.assertEquals(len(set(surfaces)), 5)
+        self.assertEquals([cache.render(*args) for args in calls], surfaces)
+        self.assertEquals(font.renders + other_font.renders, 5)
+        self.assertEquals(cache.getStats(), {'hits': 5, 'misses': 5,
+                                             'size': 5, 'bytes': 5 * 800,
+                                             'max_bytes': cache.max_bytes})
+        cache.forgetFont(font)
+        cache.render(*calls[0])
+        self.assertEquals(font.renders, 5)
+        cache.clear()
+        cache.resetStats()
+        self.assertEquals(cache.getStats()['bytes'], 0)
+
+    def testBytes(self):
+        """RenderedTextCache stays within max_bytes."""
+        cache = textcache.RenderedTextCache(2000)
+        font = CountingFont()
+        cache.render(font, 'This text is too long', True, (0, 0, 0))
+        self.assertEquals((len(cache), cache.bytes), (0, 0))
+        for text in ('a', 'bb', 'ccc', 'a', 'dddd'):
+            cache.render(font, text, True, (0, 0, 0))
+            self.assertTrue(cache.bytes <= 2000)
+        # 'a', 'bb' then 'ccc' were forgotten, 'a' rendered again.
+        self.assertEquals((len(cache), cache.bytes), (2, 400 + 1600))
+        self.assertEquals(cache.hits, 0)
+        cache.render(font, 'a', True, (0, 0, 0))
+        self.assertEquals(cache.hits, 1)
+
+    def testUntrackableFont(self):
+        """Fonts without weak references are rendered each time."""
+        cache = textcache.RenderedTextCache()
+        class Font(SlottedFont):
+            """A font that cannot be weakly referenced, and renders."""
+            __slots__ = ()
+            def render(self, text, antialias, color, background=None):
+                return pygame.Surface((len(text), 1), 0, 32)
+        font = Font()
+        first = cache.render(font, 'a', True, (0, 0, 0))
+        self.assertFalse(cache.render(font, 'a', True, (0, 0, 0)) is first)
+        self.assertEquals(cache.bytes, 0)
+
+    def testTextBoxSprites(self):
+        """TextBoxSprites showing the same text share the surface."""
+        font = CountingFont()
+        for unused in range(3):
+            my_sprite = textboxsprite.TextBoxSprite()
+            my_sprite.font = font
+            my_sprite.text = 'Cancel'
+            my_sprite.rect.size = my_sprite.getTextSize()
+            my_sprite._createImage()
+            my_sprite._drawNormal()
+        self.assertEquals(font.renders, 1)
+        my_sprite.rendered_texts = None
+        my_sprite._drawNormal()
+        self.assertEquals(font.renders, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
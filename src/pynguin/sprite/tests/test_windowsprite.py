@@ -5,7 +5,7 @@ Created on Nov 27, 2010
 """
 import unittest
 import pygame
-from pynguin.sprite import guisprite, windowsprite
+from pynguin.sprite import guisprite, windowsprite, screensprite
 
 # pylint: disable-msg=R0904
 # Because unit tests have tons of public methods and that's normal. 
@@ -47,5 +47,86 @@ class WindowTest(unittest.TestCase):
         self.assertEquals(win1.getSpritesAt((440, 190)), [win1, win2])
         self.assertEquals(win1.getSpritesAt((450, 200)), [win1, win2, spr3])
 
+    def _makeWindow(self):
+        """Return an updated window of 100x100 containing two sprites."""
+        win = windowsprite.WindowSprite()
+        win.rect = pygame.Rect(50, 60, 100, 100)
+        spr1 = guisprite.GuiSprite()
+        spr1.rect = pygame.Rect(10, 10, 20, 20)
+        spr2 = guisprite.GuiSprite()
+        spr2.rect = pygame.Rect(60, 60, 20, 20)
+        win.addSprite(spr1, 0)
+        win.addSprite(spr2, 0)
+        win.update()
+        win.popDirtyRects()
+        return win, spr1, spr2
+
+    def testRefresh(self):
+        """WindowSprite.refresh only redraws the areas damaged."""
+        win, spr1, spr2 = self._makeWindow()
+        win.refresh()
+        self.assertEquals(win.popDirtyRects(), [])
+        spr1.BG_COLOR = (1, 2, 3, 255)
+        spr2.BG_COLOR = (4, 5, 6, 255)
+        spr1.update()
+        spr2._draw() # Not marked as dirty.
+        win.refresh()
+        self.assertEquals(win.popDirtyRects(), [pygame.Rect(60, 70, 20, 20)])
+        self.assertEquals(win.image.get_at((20, 20)), (1, 2, 3, 255))
+        # spr2 changed without saying it: the window still shows it as before.
+        self.assertEquals(win.image.get_at((70, 70)), (32, 32, 32, 255))
+
+    def testRefreshMovedAndRemoved(self):
+        """WindowSprite.refresh redraws the sprites that moved or left."""
+        win, spr1, spr2 = self._makeWindow()
+        spr1.rect.topleft = (20, 10)
+        win.removeSprite(spr2)
+        win.refresh()
+        self.assertEquals(sorted(win.popDirtyRects()),
+                          [pygame.Rect(60, 70, 30, 20),
+                           pygame.Rect(110, 120, 20, 20)])
+        self.assertEquals(win.image.get_at((70, 70)), win.BG_COLOR)
+        self.assertEquals(win.image.get_at((15, 15)), win.BG_COLOR)
+
+    def testRefreshResized(self):
+        """WindowSprite.refresh updates everything after a resize."""
+        win, unused, unused = self._makeWindow()
+        win.rect.size = (120, 100)
+        win.refresh()
+        self.assertEquals(win.image.get_size(), (120, 100))
+        self.assertEquals(win.popDirtyRects(),
+                          [pygame.Rect(50, 60, 120, 100),
+                           pygame.Rect(50, 60, 100, 100),
+                           pygame.Rect(50, 60, 120, 100)])
+
+
+class ScreenTest(unittest.TestCase):
+    """Test the sprite.screensprite module."""
+    def setUp(self):
+        """Open a display."""
+        pygame.display.init()
+        pygame.display.set_mode((200, 100))
+
+    def tearDown(self):
+        """Close the display."""
+        pygame.display.quit()
+
+    def testGetDirtyRects(self):
+        """ScreenSprite.getDirtyRects returns the merged damage."""
+        screen = screensprite.ScreenSprite()
+        spr1 = guisprite.GuiSprite()
+        spr1.rect = pygame.Rect(10, 10, 20, 20)
+        spr2 = guisprite.GuiSprite()
+        spr2.rect = pygame.Rect(20, 20, 20, 20)
+        screen.addSprite(spr1, 0)
+        screen.addSprite(spr2, 0)
+        screen.update()
+        self.assertEquals(screen.getDirtyRects(), [pygame.Rect(0, 0, 200, 100)])
+        spr1.update()
+        spr2.update()
+        screen.refresh()
+        self.assertEquals(screen.getDirtyRects(), [pygame.Rect(10, 10, 30, 30)])
+        self.assertEquals(screen.getDirtyRects(), [])
+
 if __name__ == '__main__':
     unittest.main()
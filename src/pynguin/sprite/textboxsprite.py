@@ -5,60 +5,396 @@ Created on Dec 2, 2010
 @author: Niriel
 """
 
+from bisect import bisect_right
+import pygame
 from textsprite import TextSprite
 
 __all__ = ['TextBoxSprite']
 
 class TextBoxSprite(TextSprite):
-    """TextBoxSprite is a sprite used to represent a one-line text editor."""
+    """TextBoxSprite is a sprite used to represent a one-line text editor.
+
+    In edition mode, the text is kept as a list of segments of about
+    SEGMENT_LENGTH characters.  Each segment is rendered once, and rendered
+    again only when an edit touches it.  The position of each segment is
+    computed from the widths of the segments before it, measured without
+    rendering.  The cursor is drawn over the text, at the caret.
+
+    Drawing again in edition mode only redraws, and damages, what changed:
+    the text from the first edited segment to the end, and the cursor at its
+    old and new places.  Making the cursor blink with setCursorVisible only
+    redraws the cursor.  When the box scrolls, everything is drawn again.
+
+    The caret is the index of the character before which the text is
+    inserted: 0 is the beginning of the text, len(text) the end.
+
+    With a skin, the background of each mode is the image of the same name,
+    if the skin has it.  The text is then drawn without background color.
+
+    """
     BG_COLOR = (255, 255, 255)
     TX_COLOR = (0, 0, 0)
+    SEGMENT_LENGTH = 32
+    SKIN_NAME = 'textbox'
 
     def __init__(self):
         """Initialize a new textbox with a font and a text."""
+        self._segments = ['']
+        self._images = [None]
+        self._offsets = [0]
+        self._starts = [0]
+        self._segments_font = None
+        self._segments_background = None
+        self._caret = 0
+        self._scroll = 0
+        self.cursor_visible = True
+        self._cursor_rect = None
+        # First segment edited since the last drawing, or None.
+        self._edited = None
+        # (image, scroll, skin, text width) of the last drawing in edition
+        # mode, or None when the next one must draw everything.
+        self._edit_drawn = None
         TextSprite.__init__(self)
         self._draw_function = None
         self.setMode('normal')
 
+    def _getText(self):
+        """Return the text of the sprite."""
+        return ''.join(self._segments)
+
+    def _setText(self, text):
+        """Replace the text, keeping the segments that did not change.
+
+        The caret stays where it was, within the new text.  A caret at the end
+        of the old text stays at the end of the new one: a box created with a
+        text, or whose text grows as the user types, shows the end of it.
+
+        """
+        old = self._getText()
+        if text == old:
+            return
+        at_end = self._caret == len(old)
+        # Only the part between the common prefix and suffix changed.
+        limit = min(len(old), len(text))
+        start = 0
+        while start < limit and old[start] == text[start]:
+            start += 1
+        end = 0
+        while end < limit - start and old[-1 - end] == text[-1 - end]:
+            end += 1
+        self._replace(start, len(old) - end, text[start:len(text) - end])
+        if at_end:
+            self._caret = len(text)
+        else:
+            self._caret = min(self._caret, len(text))
+
+    text = property(_getText, _setText, None, "Text of the box.")
+
+    def _getCaret(self):
+        """Return the position of the caret."""
+        return self._caret
+
+    def _setCaret(self, caret):
+        """Move the caret, within the text."""
+        self._caret = max(0, min(caret, len(self._getText())))
+
+    caret = property(_getCaret, _setCaret, None, "Position of the caret.")
+
+    def _getStarts(self):
+        """Return the index of the first character of each segment, and the
+        length of the text.
+
+        Like the offsets, only the starts after the last one still valid are
+        computed.
+
+        """
+        starts = self._starts
+        for segment in self._segments[len(starts) - 1:]:
+            starts.append(starts[-1] + len(segment))
+        return starts
+
+    def _findSegment(self, index):
+        """Return (segment, start): the segment holding the character index.
+
+        The end of the text belongs to the last segment.
+
+        """
+        starts = self._getStarts()
+        segment_index = min(bisect_right(starts, index) - 1,
+                            len(self._segments) - 1)
+        return segment_index, starts[segment_index]
+
+    def _replace(self, start, end, new_text):
+        """Replace text[start:end] with new_text, in the segments.
+
+        The segments holding start and end are joined, edited and split again
+        if they became too long.  Only they lose their image, and only the
+        offsets after them are measured again.
+
+        """
+        first, first_start = self._findSegment(start)
+        last, unused = self._findSegment(max(start, end - 1))
+        joined = ''.join(self._segments[first:last + 1])
+        joined = (joined[:start - first_start] + new_text +
+                  joined[end - first_start:])
+        length = self.SEGMENT_LENGTH
+        if len(joined) > 2 * length:
+            pieces = [joined[i:i + length]
+                      for i in xrange(0, len(joined), length)]
+        elif joined or len(self._segments) == last - first + 1:
+            pieces = [joined]
+        else:
+            pieces = []
+        self._segments[first:last + 1] = pieces
+        self._images[first:last + 1] = [None] * len(pieces)
+        del self._offsets[first + 1:]
+        del self._starts[first + 1:]
+        if self._edited is None or first < self._edited:
+            self._edited = first
+
+    def insertText(self, text):
+        """Insert text at the caret, and move the caret after it."""
+        caret = self._caret
+        self._replace(caret, caret, text)
+        self._caret = caret + len(text)
+
+    def deleteBackward(self, count=1):
+        """Delete count characters before the caret, like backspace."""
+        caret = self._caret
+        start = max(0, caret - count)
+        if start < caret:
+            self._replace(start, caret, '')
+            self._caret = start
+
+    def deleteForward(self, count=1):
+        """Delete count characters after the caret, like delete."""
+        caret = self._caret
+        end = min(len(self._getText()), caret + count)
+        if caret < end:
+            self._replace(caret, end, '')
+
+    def moveCaret(self, delta):
+        """Move the caret by delta characters, within the text."""
+        self._setCaret(self._caret + delta)
+
+    def _checkFont(self):
+        """Forget the images and the widths if the font changed."""
+        if self.font is not self._segments_font:
+            self._segments_font = self.font
+            self._images = [None] * len(self._segments)
+            self._offsets = [0]
+            self._edit_drawn = None
+
+    def _checkBackground(self, background):
+        """Forget the images if they were rendered on another background."""
+        if background != self._segments_background:
+            self._segments_background = background
+            self._images = [None] * len(self._segments)
+            self._edit_drawn = None
+
+    def _getTextBackground(self, state):
+        """Return the background color of the text in state: BG_COLOR, or None
+        if the skin draws the background.
+
+        """
+        if self.skin is not None and self.SKIN_NAME is not None and \
+           self.skin.getSlice(self.SKIN_NAME, state) is not None:
+            return None
+        return self.BG_COLOR
+
+    def _drawBoxBackground(self, state):
+        """Draw the background of the box, and return the background color
+        of the text: BG_COLOR, or None if the skin drew the background.
+
+        """
+        if self._drawSkin(state):
+            return None
+        self._drawBackground()
+        return self.BG_COLOR
+
+    def _measure(self, text):
+        """Return the width of text, without rendering it."""
+        if self.metrics is None:
+            return self.font.size(text)[0]
+        return self.metrics.getSize(self.font, text)[0]
+
+    def _getOffsets(self):
+        """Return the left of each segment, and the width of the text.
+
+        The offsets that are still valid are kept: only the segments after the
+        last one are measured.
+
+        """
+        offsets = self._offsets
+        for segment in self._segments[len(offsets) - 1:]:
+            offsets.append(offsets[-1] + self._measure(segment))
+        return offsets
+
+    def _getSegmentImage(self, index):
+        """Return the image of the segment index, rendering it if needed."""
+        image = self._images[index]
+        if image is None:
+            image = self._renderText(self._segments[index],
+                                     self._segments_background)
+            self._images[index] = image
+        return image
+
+    def getCaretX(self):
+        """Return the horizontal position of the caret within the text."""
+        self._checkFont()
+        index, start = self._findSegment(self._caret)
+        segment = self._segments[index]
+        return (self._getOffsets()[index] +
+                self._measure(segment[:self._caret - start]))
+
     def _drawNormal(self):
         """Draw the text when not in edition mode.
 
         The text is left-justified.  If too long to fit, the end is cropped
 
         """
-        self._drawBackground()
-        text_image = self.font.render(self.text, True,
-                                      self.TX_COLOR, self.BG_COLOR)
+        background = self._drawBoxBackground('normal')
+        text_image = self._renderText(self.text, background)
         self_left = self.drawable_image.get_rect().midleft
         dest_rect = text_image.get_rect(midleft=self_left)
         if dest_rect.left < 0:
             dest_rect.left = 0
         if dest_rect.top < 0:
             dest_rect.top = 0
-        self.drawable_image.blit(text_image, dest_rect)
+        self._blitText(text_image, dest_rect)
+
+    def _scrollToCaret(self, caret_x, cursor_width, text_width):
+        """Return the scroll showing the caret and as much text as possible.
+
+        When the text is longer than the box, the box scrolls as little as
+        possible to keep the caret visible, and never shows empty space after
+        the end of the text.
+
+        """
+        width = self.drawable_image.get_width()
+        scroll = self._scroll
+        if caret_x < scroll:
+            scroll = caret_x
+        if caret_x + cursor_width > scroll + width:
+            scroll = caret_x + cursor_width - width
+        scroll = min(scroll, text_width + cursor_width - width)
+        return max(0, scroll)
+
+    def _getEditDamage(self, scroll, offsets, cursor_rect):
+        """Return the areas of the image to draw again in edition mode.
+
+        None means the whole image: nothing was drawn yet, or the box
+        scrolled.  When only the caret moved, the areas are those of the
+        cursor, before and after.  When the text changed, the area goes from
+        the first edited segment to the end of the longest of the old and new
+        texts, and covers both cursors.
+
+        """
+        drawn = self._edit_drawn
+        image = self.drawable_image
+        if drawn is None or drawn[0] is not image or drawn[1] != scroll or \
+           drawn[2] is not self.skin:
+            return None
+        image_rect = image.get_rect()
+        old_cursor = self._cursor_rect
+        if self._edited is None:
+            if old_cursor.colliderect(cursor_rect):
+                return [old_cursor.union(cursor_rect).clip(image_rect)]
+            return [old_cursor.clip(image_rect), cursor_rect.clip(image_rect)]
+        # Up to the cursor after the end of the text, so that typing at the
+        # end draws one area.  The cursors are joined to it.
+        left = offsets[self._edited] - scroll
+        right = max(drawn[3], offsets[-1]) - scroll + cursor_rect.width
+        area = pygame.Rect(left, 0, right - left, image.get_height())
+        return [area.unionall([old_cursor, cursor_rect]).clip(image_rect)]
+
+    def _drawEditArea(self, area, scroll, offsets, top, cursor):
+        """Draw the background, the text and the cursor within area."""
+        image = self.drawable_image
+        image.set_clip(area)
+        self._drawBoxBackground('edit')
+        right = area.right + scroll
+        first = max(0, bisect_right(offsets, area.left + scroll) - 1)
+        for index in xrange(first, len(self._segments)):
+            if offsets[index] >= right:
+                break
+            if offsets[index + 1] > offsets[index]:
+                segment_image = self._getSegmentImage(index)
+                self._blitText(segment_image,
+                               segment_image.get_rect(
+                                   left=offsets[index] - scroll, top=top))
+        if self.cursor_visible:
+            self._blitText(cursor, self._cursor_rect)
 
     def _drawEdit(self):
-        """Draw the text when in edition mode.
+        """Draw the text when in edition mode, return the areas drawn.
 
-        Note that for simplicity, the cursor is ALWAYS at the end of the text.
-        There is no way yet to edit the middle of the text.
+        Only the segments that changed since the previous drawing are
+        rendered.  Only the areas that changed are drawn again (see
+        _getEditDamage): the background, the visible segments and the cursor
+        within each area.  The areas are returned, or None when the whole
+        image was drawn.
 
-        When editing the text we want to make sure we see its end.  That's why
-        I match the right of the text on the right of the image.  But when the
-        text is short there is no need for that, so in case of the resulting
-        rectangle as a left>0 we bring it to 0.
+        When the text is short, it is left-justified.  When it is too long,
+        the box scrolls to show the caret.  With the caret at the end, the end
+        of the text is matched on the right of the image.
 
         """
-        self._drawBackground()
-        text_image = self.font.render(self.text + self.CURSOR, True,
-                                      self.TX_COLOR, self.BG_COLOR)
-        self_right = self.drawable_image.get_rect().midright
-        dest_rect = text_image.get_rect(midright=self_right)
-        if dest_rect.left > 0:
-            dest_rect.left = 0
-        if dest_rect.top < 0:
-            dest_rect.top = 0
-        self.drawable_image.blit(text_image, dest_rect)
+        self._checkBackground(self._getTextBackground('edit'))
+        self._checkFont()
+        offsets = self._getOffsets()
+        cursor = self._renderText(self.CURSOR)
+        cursor_width, height = cursor.get_size()
+        caret_x = self.getCaretX()
+        scroll = self._scrollToCaret(caret_x, cursor_width, offsets[-1])
+        image = self.drawable_image
+        top = max(0, (image.get_height() - height) // 2)
+        cursor_rect = cursor.get_rect(left=caret_x - scroll, top=top)
+        areas = self._getEditDamage(scroll, offsets, cursor_rect)
+        self._scroll = scroll
+        self._cursor_rect = cursor_rect
+        clip = image.get_clip()
+        for area in [image.get_rect()] if areas is None else areas:
+            self._drawEditArea(area.clip(clip), scroll, offsets, top, cursor)
+        image.set_clip(clip)
+        self._edited = None
+        self._edit_drawn = image, scroll, self.skin, offsets[-1]
+        return areas
+
+    def setCursorVisible(self, visible):
+        """Show or hide the cursor of the edition mode.
+
+        Only the area of the cursor is drawn again, and marked as dirty: the
+        window of the sprite only has that area to redraw when refreshed.
+
+        """
+        if visible == self.cursor_visible:
+            return
+        self.cursor_visible = visible
+        if self._cursor_rect is None or not self._isImageValid():
+            return
+        if self._draw_function != self._drawEdit:
+            return
+        self._markDrawn(self._drawEdit())
+
+    def _markDrawn(self, areas):
+        """Mark areas as dirty, or the whole image if areas is None."""
+        if areas is None:
+            self.markDirty()
+        else:
+            for area in areas:
+                self.markDirty(area)
+
+    def update(self):
+        """Draw the sprite, creating its image if needed.
+
+        Like GuiSprite.update, except that in edition mode only the areas
+        drawn again are marked as dirty.
+
+        """
+        if not self._isImageValid():
+            self._createImage()
+        self._markDrawn(self._draw_function())
 
     def _draw(self):
         """Draw the sprite."""
@@ -67,3 +403,4 @@ class TextBoxSprite(TextSprite):
     def setMode(self, mode):
         """Set the mode: 'normal' or 'edit'."""
         self._draw_function = getattr(self, '_draw%s' % mode.title())
+        self._edit_drawn = None
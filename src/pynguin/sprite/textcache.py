@@ -0,0 +1,287 @@
+#! /usr/bin/python
+"""Caches of the sizes and of the images of the texts rendered by the fonts.
+
+Created on Oct 18, 2026
+
+@author: Niriel
+
+Measuring a text with pygame.font.Font.size lays out the whole string.  A
+label that never changes asks for the same measure at each size negotiation.
+The TextSprites share a TextMetricsCache instead: each font and text are
+measured once, until the cache is full and forgets the least recently used.
+
+Likewise, many labels show the same strings in the same font and colors: "OK",
+"Cancel", the names of the items.  The TextSprites share a RenderedTextCache:
+each string is rendered once, and the sprites blit the same surface.  That
+cache is bounded by the number of bytes of its surfaces, which are converted
+to the format of the display (see displayformat).
+
+"""
+
+import weakref
+from collections import OrderedDict
+import pygame
+from displayformat import ConvertSurface
+from displayformat import GetFormatVersion
+
+__all__ = ['TextMetricsCache', 'GetDefaultTextMetricsCache',
+           'RenderedTextCache', 'GetDefaultRenderedTextCache']
+
+
+class _FontTokens(object):
+    """Give each font a number that no other font will ever get.
+
+    The fonts are weakly referenced, and forgotten with them: a new font
+    object never gets the token of an old one, even if Python gives it the
+    same id.
+
+    """
+
+    def __init__(self):
+        object.__init__(self)
+        self._tokens = weakref.WeakKeyDictionary()
+        self._last_token = 0
+
+    def __len__(self):
+        return len(self._tokens)
+
+    def get(self, font):
+        """Return the token of font, or None if it cannot be tracked."""
+        tokens = self._tokens
+        try:
+            return tokens[font]
+        except KeyError:
+            self._last_token += 1
+            tokens[font] = self._last_token
+            return self._last_token
+        except TypeError:
+            # No weak reference possible.
+            return None
+
+    def forget(self, font):
+        """Give font a new token the next time."""
+        try:
+            del self._tokens[font]
+        except (KeyError, TypeError):
+            pass
+
+
+class TextMetricsCache(object):
+    """A bounded LRU cache of the sizes of texts, per font.
+
+    The fonts are identified by a token given the first time they are seen,
+    and forgotten with them.  A new font object never gets the token of an
+    old one, even if Python gives it the same id.  The size of a pygame font
+    is fixed when it is created, so it is part of its identity.
+
+    Changing the style of a font (set_bold, set_italic) changes its metrics:
+    call forgetFont after that.
+
+    >>> class Font(object):
+    ...     def size(self, text):
+    ...         print 'measuring %r' % text
+    ...         return 8 * len(text), 12
+    >>> cache = TextMetricsCache(100)
+    >>> font = Font()
+    >>> print cache.getSize(font, 'Hello')
+    measuring 'Hello'
+    (40, 12)
+    >>> print cache.getSize(font, 'Hello')
+    (40, 12)
+    >>> cache.forgetFont(font)
+    >>> print cache.getSize(font, 'Hello')
+    measuring 'Hello'
+    (40, 12)
+    >>> print cache.hits, cache.misses, cache.getHitRate()
+    1 2 0.333333333333
+
+    """
+
+    def __init__(self, capacity=4096):
+        """Initialize a new TextMetricsCache holding at most capacity sizes."""
+        object.__init__(self)
+        if capacity < 1:
+            raise ValueError("A TextMetricsCache holds at least one size.")
+        self.capacity = capacity
+        self._entries = OrderedDict()
+        self._tokens = _FontTokens()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def getSize(self, font, text):
+        """Return font.size(text), measuring it only if not cached."""
+        token = self._tokens.get(font)
+        if token is None:
+            # Cannot be tracked: measure it each time.
+            self.misses += 1
+            return font.size(text)
+        key = (token, text)
+        entries = self._entries
+        try:
+            size = entries.pop(key)
+        except KeyError:
+            self.misses += 1
+            size = tuple(font.size(text))
+            entries[key] = size
+            if len(entries) > self.capacity:
+                entries.popitem(last=False)
+            return size
+        entries[key] = size # Most recently used.
+        self.hits += 1
+        return size
+
+    def forgetFont(self, font):
+        """Measure again the texts of font.
+
+        The font gets a new token: its old sizes are never used again and
+        leave the cache as it fills up.
+
+        """
+        self._tokens.forget(font)
+
+    def clear(self):
+        """Forget all the sizes.  The counters are kept."""
+        self._entries.clear()
+
+    def getHitRate(self):
+        """Return the proportion of the sizes found in the cache."""
+        total = self.hits + self.misses
+        return float(self.hits) / total if total else 0.0
+
+    def getStats(self):
+        """Return a dict with the keys 'hits', 'misses', 'size', 'capacity'.
+        """
+        return {'hits': self.hits, 'misses': self.misses,
+                'size': len(self._entries), 'capacity': self.capacity}
+
+    def resetStats(self):
+        """Set the hit and miss counters back to 0."""
+        self.hits = 0
+        self.misses = 0
+
+
+class RenderedTextCache(object):
+    """A cache of rendered texts, bounded by the bytes of the surfaces.
+
+    The key of a surface is (font, text, antialias, foreground, background),
+    the arguments of Font.render.  The fonts are identified like in
+    TextMetricsCache.  When the surfaces take more than max_bytes, the least
+    recently used are forgotten.  A surface bigger than max_bytes on its own
+    is rendered but not kept.
+
+    The surfaces are shared: never draw on them, only blit them.  They are
+    in the format of the display, and forgotten when that format changes.
+
+    >>> class Font(object):
+    ...     def render(self, text, antialias, color, background=None):
+    ...         print 'rendering %r' % text
+    ...         return pygame.Surface((8 * len(text), 10), 0, 32)
+    >>> cache = RenderedTextCache(2000)
+    >>> font = Font()
+    >>> ok = cache.render(font, 'OK', True, (0, 0, 0))
+    rendering 'OK'
+    >>> cache.render(font, 'OK', True, (0, 0, 0)) is ok
+    True
+    >>> print cache.bytes
+    640
+    >>> cancel = cache.render(font, 'Cancel', True, (0, 0, 0))
+    rendering 'Cancel'
+    >>> print len(cache), cache.bytes # 'OK' was forgotten.
+    1 1920
+
+    """
+
+    def __init__(self, max_bytes=8 * 1024 * 1024):
+        """Initialize a new RenderedTextCache holding at most max_bytes."""
+        object.__init__(self)
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._entries = OrderedDict()
+        self._tokens = _FontTokens()
+        self.hits = 0
+        self.misses = 0
+        self._format_version = None
+
+    def __len__(self):
+        return len(self._entries)
+
+    def render(self, font, text, antialias, color, background=None):
+        """Return font.render(text, antialias, color, background), shared.
+        """
+        token = self._tokens.get(font)
+        if token is None:
+            self.misses += 1
+            return _Render(font, text, antialias, color, background)
+        key = (token, text, antialias, tuple(color),
+               None if background is None else tuple(background))
+        version = GetFormatVersion()
+        if version != self._format_version:
+            self._format_version = version
+            self.clear()
+        entries = self._entries
+        try:
+            surface, size = entries.pop(key)
+        except KeyError:
+            self.misses += 1
+            surface = _Render(font, text, antialias, color, background)
+            size = surface.get_pitch() * surface.get_height()
+            if size <= self.max_bytes:
+                entries[key] = surface, size
+                self.bytes += size
+                while self.bytes > self.max_bytes:
+                    unused, (unused, old_size) = entries.popitem(last=False)
+                    self.bytes -= old_size
+            return surface
+        entries[key] = surface, size # Most recently used.
+        self.hits += 1
+        return surface
+
+    def forgetFont(self, font):
+        """Render again the texts of font, after a change of style."""
+        self._tokens.forget(font)
+
+    def clear(self):
+        """Forget all the surfaces.  The counters are kept."""
+        self._entries.clear()
+        self.bytes = 0
+
+    def getStats(self):
+        """Return a dict with the keys 'hits', 'misses', 'size', 'bytes' and
+        'max_bytes'.
+
+        """
+        return {'hits': self.hits, 'misses': self.misses,
+                'size': len(self._entries), 'bytes': self.bytes,
+                'max_bytes': self.max_bytes}
+
+    def resetStats(self):
+        """Set the hit and miss counters back to 0."""
+        self.hits = 0
+        self.misses = 0
+
+
+def _Render(font, text, antialias, color, background):
+    """Call font.render, without background if background is None, and
+    convert the result to the format of the display.
+
+    """
+    if background is None:
+        surface = font.render(text, antialias, color)
+    else:
+        surface = font.render(text, antialias, color, background)
+    return ConvertSurface(surface)
+
+
+_default_cache = TextMetricsCache()
+_default_rendered_cache = RenderedTextCache()
+
+def GetDefaultTextMetricsCache():
+    """Return the TextMetricsCache shared by the TextSprites."""
+    return _default_cache
+
+def GetDefaultRenderedTextCache():
+    """Return the RenderedTextCache shared by the TextSprites."""
+    return _default_rendered_cache
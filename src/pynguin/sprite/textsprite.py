@@ -5,20 +5,63 @@ Created on Nov 27, 2010
 """
 
 from guisprite import GuiSprite
+from textcache import GetDefaultTextMetricsCache
+from textcache import GetDefaultRenderedTextCache
+from glyphatlas import GetGlyphAtlas
 
 class TextSprite(GuiSprite):
     """Abstract class for sprites that display text."""
 
     CURSOR = '|'
+    TX_COLOR = (0, 0, 0)
+    # Draw the texts with the glyphs of a shared GlyphAtlas rather than with
+    # Font.render.  Can also be set on an object.
+    USE_GLYPH_ATLAS = False
 
     def __init__(self):
         """Initialize a new TextSprite."""
         GuiSprite.__init__(self)
         self.font = None
         self.text = ''
+        self.metrics = GetDefaultTextMetricsCache()
+        self.rendered_texts = GetDefaultRenderedTextCache()
 
     def getTextSize(self):
         """Compute the size needed for rendering the text as (width, height).
 
+        The size is looked up in the TextMetricsCache of the sprite, shared by
+        default: a text is only measured the first time.  Set metrics to None
+        to measure the text each time.
+
         """
-        return self.font.size(self.text)
+        if self.metrics is None:
+            return self.font.size(self.text)
+        return self.metrics.getSize(self.font, self.text)
+
+    def _renderText(self, text, background=None):
+        """Return an image of text in TX_COLOR, to be drawn with _blitText.
+
+        The image is a surface rendered by the font, or an AtlasText if
+        USE_GLYPH_ATLAS is True.  In that case the background is not drawn:
+        draw it first.  Both have get_size and get_rect.
+
+        The surfaces come from the RenderedTextCache of the sprite, shared by
+        default: they must not be modified.  Set rendered_texts to None to
+        render the text each time.
+
+        """
+        if self.USE_GLYPH_ATLAS:
+            return GetGlyphAtlas(self.font, self.TX_COLOR).render(text)
+        if self.rendered_texts is not None:
+            return self.rendered_texts.render(self.font, text, True,
+                                              self.TX_COLOR, background)
+        if background is None:
+            return self.font.render(text, True, self.TX_COLOR)
+        return self.font.render(text, True, self.TX_COLOR, background)
+
+    def _blitText(self, text_image, dest_rect):
+        """Draw the result of _renderText on drawable_image at dest_rect."""
+        if self.USE_GLYPH_ATLAS:
+            text_image.blitOn(self.drawable_image, dest_rect.topleft)
+        else:
+            self.drawable_image.blit(text_image, dest_rect)
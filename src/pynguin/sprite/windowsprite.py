@@ -7,6 +7,7 @@ Created on Nov 26, 2010
 
 import pygame
 from guisprite import GuiSprite
+from guisprite import MergeRects
 
 __all__ = ['WindowSprite']
 
@@ -35,13 +36,21 @@ class WindowSprite(GuiSprite):
       the window itself, not the screen.  It makes things easier by reducing
       maintenance when a window is moved.
 
+    update redraws the whole window and all its sprites.  refresh only redraws
+    the areas damaged by the sprites since the last time (see
+    GuiSprite.popDirtyRects), and marks them as damaged on the window itself,
+    so that its own window redraws them in turn.
+
     """
 
     BG_COLOR = (235, 235, 235)
+    SKIN_NAME = 'window'
 
     def __init__(self):
         GuiSprite.__init__(self)
         self._sprites_group = pygame.sprite.LayeredUpdates()
+        # Damage left by the sprites removed, in the coordinates of the image.
+        self._removed_rects = []
 
     def _drawSprites(self):
         """Draw the contained sprites onto itself.
@@ -56,11 +65,14 @@ class WindowSprite(GuiSprite):
     def _draw(self):
         """Draw the window onto its own surface: background and sprites.
 
+        The background is the 'normal' image of the skin, if any.
+
         Warning: this DOES NOT call the method _draw of the sprites of the
         _sprites_group.  It draws them as they are.
 
         """
-        GuiSprite._draw(self)
+        if not self._drawSkin('normal'):
+            GuiSprite._draw(self)
         self._drawSprites()
 
     def update(self):
@@ -73,6 +85,38 @@ class WindowSprite(GuiSprite):
         """
         self._sprites_group.update()
         GuiSprite.update(self)
+        # Everything was drawn.
+        for sprite in self._sprites_group:
+            sprite.popDirtyRects()
+        self._removed_rects = []
+
+    def refresh(self):
+        """Redraw the areas damaged by the sprites, and only them.
+
+        Unlike update, refresh DOES NOT call update on the sprites: they are
+        expected to be up to date.  The sprites that moved are redrawn too.
+        If the window has no image yet, changed of size or if the format of the
+        display changed, it is entirely updated instead.
+
+        """
+        if not self._isImageValid():
+            self.update()
+            return
+        rects = self._removed_rects
+        self._removed_rects = []
+        for sprite in self._sprites_group:
+            rects.extend(sprite.popDirtyRects())
+        bounds = self.drawable_image.get_rect()
+        for rect in MergeRects(rect.clip(bounds) for rect in rects):
+            self._redrawArea(rect)
+
+    def _redrawArea(self, area):
+        """Draw background and sprites in area only, and mark it as dirty."""
+        image = self.drawable_image
+        image.set_clip(area)
+        WindowSprite._draw(self)
+        image.set_clip(None)
+        self.markDirty(area)
 
     def getSpritesAt(self, pos):
         """Return a list of all the contained sprites at pos, including self.
@@ -110,3 +154,6 @@ class WindowSprite(GuiSprite):
             msg = "Cannot remove a sprite that is not in the group."
             raise SpriteNotInGroupError(msg)
         self._sprites_group.remove(sprite)
+        if sprite._drawn_rect is not None:
+            self._removed_rects.append(sprite._drawn_rect)
+            sprite._drawn_rect = None
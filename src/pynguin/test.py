@@ -39,7 +39,7 @@ def main():
     running = True
     clock = pygame.time.Clock()
     while running:
-        pygame.display.flip()
+        pygame.display.update(screen.getDirtyRects())
         clock.tick(100)
         for event in pygame.event.get():
             if event.type == EVENT_QUIT:
@@ -0,0 +1,135 @@
+#! /usr/bin/python
+"""
+Created on Oct 18, 2026
+
+@author: Niriel
+"""
+
+import unittest
+from StringIO import StringIO
+from pynguin import instrumentation
+from pynguin.layout.container import Container
+from pynguin.layout.boxlayout import VBoxLayout
+from pynguin.layout.size import Size
+from pynguin.layout.size import SizeAllocation
+from pynguin.layout.sizeable import Sizeable
+from pynguin.layout.parentable import Parentable
+from pynguin.sprite.guisprite import GuiSprite
+
+# pylint: disable-msg=R0904
+# Because unit tests have tons of public methods and that's normal.
+
+# pylint: disable-msg=W0212
+# Because I know what I'm doing when I use a protected attribute in a test.
+
+
+class MockLeaf(Sizeable, Parentable):
+    """A leaf of fixed size."""
+    def __init__(self):
+        Sizeable.__init__(self)
+        Parentable.__init__(self)
+    def _requestSize(self):
+        return Size(10, 10)
+    def _allocateSize(self):
+        pass
+
+
+class MockClock(object):
+    """A clock that advances by one second each time it is read."""
+    def __init__(self):
+        self.now = 0
+    def __call__(self):
+        self.now += 1
+        return self.now
+
+
+def MakeTree():
+    """Return a VBox Container holding two leaves."""
+    root = Container()
+    root._layout = VBoxLayout(0, False)
+    root.addChild(MockLeaf(), 'end')
+    root.addChild(MockLeaf(), 'end')
+    return root
+
+
+class TestProfiler(unittest.TestCase):
+    """Test the instrumentation module."""
+
+    def testEnableDisable(self):
+        """Profiler.disable puts the original methods back."""
+        originals = [Sizeable.__dict__['requestSize'],
+                     Container.__dict__['requestSize'],
+                     GuiSprite.__dict__['update']]
+        profiler = instrumentation.Profiler()
+        other = instrumentation.Profiler()
+        profiler.enable()
+        try:
+            self.assertTrue(profiler.isEnabled())
+            self.assertFalse(Container.__dict__['requestSize'] is
+                             originals[1])
+            self.assertRaises(instrumentation.InstrumentationError,
+                              other.enable)
+            profiler.enable() # Already enabled: nothing happens.
+        finally:
+            profiler.disable()
+        self.assertFalse(profiler.isEnabled())
+        self.assertEquals([Sizeable.__dict__['requestSize'],
+                           Container.__dict__['requestSize'],
+                           GuiSprite.__dict__['update']], originals)
+        root = MakeTree()
+        root.requestSize(True)
+        self.assertEquals(profiler.getRecords(), [])
+        with other:
+            self.assertTrue(other.isEnabled())
+        self.assertFalse(other.isEnabled())
+
+    def testRecords(self):
+        """Profiler records calls, inclusive and exclusive times and paths."""
+        root = MakeTree()
+        profiler = instrumentation.Profiler(MockClock())
+        with profiler:
+            root.requestSize(True)
+        records = profiler.getRecords()
+        # Each leaf reads the clock twice, the root twice more.
+        self.assertEquals([(record['path'], record['operation'],
+                            record['calls'], record['inclusive'],
+                            record['exclusive']) for record in records],
+                          [('Container#1', 'requestSize', 1, 5, 3),
+                           ('Container#1/MockLeaf#2', 'requestSize', 1, 1, 1),
+                           ('Container#1/MockLeaf#3', 'requestSize', 1, 1, 1)])
+        with profiler:
+            root.allocateSize(SizeAllocation((0, 0), (10, 20)))
+        self.assertEquals(len(profiler.getRecords()), 6)
+        profiler.reset()
+        self.assertEquals(profiler.getRecords(), [])
+
+    def testCollapsedStacks(self):
+        """Profiler writes collapsed stacks for the flame graph tools."""
+        root = MakeTree()
+        profiler = instrumentation.Profiler(MockClock())
+        with profiler:
+            root.requestSize(True)
+            root.requestSize(True)
+        output = StringIO()
+        profiler.writeCollapsedStacks(output)
+        self.assertEquals(output.getvalue().splitlines(),
+                          ['Container#1.requestSize 6000000',
+                           'Container#1.requestSize;MockLeaf#2.requestSize '
+                           '2000000',
+                           'Container#1.requestSize;MockLeaf#3.requestSize '
+                           '2000000'])
+
+    def testSprites(self):
+        """Profiler measures GuiSprite.update and the nested _draw."""
+        sprite = GuiSprite()
+        sprite.rect.size = (4, 3)
+        profiler = instrumentation.Profiler(MockClock())
+        with profiler:
+            sprite.update()
+        self.assertEquals(profiler.getCollapsedStacks(),
+                          ['GuiSprite#1.update 2000000',
+                           'GuiSprite#1.update;GuiSprite#1._draw 1000000'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+#! /usr/bin/python
+"""
+Created on Oct 18, 2026
+
+@author: Niriel
+"""
+
+import unittest
+from pynguin import scheduler
+from pynguin.layout.container import Container
+from pynguin.layout.boxlayout import VBoxLayout
+from pynguin.layout.size import Size
+from pynguin.layout.sizeable import Sizeable
+from pynguin.layout.parentable import Parentable
+
+# pylint: disable-msg=R0904
+# Because unit tests have tons of public methods and that's normal.
+
+# pylint: disable-msg=W0212
+# Because I know what I'm doing when I use a protected attribute in a test.
+
+
+class MockLeaf(Sizeable, Parentable):
+    """A leaf widget with a sprite, recording when it is drawn."""
+    def __init__(self, altitude, log):
+        Sizeable.__init__(self)
+        Parentable.__init__(self)
+        self.altitude = altitude
+        self.log = log
+        self._sprite = True
+        self.width = 10
+    def _requestSize(self):
+        return Size(self.width, 10)
+    def _allocateSize(self):
+        pass
+    def draw(self):
+        self.log.append(self)
+
+
+class MockBox(Container):
+    """A container with or without sprite, recording when it is drawn."""
+    def __init__(self, altitude, log, has_sprite):
+        Container.__init__(self)
+        self._layout = VBoxLayout(0, False)
+        self.altitude = altitude
+        self.log = log
+        self._sprite = has_sprite
+    def draw(self):
+        self.log.append(self)
+
+
+class MockClock(object):
+    """A clock that advances by one second each time it is read."""
+    def __init__(self):
+        self.now = 0
+    def __call__(self):
+        self.now += 1
+        return self.now
+
+
+class TestScheduler(unittest.TestCase):
+    """Test the scheduler module."""
+    def setUp(self):
+        """Build window > box > leaves, twice: two roots."""
+        self.log = []
+        self.roots = []
+        self.boxes = []
+        self.leaves = []
+        for unused in range(2):
+            root = MockBox(0, self.log, True)
+            box = MockBox(1, self.log, False)
+            root.addChild(box, 'end')
+            for unused in range(3):
+                leaf = MockLeaf(2, self.log)
+                box.addChild(leaf, 'end')
+                self.leaves.append(leaf)
+            self.roots.append(root)
+            self.boxes.append(box)
+            root.negotiateSize(True)
+
+    def testDocTest(self):
+        """Module scheduler passes its doctests."""
+        import doctest
+        failures, unused = doctest.testmod(m=scheduler)
+        del unused
+        self.assertEquals(failures, 0)
+
+    def testSizeNegotiationSeveralRoots(self):
+        """Scheduler negotiates the size of every modified tree."""
+        my_scheduler = scheduler.Scheduler()
+        self.leaves[0].width = 20
+        self.leaves[4].width = 30
+        my_scheduler.askForSizeNegotiation(self.leaves[0])
+        my_scheduler.askForSizeNegotiation(self.leaves[4])
+        my_scheduler.askForSizeNegotiation(self.leaves[4])
+        my_scheduler.proceed()
+        self.assertEquals(my_scheduler.frame_stats['negotiated'], 2)
+        self.assertEquals(self.roots[0].allocated_size.size, Size(20, 30))
+        self.assertEquals(self.roots[1].allocated_size.size, Size(30, 30))
+        self.assertFalse(my_scheduler.hasPendingWork())
+
+    def testRedrawingOrderAndDedup(self):
+        """Scheduler redraws the deepest first, each widget once."""
+        my_scheduler = scheduler.Scheduler()
+        my_scheduler.askForRedrawing(self.leaves[0])
+        my_scheduler.askForRedrawing(self.leaves[1])
+        my_scheduler.askForRedrawing(self.leaves[1])
+        my_scheduler.askForRedrawing(self.roots[0])
+        my_scheduler.proceed()
+        self.assertEquals(len(self.log), 3)
+        self.assertEquals(set(self.log[:2]), set(self.leaves[:2]))
+        # The box has no sprite: the window is redrawn instead, at the end.
+        self.assertTrue(self.log[2] is self.roots[0])
+        self.assertFalse(my_scheduler.hasPendingWork())
+
+    def testBudgetDefersLowPriority(self):
+        """Scheduler defers the low priority work once over budget."""
+        my_scheduler = scheduler.Scheduler(frame_budget=2,
+                                           clock=MockClock())
+        for leaf in self.leaves[:3]:
+            my_scheduler.askForRedrawing(leaf, scheduler.PRIORITY_LOW)
+        my_scheduler.askForRedrawing(self.leaves[3], scheduler.PRIORITY_HIGH)
+        my_scheduler.proceed()
+        # The high priority leaf and its window are always drawn.
+        self.assertTrue(self.leaves[3] in self.log)
+        self.assertTrue(self.roots[1] in self.log)
+        self.assertTrue(my_scheduler.frame_stats['deferred'] > 0)
+        self.assertTrue(my_scheduler.hasPendingWork())
+        # Without deadline, everything left is done.
+        del self.log[:]
+        my_scheduler.frame_budget = 1000
+        my_scheduler.proceed()
+        self.assertFalse(my_scheduler.hasPendingWork())
+        self.assertTrue(self.roots[0] in self.log)
+
+
+if __name__ == "__main__":
+    unittest.main()
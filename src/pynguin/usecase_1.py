@@ -53,7 +53,7 @@ def CreateGui():
     # registered so that the call to `pynguin.update()` (see below) does all
     # the drawing and registering for me.
 
-    return button, text_input
+    return display, button, text_input
 
 def main():
     pygame.init()
@@ -64,7 +64,7 @@ def main():
 
     pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 
-    button, text_input = CreateGui()
+    display, button, text_input = CreateGui()
 
     running = True
     clock = pygame.time.Clock()
@@ -74,7 +74,8 @@ def main():
         # In this usecase, the GUI is not modified after the initial creation
         # so `pynguin.update` will do something only the first time.
         pynguin.update()
-        pygame.display.flip()
+        # Only the areas of the display that changed are sent to it.
+        pygame.display.update(display.getDirtyRects())
         clock.tick(MAX_FPS)
         for event in pygame.event.get():
             if event.type == EVENT_QUIT:
@@ -94,6 +94,7 @@ def CreateGui(event_manager):
     hbox.addChild(button_right, 'end', 'widget', 'widget')
     button_left.addChild(label_left, 'padding', 'padding')
     button_right.addChild(label_right, 'padding', 'padding')
+    return display
 
 
 class ConsoleViewer(object):
@@ -112,7 +113,7 @@ def main():
 
     event_manager = EventManager()
 
-    CreateGui(event_manager)
+    display = CreateGui(event_manager)
 
     console_viewer = ConsoleViewer()
     event_manager.register(console_viewer)
@@ -123,7 +124,8 @@ def main():
         # I expect the GUI to have to update itself once per frame at max.
         # If `pynguin.update` has nothing to do then it returns immediately.
         pynguin.update()
-        pygame.display.flip()
+        # Only the areas of the display that changed are sent to it.
+        pygame.display.update(display.getDirtyRects())
         clock.tick(MAX_FPS)
         for event in pygame.event.get():
             if event.type == EVENT_QUIT:
@@ -177,7 +177,7 @@ def CreateGui():
     display.addChild(board, 'widget', 'widget')
     board.addChild(label_move)
     board.addChild(label_fps)
-    return label_move, label_fps, label_follow, label_bounce
+    return display, label_move, label_fps, label_follow, label_bounce
 
 
 def main():
@@ -187,7 +187,8 @@ def main():
     pygame.init()
     pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 
-    label_move, label_fps, label_follow, label_bounce = CreateGui()
+    (display, label_move, label_fps, label_follow,
+     label_bounce) = CreateGui()
 
     running = True
     clock = pygame.time.Clock()
@@ -209,7 +210,8 @@ def main():
         # time it is impossible to use animations, it would be natural to just
         # don't animate anything if the time is not provided.
         pynguin.update(gui_time)
-        pygame.display.flip()
+        # Only the areas of the display that changed are sent to it.
+        pygame.display.update(display.getDirtyRects())
         for event in pygame.event.get():
             if event.type == EVENT_QUIT:
                 running = False
@@ -11,5 +11,6 @@ from scrollwidget import ScrollWidget
 from sizeablewidget import SizeableWidget
 from textboxwidget import TextBoxWidget
 from textwidget import TextWidget
+from virtuallistwidget import VirtualListWidget
 from windowwidget import WindowWidget
 from borderwidget import BorderWidget
@@ -5,10 +5,27 @@ Created on Dec 2, 2010
 """
 
 from pynguin.layout.container import Container
+from pynguin.scheduler import GetDefaultScheduler
 from widget import Widget
 
 __all__ = ['ContainerWidget']
 
+
+def _Settle(children, displayer):
+    """Set the displayer of children and their descendants.
+
+    Each widget is visited once.  It is equivalent to calling
+    dispatchDisplayers on each child.
+
+    """
+    for child in children:
+        child.setDisplayer(displayer)
+        if isinstance(child, ContainerWidget):
+            grandchildren = child.children
+            if grandchildren:
+                _Settle(grandchildren, child._getChildrenDisplayer(displayer))
+
+
 class ContainerWidget(Widget, Container):
     """Base class for widgets implementing a container widget."""
     LAYOUT_CLS = None
@@ -25,6 +42,10 @@ class ContainerWidget(Widget, Container):
         self._layout = self.LAYOUT_CLS() if self.LAYOUT_CLS else None
         # pylint: enable-msg=E1102
 
+    def _getChildrenDisplayer(self, displayer):
+        """Return the displayer of the children when displayer is ours."""
+        return displayer
+
     def dispatchDisplayers(self, displayer):
         """Recursively set the displayers of the widget tree.
 
@@ -36,18 +57,6 @@ class ContainerWidget(Widget, Container):
         for child in self.children:
             child.dispatchDisplayers(displayer)
 
-    def _setAltitude(self, value):
-        """Set the altitude of the widget and its children.
-
-        If you assign to this container an altitude of `n`, then its children
-        will be assigned the altitude `n+1`.
-
-        """
-        Widget._setAltitude(self, value)
-        children_altitude = self.altitude + 1
-        for child in self:
-            child.altitude = children_altitude
-
     def addChild(self, child, where='end'):
         """Add child to the container.
 
@@ -93,9 +102,63 @@ class ContainerWidget(Widget, Container):
         For expand_width, expand_height and padding, please refer to the
         documentation of Cell.
 
-        This method overloads Container.addChild.  It calls Container.addChild
-        and then assigns an altitude to the child: that of the container + 1.
+        This method overloads Container.addChild only to give a default value
+        to `where`.  The altitude of the child is computed when asked for.
 
         """
         Container.addChild(self, child, where)
-        child.altitude = self.altitude + 1
+
+    def addChildren(self, children, where='end'):
+        """Add several children to the container at once.
+
+        Parameters.
+        ===========
+
+        - children: an iterable of children to add.
+        - where: the position of the first child, see addChild.  The other
+          children follow it, in order.
+
+        Unlike a series of calls to addChild, the children are checked once,
+        the requested size is invalidated once, and the displayers of all the
+        new widgets are set in a single traversal.  The children are displayed
+        by the displayer of the container (or by the container itself if it is
+        a window).  A single size negotiation is asked to the default
+        scheduler.
+
+        """
+        children = list(children)
+        Container.addChildren(self, children, where)
+        _Settle(children, self._getChildrenDisplayer(self.getDisplayer()))
+        GetDefaultScheduler().askForSizeNegotiation(self)
+
+    def removeChildren(self, children):
+        """Remove several children from the container at once.
+
+        The removed widgets are not displayed anymore.  A single size
+        negotiation is asked to the default scheduler.
+
+        """
+        children = list(children)
+        Container.removeChildren(self, children)
+        for child in children:
+            child.dispatchDisplayers(None)
+        GetDefaultScheduler().askForSizeNegotiation(self)
+
+    def replaceChildren(self, children):
+        """Replace all the children of the container with children, in order.
+
+        The widgets that were already children stay in the container, the
+        others are removed and not displayed anymore.  Return the list of the
+        removed children.  A single size negotiation is asked to the default
+        scheduler.
+
+        """
+        children = list(children)
+        old_ids = set(id(child) for child in self.children)
+        removed = Container.replaceChildren(self, children)
+        for child in removed:
+            child.dispatchDisplayers(None)
+        _Settle([child for child in children if id(child) not in old_ids],
+                self._getChildrenDisplayer(self.getDisplayer()))
+        GetDefaultScheduler().askForSizeNegotiation(self)
+        return removed
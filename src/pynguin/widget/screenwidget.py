@@ -21,7 +21,8 @@ class ScreenWidget(WindowWidget):
     """ScreenWidget is a widget that takes the display as drawing surface.
 
     Anything drawn on the drawable_image of a screen object will be displayed
-    at the next refresh (pygame.display.flip() for example).
+    at the next refresh of the display.  getDirtyRects returns the areas that
+    changed, for pygame.display.update.
 
     """
 
@@ -66,3 +67,12 @@ class ScreenWidget(WindowWidget):
         """
         for child in self.children:
             child.dispatchDisplayers(self)
+
+    def getDirtyRects(self):
+        """Return the areas of the display that changed, and forget them.
+
+        Pass them to pygame.display.update at each frame.  See
+        ScreenSprite.getDirtyRects.
+
+        """
+        return self._sprite.getDirtyRects()
@@ -5,6 +5,8 @@ Created on Jan 9, 2011
 @author: Niriel
 """
 
+import pygame
+
 class MockDisplayer(object):
     def __init__(self):
         object.__init__(self)
@@ -32,3 +34,5 @@ class MockFont(object):
         self.char_size = char_size
     def size(self, text):
         return self.char_size * len(text), self.char_size
+    def render(self, text, antialias, color, background=None):
+        return pygame.Surface(self.size(text), 0, 32)
@@ -6,6 +6,10 @@ Created on Jan 9, 2011
 import unittest
 from pynguin.widget import containerwidget
 from pynguin.widget.sizeablewidget import SizeableWidget
+from pynguin.widget.windowwidget import WindowWidget
+from pynguin.scheduler import GetDefaultScheduler
+from pynguin.layout.container import ContainerError
+from pynguin.layout.parentable import AlreadyParentError
 from mock import MockDisplayer
 
 # pylint: disable-msg=R0904
@@ -47,6 +51,97 @@ class TestContainerWidget(unittest.TestCase):
         self.assertTrue(widget1.getDisplayer() is displayer)
         self.assertTrue(widget2.getDisplayer() is displayer)
 
+    def _popNegotiations(self):
+        """Return and forget the widgets waiting for a size negotiation."""
+        to_resize = GetDefaultScheduler()._to_resize
+        result = set(to_resize)
+        to_resize.clear()
+        return result
+
+    def testAltitude(self):
+        """ContainerWidget altitudes follow the tree, lazily."""
+        root = containerwidget.ContainerWidget()
+        root.altitude = 0
+        panel = containerwidget.ContainerWidget()
+        leaf = SizeableWidget()
+        panel.addChild(leaf)
+        root.addChild(panel)
+        self.assertEquals(leaf.altitude, 2)
+        self.assertEquals(leaf.altitude, 2) # Cached.
+        # Moving the panel does not visit its subtree...
+        other = containerwidget.ContainerWidget()
+        other.altitude = 5
+        root.removeChild(panel)
+        other.addChild(panel)
+        self.assertNotEquals(leaf._altitude_version,
+                             leaf.__class__.tree_version)
+        # ... but the altitudes are right when asked for.
+        self.assertEquals(leaf.altitude, 7)
+        self.assertEquals(panel.altitude, 6)
+        other.removeChild(panel)
+        self.assertEquals(leaf.altitude, 0) # The panel is a root at -1.
+        panel.altitude = 10
+        self.assertEquals(leaf.altitude, 11)
+
+    def testAddChildren(self):
+        """ContainerWidget.addChildren settles the whole subtrees at once."""
+        window = WindowWidget()
+        window.altitude = 3
+        panel = containerwidget.ContainerWidget()
+        leaves = [SizeableWidget() for unused in range(3)]
+        panel.addChildren(leaves[:2])
+        other = SizeableWidget()
+        self._popNegotiations()
+        window.addChildren([panel, other], 'beginning')
+        self.assertEquals(window.children, [panel, other])
+        self.assertEquals(panel.altitude, 4)
+        self.assertEquals([leaf.altitude for leaf in leaves[:2]], [5, 5])
+        self.assertTrue(panel.getDisplayer() is window)
+        self.assertTrue(leaves[0].getDisplayer() is window)
+        self.assertEquals(self._popNegotiations(), set([window]))
+        panel.addChildren([leaves[2]], ('before', leaves[0]))
+        self.assertEquals(panel.children, [leaves[2], leaves[0], leaves[1]])
+        self.assertTrue(leaves[2].getDisplayer() is window)
+        self._popNegotiations()
+
+    def testAddChildrenChecksFirst(self):
+        """ContainerWidget.addChildren adds nothing if a child is invalid."""
+        first = containerwidget.ContainerWidget()
+        second = containerwidget.ContainerWidget()
+        taken = SizeableWidget()
+        first.addChild(taken)
+        free = SizeableWidget()
+        self.assertRaises(AlreadyParentError, second.addChildren,
+                          [free, taken])
+        self.assertEquals(second.children, [])
+        self.assertTrue(free.parent is None)
+        self.assertRaises(ContainerError, second.addChildren, [free, free])
+        self.assertEquals(second.children, [])
+        self._popNegotiations()
+
+    def testRemoveAndReplaceChildren(self):
+        """removeChildren and replaceChildren hide the removed widgets."""
+        displayer = MockDisplayer()
+        my_container = containerwidget.ContainerWidget()
+        my_container.dispatchDisplayers(displayer)
+        children = [SizeableWidget() for unused in range(4)]
+        for child in children:
+            child._sprite = object()
+        my_container.addChildren(children)
+        self.assertEquals(len(displayer.sprites), 4)
+        my_container.removeChildren(children[:1])
+        self.assertEquals(len(displayer.sprites), 3)
+        self.assertTrue(children[0].getDisplayer() is None)
+        new = SizeableWidget()
+        removed = my_container.replaceChildren([children[3], new, children[1]])
+        self.assertEquals(removed, [children[2]])
+        self.assertEquals(my_container.children,
+                          [children[3], new, children[1]])
+        self.assertTrue(new.getDisplayer() is displayer)
+        self.assertTrue(children[2].parent is None)
+        self.assertEquals(len(displayer.sprites), 2)
+        self.assertEquals(self._popNegotiations(), set([my_container]))
+
 if __name__ == "__main__":
     #import sys;sys.argv = ['', 'Test.testName']
     unittest.main()
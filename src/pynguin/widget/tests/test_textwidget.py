@@ -7,6 +7,7 @@ Created on Jan 9, 2011
 
 import unittest
 from pynguin.widget import textwidget
+from pynguin.sprite import TextBoxSprite
 from pynguin.layout import Size
 from mock import MockTextSprite, MockFont
 
@@ -24,6 +25,10 @@ class TestTextWidget(unittest.TestCase):
         """Just to provide a SPRITE_CLS."""
         SPRITE_CLS = MockTextSprite
 
+    class TextWidgetWithTextBox(textwidget.TextWidget):
+        """A TextWidget drawn by a TextBoxSprite."""
+        SPRITE_CLS = TextBoxSprite
+
     def testInitWithSpriteClass(self):
         """TextWidget.__init__ instantiates sprite of SPRITE_CLS."""
         my_text_widget = self.TextWidgetWithSprite(42, 'Hello')
@@ -39,5 +44,35 @@ class TestTextWidget(unittest.TestCase):
         # its font=10.  Therefore size for "Hello" is 50x10.
         self.assertEquals(my_text_widget.requested_size, Size(50, 10))
 
+    def testSetTextInvalidates(self):
+        """TextWidget.text invalidates the requested size when modified."""
+        my_text_widget = self.TextWidgetWithSprite(MockFont(10), 'Hello')
+        my_text_widget.requestSize(True)
+        my_text_widget.text = 'Hello'
+        self.assertTrue(my_text_widget.is_requested_size_valid)
+        my_text_widget.text = 'Hi'
+        self.assertFalse(my_text_widget.is_requested_size_valid)
+        my_text_widget.refreshRequestedSize()
+        self.assertEquals(my_text_widget.requested_size, Size(20, 10))
+
+    def testTextBoxCaretAtEnd(self):
+        """TextWidget.text keeps the caret of a TextBoxSprite at the end."""
+        my_text_widget = self.TextWidgetWithTextBox(MockFont(10), 'Hello')
+        sprite = my_text_widget._sprite
+        self.assertEquals(sprite.caret, 5)
+        sprite.rect.size = (40, 10)
+        sprite.setMode('edit')
+        sprite.update()
+        my_text_widget.text = 'Hello w'
+        self.assertEquals(sprite.caret, 7)
+        sprite.update()
+        # The end of the text and the cursor, 10 pixels wide, are visible.
+        self.assertEquals(sprite.getCaretX(), 70)
+        self.assertEquals(sprite._scroll, 40)
+        # A caret within the text stays there.
+        sprite.caret = 2
+        my_text_widget.text = 'Hello world'
+        self.assertEquals(sprite.caret, 2)
+
 if __name__ == "__main__":
     unittest.main()
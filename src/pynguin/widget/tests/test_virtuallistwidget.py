@@ -0,0 +1,112 @@
+#! /usr/bin/python
+"""
+Created on Oct 18, 2026
+
+@author: Niriel
+"""
+
+import unittest
+from pynguin.widget import virtuallistwidget
+from pynguin.widget.sizeablewidget import SizeableWidget
+from pynguin.layout.size import Size
+from pynguin.layout.size import SizeAllocation
+from pynguin.scheduler import GetDefaultScheduler
+
+# pylint: disable-msg=R0904
+# Because unit tests have tons of public methods and that's normal.
+
+# pylint: disable-msg=W0212
+# Because I know what I'm doing when I use a protected attribute in a test.
+
+
+class Row(SizeableWidget):
+    """A line of a chat log: 100x20, or 100x30 for every tenth line."""
+    created = 0
+
+    def __init__(self, item):
+        SizeableWidget.__init__(self)
+        self.item = item
+        Row.created += 1
+
+    def _requestSize(self):
+        return Size(100, 30 if self.item % 10 == 0 else 20)
+
+
+class TestVirtualListWidget(unittest.TestCase):
+    """Test the widget.virtuallistwidget module."""
+
+    def setUp(self):
+        Row.created = 0
+        self.log = virtuallistwidget.VirtualListWidget(50000, Row, 20, 2)
+        self.log.requestSize(True)
+        self.log.allocateSize(SizeAllocation((0, 0), (100, 200)))
+
+    def testOnlyVisibleRows(self):
+        """Only the visible rows and the overscan are created."""
+        # Rows 0 to 9 are visible, 30 + 9 * 20 = 210 > 200: row 9 partially.
+        self.assertEquals(len(self.log.children), 12)
+        self.assertEquals(Row.created, 12)
+        self.assertTrue(self.log.getRow(11) is not None)
+        self.assertTrue(self.log.getRow(12) is None)
+
+    def testScrollCostsVisibleRows(self):
+        """Scrolling far away replaces the rows, whatever the list length."""
+        self.log.scrollTo(0, 500000)
+        self.assertTrue(len(self.log.children) <= 16)
+        self.assertTrue(Row.created <= 12 + 16)
+        rows = sorted(self.log.children, key=lambda row: row.item)
+        for row in rows:
+            self.assertTrue(row.allocated_size.top < 200 + 2 * 30)
+            self.assertTrue(row.allocated_size.top + row.allocated_size.height
+                            > -2 * 30)
+
+    def testMeasuredHeights(self):
+        """Rows higher than the estimate make the list higher."""
+        self.assertEquals(self.log.requested_size.height, 50000 * 20)
+        self.log.requestSize(True)
+        self.assertEquals(self.log.requested_size.height, 50000 * 20 + 20)
+        self.assertEquals(self.log.getRow(1).allocated_size.top, 30)
+
+    def testCount(self):
+        """Reducing the number of items forgets the rows that are gone."""
+        self.log.count = 5
+        self.assertEquals(len(self.log.children), 5)
+        self.assertEquals(self.log.count, 5)
+
+    def testTryScrollTo(self):
+        """tryScrollTo stays within the list."""
+        self.log.tryScrollTo(-10, 10 ** 9)
+        self.assertEquals(self.log.visible_pos.x, 0)
+        self.assertEquals(self.log.visible_pos.y,
+                          self.log._layout.index.getTotal() - 200)
+        last = self.log.getRow(49999)
+        self.assertEquals(last.allocated_size.top +
+                          last.allocated_size.height, 200)
+
+    def testAllocationSettles(self):
+        """Allocating creates rows without leaving the tree invalid."""
+        self.assertTrue(self.log.is_requested_size_valid)
+        self.assertTrue(self.log.is_allocation_valid)
+        # Rows 0 and 10 are higher than estimated: the list is negotiated
+        # again at the next frame.
+        scheduler = GetDefaultScheduler()
+        self.assertTrue(self.log in scheduler._to_resize)
+        scheduler.proceedToSizeNegotiation()
+        self.assertEquals(self.log.requested_size.height, 50000 * 20 + 20)
+        # Rows as high as estimated change nothing: no second pass.
+        flat = virtuallistwidget.VirtualListWidget(
+            1000, lambda item: Row(item * 10 + 1), 20, 2)
+        flat.forced_requested_size = Size(100, 200)
+        flat.requestSize(True)
+        flat.allocateSize(SizeAllocation((0, 0), (100, 200)))
+        # The first rows give the list its width.
+        self.assertTrue(flat in scheduler._to_resize)
+        scheduler.proceedToSizeNegotiation()
+        flat.allocateSize(SizeAllocation((0, 0), (100, 300)))
+        self.assertEquals(len(flat.children), 17)
+        self.assertTrue(flat.is_requested_size_valid)
+        self.assertTrue(flat.is_allocation_valid)
+        self.assertFalse(flat in scheduler._to_resize)
+
+if __name__ == "__main__":
+    unittest.main()
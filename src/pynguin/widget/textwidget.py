@@ -32,13 +32,14 @@ class TextWidget(SizeableWidget):
         method forwards the text to the sprite.
 
         If the text that is set is identical to the text of the sprite, then
-        nothing is done.
+        nothing is done.  Otherwise the requested size is invalidated.
 
         """
 
         if text == self.text:
             return
         self._sprite.text = text
+        self.invalidateRequestedSize()
 
     def _getFont(self):
         """Get the font of the sprite."""
@@ -51,13 +52,14 @@ class TextWidget(SizeableWidget):
         method forwards the font to the sprite.
 
         If the font that is set is identical to the font of the sprite, then
-        nothing is done.
+        nothing is done.  Otherwise the requested size is invalidated.
 
         """
 
         if font == self.font:
             return
         self._sprite.font = font
+        self.invalidateRequestedSize()
 
     def _requestSize(self):
         """Return the size needed by the widget to display itself.
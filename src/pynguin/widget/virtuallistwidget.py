@@ -0,0 +1,185 @@
+#! /usr/bin/python
+"""
+Created on Oct 18, 2026
+
+@author: Niriel
+"""
+
+from windowwidget import WindowWidget
+from pynguin.layout.virtualboxlayout import VirtualBoxLayout
+from pynguin.layout.size import FrozenSizeAllocation
+from pynguin.layout.size import Pos
+from pynguin.scheduler import GetDefaultScheduler
+
+__all__ = ['VirtualListWidget']
+
+
+class VirtualListWidget(WindowWidget):
+    """A scrollable list of many items, of which only the visible ones exist.
+
+    The list does not contain its items: it asks a factory to create the
+    widget of an item when that item becomes visible, and forgets it when it
+    is not visible anymore.  Therefore requesting the size, allocating it and
+    drawing costs O(visible rows), whatever the number of items.
+
+    Like a ScrollWidget, the list has a visible_pos attribute and the methods
+    scrollTo and tryScrollTo.  Unlike a ScrollWidget, it never draws its whole
+    content on a big image: its sprite has the size of the viewport, and the
+    rows are placed relative to it.
+
+    The items that have never been visible are given an estimated height.
+    Each row is measured when its widget is created, and its real height
+    replaces the estimate.  The requested size of the list is the size of all
+    the items: give it a forced_requested_size, or put it in a container that
+    allocates it less.
+
+    """
+
+    def __init__(self, count, factory, estimate=20, overscan=2):
+        """Initialize a new VirtualListWidget.
+
+        Parameters.
+        ===========
+
+        * count: the number of items.
+        * factory: a function taking the index of an item and returning a
+          new widget for that item.
+        * estimate: the height of the items that have never been visible.
+        * overscan: number of rows created above and below the visible ones,
+          to make small scrolls cheaper.
+
+        """
+        WindowWidget.__init__(self)
+        self._layout = VirtualBoxLayout(count, estimate)
+        self.factory = factory
+        self.overscan = overscan
+        self.visible_pos = Pos(0, 0)
+        self._rows = {}
+
+    def _getCount(self):
+        """Return the number of items."""
+        return len(self._layout.index)
+
+    def _setCount(self, count):
+        """Change the number of items, and forget the rows that are gone."""
+        for item in [item for item in self._rows if item >= count]:
+            self._removeRow(item)
+        self._layout.setCount(count)
+        self.invalidateRequestedSize()
+
+    count = property(_getCount, _setCount, None, "Number of items.")
+
+    def getRow(self, item):
+        """Return the widget of the item, or None if it is not visible."""
+        return self._rows.get(item)
+
+    def getVisibleRange(self):
+        """Return (first, end): the items to create, overscan included."""
+        if not self.allocated_size:
+            return 0, 0
+        top = self.visible_pos.y
+        first, end = self._layout.getRange(top,
+                                           top + self.allocated_size.height)
+        if first == end:
+            return 0, 0
+        return (max(0, first - self.overscan),
+                min(self.count, end + self.overscan))
+
+    def _addRow(self, item):
+        """Create, measure and display the widget of item.
+
+        Return True when the row changed the requested size of the list.
+
+        """
+        row = self.factory(item)
+        self._rows[item] = row
+        self._layout.attach(row, item)
+        # Measured before adoption, so that nothing is invalidated above.
+        row.requestSize(True)
+        self._adoptChild(row, 'end')
+        row.dispatchDisplayers(self)
+        width = self._layout.width
+        return self._layout.measure(row) or self._layout.width != width
+
+    def _removeRow(self, item):
+        """Forget the widget of item."""
+        row = self._rows.pop(item)
+        row.dispatchDisplayers(None)
+        self._disownChild(row)
+        self._layout.detach(row)
+
+    def updateRows(self):
+        """Create the rows that became visible, forget those that did not.
+
+        The rows are added and removed without invalidating the requested
+        size of the list: the rows only replace the estimated items.  Return
+        True when the measured sizes of the new rows changed the requested
+        size of the list, which must then be negotiated again.
+
+        """
+        first, end = self.getVisibleRange()
+        rows = self._rows
+        for item in [item for item in rows if not first <= item < end]:
+            self._removeRow(item)
+        changed = False
+        for item in xrange(first, end):
+            if item not in rows:
+                changed = self._addRow(item) or changed
+        return changed
+
+    def _allocateRows(self):
+        """Place the rows relative to the viewport."""
+        visible_pos = self.visible_pos
+        size = self.allocated_size
+        self._layout.allocateSize(
+            FrozenSizeAllocation((-visible_pos.x, -visible_pos.y),
+                                 (size.width, size.height)),
+            self.requested_size, self.children)
+
+    def _allocateSize(self):
+        """Create the visible rows and give them their size.
+
+        When the new rows are not as high as estimated, the size of the list
+        is negotiated again at the next frame, like in scrollTo.
+
+        """
+        pos, size = self.allocated_size.asDeepTuple()
+        self._sprite.rect.topleft = pos
+        self._sprite.rect.size = size
+        if self.updateRows():
+            GetDefaultScheduler().askForSizeNegotiation(self)
+        self._allocateRows()
+
+    def scrollTo(self, left, top):
+        """Show the part of the list starting at (left, top).
+
+        Only the rows entering and leaving the viewport are created and
+        forgotten, and only the visible rows are allocated again.  The list is
+        redrawn at the next frame, and its size renegotiated if the new rows
+        are not as high as estimated.
+
+        """
+        if left == self.visible_pos.x and top == self.visible_pos.y:
+            return
+        self.visible_pos = Pos(left, top)
+        if self.allocated_size:
+            scheduler = GetDefaultScheduler()
+            if self.updateRows():
+                scheduler.askForSizeNegotiation(self)
+            self._allocateRows()
+            scheduler.askForRedrawing(self)
+
+    def _clampScroll(self, left, top):
+        """Return the closest position to (left, top) within the list."""
+        size = self.allocated_size
+        max_x = max(0, self._layout.width - size.width)
+        max_y = max(0, self._layout.index.getTotal() - size.height)
+        return max(0, min(left, max_x)), max(0, min(top, max_y))
+
+    def tryScrollTo(self, left, top):
+        """Scroll to (left, top), but stay within the list."""
+        self.scrollTo(*self._clampScroll(left, top))
+        # The rows that just appeared may not be as high as estimated.
+        clamped = self._clampScroll(left, top)
+        if clamped != self.visible_pos.asTuple():
+            self.scrollTo(*clamped)
@@ -6,6 +6,7 @@ Created on Nov 30, 2010
 """
 
 import weakref
+from pynguin.layout.parentable import Parentable
 
 __all__ = ['Widget']
 
@@ -30,7 +31,10 @@ class Widget(object):
         self._sprite = self.SPRITE_CLS() if self.SPRITE_CLS else None
         # pylint: enable-msg=E1102
         self._displayer = None
+        self._root_altitude = -1
+        # Cache of the altitude, valid while the trees keep this version.
         self._altitude = -1
+        self._altitude_version = None
 
     def getDisplayer(self):
         """Retreives the widget responsible for displaying this widget."""
@@ -94,12 +98,49 @@ class Widget(object):
         """
         self.setDisplayer(displayer)
 
+    def draw(self):
+        """Redraw the sprite of the widget, if any."""
+        if self._sprite:
+            self._sprite.update()
+
     def _getAltitude(self):
-        """Return the altitude of the widget."""
-        return self._altitude
-    
+        """Return the altitude of the widget.
+
+        The altitude of a widget having a parent is the altitude of its parent
+        plus one.  It is computed when asked for, and cached until a widget
+        changes of parent somewhere (see Parentable.tree_version).  Only the
+        ancestors whose cache is stale are visited, so moving a big subtree
+        costs nothing until the altitudes are needed again.
+
+        """
+        version = Parentable.tree_version
+        if self._altitude_version == version:
+            return self._altitude
+        # Walk up to the root or to the first ancestor with a valid cache.
+        path = [self]
+        parent = getattr(self, 'parent', None)
+        while parent is not None and parent._altitude_version != version:
+            path.append(parent)
+            parent = getattr(parent, 'parent', None)
+        if parent is None:
+            altitude = path[-1]._root_altitude - 1
+        else:
+            altitude = parent._altitude
+        for widget in reversed(path):
+            altitude += 1
+            widget._altitude = altitude
+            widget._altitude_version = version
+        return altitude
+
     def _setAltitude(self, value):
-        """Set the altitude of the widget."""
-        self._altitude = value
-    
+        """Set the altitude of the widget when it has no parent.
+
+        It is the altitude of the root of a tree: its descendants are one level
+        higher per generation.  A widget having a parent ignores this value.
+
+        """
+        self._root_altitude = value
+        # The altitudes cached in the tree of this widget are now stale.
+        Parentable.tree_version += 1
+
     altitude = property(_getAltitude, _setAltitude, None, "Altitude")
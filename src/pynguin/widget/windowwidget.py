@@ -16,6 +16,10 @@ class WindowWidget(ContainerWidget):
     SPRITE_CLS = WindowSprite
     LAYOUT_CLS = WindowLayout
 
+    def _getChildrenDisplayer(self, displayer):
+        """Return self: windows display their children."""
+        return self
+
     def dispatchDisplayers(self, displayer):
         """Recursively set the displayers of the widget tree.
 
@@ -28,6 +32,19 @@ class WindowWidget(ContainerWidget):
         for child in self.children:
             child.dispatchDisplayers(self)
 
+    def draw(self):
+        """Redraw the areas of the window damaged by its sprites.
+
+        The scheduler redraws the modified widgets before their window: the
+        window only redraws what changed (see WindowSprite.refresh).
+
+        """
+        self._sprite.refresh()
+
     def addSprite(self, sprite, layer):
         """Add the given sprite to window sprite."""
         self._sprite.addSprite(sprite, layer)
+
+    def removeSprite(self, sprite):
+        """Remove the given sprite from the window sprite."""
+        self._sprite.removeSprite(sprite)